@@ -0,0 +1,103 @@
+"""Benchmarks of the process methods of all blocks."""
+from mca import blocks
+from mca.framework import PlotBlock, block_io, data_types, io_registry
+
+from benchmarks import common
+
+# Blocks depending on files or audio devices are not benchmarked
+excluded_tags = {"Audio", "Loading", "Saving"}
+# Blocks whose runtime grows quadratically with the amount of values
+quadratic_blocks = {"AutoCorrelation", "CrossCorrelation", "Convolution"}
+
+kernel_blocks = {block_class.__name__: block_class
+                 for block_class in blocks.block_classes
+                 if not excluded_tags.intersection(block_class.tags)
+                 and not issubclass(block_class, PlotBlock)}
+plot_blocks = {block_class.__name__: block_class
+               for block_class in blocks.block_classes
+               if issubclass(block_class, PlotBlock)}
+
+
+def setup_block(block_class, values):
+    """Creates a block which processes signals with the given amount of
+    values.
+    """
+    io_registry.Registry.clear()
+    block = block_class()
+    if "abscissa" in block.parameters:
+        block.parameters["abscissa"].parameters["values"].value = values
+    common.connect_inputs(block, common.test_signal(values))
+    return block
+
+
+class BlockKernels:
+    """Runtime and peak memory of the process method of every
+    non-plotting block.
+    """
+    params = (sorted(kernel_blocks), [10 ** 3, 10 ** 5, 10 ** 7, 10 ** 8])
+    param_names = ["block", "values"]
+    timeout = 600
+
+    def setup(self, block_name, values):
+        if block_name in quadratic_blocks and values > 10 ** 5:
+            raise NotImplementedError
+        self.block = setup_block(kernel_blocks[block_name], values)
+
+    def teardown(self, block_name, values):
+        io_registry.Registry.clear()
+
+    def time_process(self, block_name, values):
+        self.block.process()
+
+    def peakmem_process(self, block_name, values):
+        self.block.process()
+
+
+class PlotRendering:
+    """Runtime of the headless rendering of every plot block."""
+    params = (sorted(plot_blocks), [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
+    param_names = ["block", "values"]
+    timeout = 600
+
+    def setup(self, block_name, values):
+        self.app = common.qt_application()
+        self.block = setup_block(plot_blocks[block_name], values)
+
+    def teardown(self, block_name, values):
+        io_registry.Registry.clear()
+
+    def time_compute(self, block_name, values):
+        self.block.compute()
+
+    def time_render(self, block_name, values):
+        self.block.render()
+
+
+class MultiInputKernels:
+    """Runtime and peak memory of blocks combining many shifted input
+    signals.
+    """
+    params = (["Adder", "Multiplier"], [2, 16], [10 ** 5, 10 ** 7])
+    param_names = ["block", "inputs", "values"]
+    timeout = 600
+
+    def setup(self, block_name, inputs, values):
+        io_registry.Registry.clear()
+        self.block = kernel_blocks[block_name]()
+        while len(self.block.inputs) < inputs:
+            self.block.add_input(block_io.Input(self.block))
+        signal = common.test_signal(values)
+        for index, input_ in enumerate(self.block.inputs):
+            source = common.SourceBlock(data_types.Signal(
+                abscissa_start=index * signal.increment, values=values,
+                increment=signal.increment, ordinate=signal.ordinate))
+            input_.connect(source.outputs[0])
+
+    def teardown(self, block_name, inputs, values):
+        io_registry.Registry.clear()
+
+    def time_process(self, block_name, inputs, values):
+        self.block.process()
+
+    def peakmem_process(self, block_name, inputs, values):
+        self.block.process()
@@ -0,0 +1,20 @@
+"""Benchmarks of assigning parameter values."""
+from mca.framework import util
+
+
+class AbscissaAssignment:
+    """Assigning the values of an abscissa parameter block one by one and
+    in bulk.
+    """
+    values = {"start": -1., "values": 2000, "increment": 0.005,
+              "sampling": 200., "measure_time": 10.}
+
+    def setup(self):
+        self.abscissa = util.create_abscissa_parameter_block()
+
+    def time_set_value(self):
+        for key, value in self.values.items():
+            self.abscissa.parameters[key].value = value
+
+    def time_set_values(self):
+        self.abscissa.set_values(self.values)
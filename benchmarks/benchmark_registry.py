@@ -0,0 +1,69 @@
+"""Benchmarks of the graph operations of the IORegistry."""
+import tracemalloc
+
+from mca.framework import io_registry
+
+from benchmarks import common
+
+
+class GraphOperations:
+    """Connecting, disconnecting and updating chains, fans and diamonds of
+    lightweight blocks.
+    """
+    params = (["chain", "fan", "diamond"], [10, 100, 1000])
+    param_names = ["structure", "blocks"]
+    number = 1
+    repeat = 5
+    timeout = 600
+
+    def setup(self, structure, blocks):
+        self.source, self.connections = common.build_structure(structure,
+                                                               blocks)
+
+    def teardown(self, structure, blocks):
+        io_registry.Registry.clear()
+
+    def connect(self):
+        for output, input_ in self.connections:
+            io_registry.Registry.connect(output, input_)
+
+    def time_connect(self, structure, blocks):
+        self.connect()
+
+    def time_connect_batch(self, structure, blocks):
+        with io_registry.Registry.batch():
+            self.connect()
+
+    def time_disconnect(self, structure, blocks):
+        self.connect()
+        for output, input_ in self.connections:
+            io_registry.Registry.disconnect_input(input_)
+
+    def time_invalidate_and_update(self, structure, blocks):
+        self.connect()
+        io_registry.Registry.invalidate_and_update(self.source)
+
+
+class StructureFootprint:
+    """Memory allocated by the blocks, Inputs, Outputs and parameters of
+    connected structures.
+    """
+    params = (["chain", "fan", "diamond"], [100, 1000])
+    param_names = ["structure", "blocks"]
+    unit = "bytes"
+    timeout = 600
+
+    def teardown(self, structure, blocks):
+        io_registry.Registry.clear()
+
+    def track_memory(self, structure, blocks):
+        tracemalloc.start()
+        try:
+            source, connections = common.build_structure(structure, blocks)
+            with io_registry.Registry.batch():
+                for output, input_ in connections:
+                    io_registry.Registry.connect(output, input_)
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        return size
@@ -0,0 +1,49 @@
+"""Benchmarks of saving and loading large block structures."""
+import os
+import tempfile
+
+from mca import blocks
+from mca.framework import io_registry, load, save
+
+
+def build_structure(size):
+    """Builds a structure of generators each followed by a chain of
+    processing blocks.
+    """
+    io_registry.Registry.clear()
+    with io_registry.Registry.batch():
+        previous = None
+        for index in range(size):
+            if index % 10 == 0:
+                previous = blocks.SignalGeneratorPeriodic(
+                    abscissa={"values": 1000})
+                continue
+            block = blocks.Amplifier()
+            block.inputs[0].connect(previous.outputs[0])
+            previous = block
+
+
+class SaveLoad:
+    """Saving and loading structures of up to 1000 blocks."""
+    params = [10, 100, 1000]
+    param_names = ["blocks"]
+    number = 1
+    repeat = 5
+    timeout = 600
+
+    def setup(self, size):
+        build_structure(size)
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "structure.json")
+        save.save_block_structure(self.file_path)
+
+    def teardown(self, size):
+        io_registry.Registry.clear()
+        self.directory.cleanup()
+
+    def time_save(self, size):
+        save.save_block_structure(self.file_path)
+
+    def time_load(self, size):
+        io_registry.Registry.clear()
+        load.load_block_structure(self.file_path)
@@ -0,0 +1,131 @@
+"""Helpers shared by the benchmarks."""
+import os
+import sys
+
+import numpy as np
+
+from mca.framework import Block, DynamicBlock, block_io, data_types, \
+    io_registry
+
+
+def qt_application():
+    """Returns the QApplication instance required by plot blocks. Creates a
+    headless instance if none exists yet.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6 import QtWidgets
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv[:1])
+    return app
+
+
+def test_signal(values):
+    """Returns a strictly positive test signal with the given amount of
+    values.
+    """
+    abscissa = np.arange(values) * 0.01
+    return data_types.Signal(abscissa_start=0, values=values,
+                             increment=0.01,
+                             ordinate=2 + np.sin(2 * np.pi * abscissa))
+
+
+class SourceBlock(Block):
+    """Block which provides fixed data on its Output."""
+    name = "SourceBlock"
+
+    def __init__(self, data=None):
+        super().__init__()
+        self.outputs[0].data = data
+
+    def setup_io(self):
+        self.new_output()
+
+    def setup_parameters(self):
+        pass
+
+    def process(self):
+        pass
+
+
+class PassBlock(Block):
+    """Block which passes the data of its Input to its Output."""
+    name = "PassBlock"
+
+    def setup_io(self):
+        self.new_input()
+        self.new_output()
+
+    def setup_parameters(self):
+        pass
+
+    def process(self):
+        self.outputs[0].data = self.inputs[0].data
+
+
+class MergeBlock(DynamicBlock):
+    """Block with an arbitrary amount of Inputs which counts the Inputs
+    containing data.
+    """
+    name = "MergeBlock"
+
+    def setup_io(self):
+        self.dynamic_input = (1, None)
+        self.new_input()
+        self.new_output()
+
+    def setup_parameters(self):
+        pass
+
+    def process(self):
+        self.outputs[0].data = sum(input_.data is not None
+                                   for input_ in self.inputs)
+
+
+def connect_inputs(block, data):
+    """Connects every Input of the block to its own :class:`SourceBlock`
+    holding the given data.
+
+    Returns:
+        list: The created source blocks.
+    """
+    sources = []
+    for input_ in block.inputs:
+        source = SourceBlock(data)
+        input_.connect(source.outputs[0])
+        sources.append(source)
+    return sources
+
+
+def build_structure(kind, size):
+    """Builds an unconnected structure of lightweight blocks.
+
+    Args:
+        kind (str): "chain", "fan" or "diamond".
+        size (int): Amount of blocks between the source and the sink.
+
+    Returns:
+        tuple: (source block, list of connections as (output, input)).
+    """
+    io_registry.Registry.clear()
+    source = SourceBlock(1)
+    connections = []
+    if kind == "chain":
+        previous = source
+        for _ in range(size):
+            block = PassBlock()
+            connections.append((previous.outputs[0], block.inputs[0]))
+            previous = block
+    elif kind == "fan":
+        for _ in range(size):
+            block = PassBlock()
+            connections.append((source.outputs[0], block.inputs[0]))
+    elif kind == "diamond":
+        sink = MergeBlock()
+        for index in range(size):
+            block = PassBlock()
+            connections.append((source.outputs[0], block.inputs[0]))
+            if index:
+                sink.add_input(block_io.Input(sink))
+            connections.append((block.outputs[0], sink.inputs[index]))
+    return source, connections
@@ -10,6 +10,7 @@ from .audio_loader import AudioLoader
 from .audio_player import AudioPlayer
 from .audio_recorder import AudioRecorder
 from .audio_saver import AudioSaver
+from .batch_loader import BatchLoader
 from .ccf import CrossCorrelation
 from .chirp import Chirp
 from .complex_plot import ComplexPlot
@@ -41,7 +41,7 @@ class AutoCorrelation(Block):
             ordinate=ordinate,
         )
         # Calculate units for abscissa and ordinate
-        unit_o = self.inputs[0].metadata.unit_o ** 2
+        unit_o = data_types.power_unit(self.inputs[0].metadata.unit_o, 2)
         unit_a = self.inputs[0].metadata.unit_a
         # Apply new metadata to the output
         self.outputs[0].process_metadata = data_types.MetaData(
@@ -1,8 +1,6 @@
-import copy
-
 import numpy as np
 
-from mca.framework import DynamicBlock, data_types, util
+from mca.framework import DynamicBlock, util
 
 
 class Adder(DynamicBlock):
@@ -26,18 +24,8 @@ class Adder(DynamicBlock):
     @util.validate_intervals
     def process(self):
         # Read the input data
-        signals = [copy.copy(i.data) for i in self.inputs if i.data]
-        # Fill the signals with zeros so their lengths match
-        modified_signals = util.fill_zeros(signals)
-        # Calculate the ordinate
-        ordinate = np.zeros(modified_signals[0].values)
-        for sgn in modified_signals:
-            ordinate += sgn.ordinate
-        # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
-            abscissa_start=modified_signals[0].abscissa_start,
-            values=modified_signals[0].values,
-            increment=modified_signals[0].increment,
-            ordinate=ordinate)
+        signals = [i.data for i in self.inputs if i.data]
+        # Add the signals, missing values are treated as zeros
+        self.outputs[0].data = util.combine_signals(signals, np.add)
         # Apply metadata from the input to the output
         self.outputs[0].process_metadata = self.inputs[0].metadata
@@ -2,7 +2,7 @@ import numpy as np
 import sounddevice as sd
 from united import Unit
 
-from mca.framework import Block, parameters, util, validator
+from mca.framework import Block, generators, parameters, util, validator
 from mca import exceptions
 
 
@@ -10,13 +10,23 @@ class AudioPlayer(Block):
     """Plays the input signals as a sound by using the current default
     sound device. If only one input is connected, then the sound will be played
     using 1 channel (mono) and if both inputs are connected then
-    the 2 channels will be used (stereo).
+    the 2 channels will be used (stereo). The signals are streamed to the
+    sound device chunk by chunk without copying them.
+
+    Attributes:
+        playback: :class:`SignalPlayback` of the currently or last played
+                  sound. None if no sound has been played yet.
     """
     name = "Audio Player"
     description = ("Plays the input signal as a sound by using the current "
                    "default sound device.")
     tags = ("Audio",)
 
+    def __init__(self, **kwargs):
+        """Initializes AudioPlayer class."""
+        super().__init__(**kwargs)
+        self.playback = None
+
     def setup_io(self):
         self.new_input()
         self.new_input()
@@ -32,6 +42,10 @@ class AudioPlayer(Block):
             name="Play sound", function=self.play_sound,
             display_options=("block_button", "edit_window")
         )
+        self.parameters["stop_sound"] = parameters.ActionParameter(
+            name="Stop sound", function=self.stop_sound,
+            display_options=("block_button", "edit_window")
+        )
         self.parameters["auto_play"] = parameters.BoolParameter(
             name="Auto play", default=False)
 
@@ -40,22 +54,25 @@ class AudioPlayer(Block):
             description="Normalize the input signal to have a maximum of "
                         "value of 1")
 
+    @property
+    def observed(self):
+        return self.parameters["auto_play"].value
+
     def process(self):
         if self.parameters["auto_play"].value is True:
             self.play_sound()
 
-    @util.abort_all_inputs_empty
-    @util.validate_type_signal
     def play_sound(self):
         """Plays a sound through the current default sound device."""
-        # Read the input data
-        if self.inputs[0].data and not self.inputs[1].data:
-            data = self.inputs[0].data.ordinate
-        elif not self.inputs[0].data and self.inputs[1].data:
-            data = self.inputs[1].data.ordinate
-        else:
-            data = np.hstack((self.inputs[0].data.ordinate,
-                              self.inputs[1].data.ordinate))
+        self.pull_inputs()
+        self._play_sound()
+
+    @util.abort_all_inputs_empty
+    @util.validate_type_signal
+    def _play_sound(self):
+        # Read the input data, one ordinate per channel
+        ordinates = [input_.data.ordinate for input_ in self.inputs
+                     if input_.data]
         # Validate the units of the input signal
         for input_ in self.inputs:
             if input_.metadata:
@@ -65,8 +82,12 @@ class AudioPlayer(Block):
         manual_sampling = self.parameters["manual_sampl_freq"].value
         manual_sampling_frequency = self.parameters["sampling_freq"].value
         normalize = self.parameters["normalize"].value
+        # Scale by the precomputed peak instead of copying the data
+        scale = 1
         if normalize:
-            data = data / np.max(abs(data))
+            peak = max(peak_value(ordinate) for ordinate in ordinates)
+            if peak:
+                scale = 1 / peak
         if manual_sampling:
             sampling_frequency = manual_sampling_frequency
         else:
@@ -81,5 +102,96 @@ class AudioPlayer(Block):
                 sampling_frequency = 1/self.inputs[0].data.increment
             elif self.inputs[1].data:
                 sampling_frequency = 1 / self.inputs[1].data.increment
-        # Play the input signal as sound through the default sound device
-        sd.play(data, sampling_frequency)
+        # Stream the input signal through the default sound device
+        self.stop_sound()
+        self.playback = SignalPlayback(ordinates, sampling_frequency, scale)
+        self.playback.start()
+
+    def stop_sound(self):
+        """Stops the currently played sound."""
+        if self.playback is not None:
+            self.playback.stop()
+
+
+class SignalPlayback:
+    """Streams ordinates as channels to a sound device. The ordinates are
+    read chunk by chunk when the sound device requests new frames, so they
+    can also be memory-mapped arrays. Shorter ordinates are continued with
+    silence.
+
+    Attributes:
+        ordinates (list): One ordinate per channel.
+        sampling_frequency (float): Sampling frequency in Hz.
+        scale (float): Factor applied to every value.
+        position (int): Index of the next frame to play.
+        stream: Stream of the sound device. None if the playback has not
+                been started.
+    """
+    def __init__(self, ordinates, sampling_frequency, scale=1,
+                 stream_class=None):
+        """Initializes SignalPlayback.
+
+        Args:
+            ordinates (list): One ordinate per channel.
+            sampling_frequency (float): Sampling frequency in Hz.
+            scale (float): Factor applied to every value.
+            stream_class: Class of the output stream. Uses
+                          :class:`sounddevice.OutputStream` by default.
+        """
+        self.ordinates = ordinates
+        self.sampling_frequency = sampling_frequency
+        self.scale = scale
+        self.position = 0
+        self.frames = max(len(ordinate) for ordinate in ordinates)
+        self._stream_class = stream_class or sd.OutputStream
+        self.stream = None
+
+    def start(self):
+        """Opens the output stream and starts playing from the current
+        position.
+        """
+        self.stream = self._stream_class(
+            samplerate=self.sampling_frequency,
+            channels=len(self.ordinates), dtype="float32",
+            blocksize=0, callback=self.callback)
+        self.stream.start()
+
+    def stop(self):
+        """Stops playing and closes the output stream."""
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+    def seek(self, time):
+        """Continues playing at the given time.
+
+        Args:
+            time (float): Time in seconds from the start of the ordinates.
+        """
+        self.position = int(np.clip(round(time * self.sampling_frequency),
+                                    0, self.frames))
+
+    def callback(self, outdata, frames, time, status):
+        """Fills the buffer of the sound device with the next frames.
+        Called by the output stream.
+        """
+        position = self.position
+        for channel, ordinate in enumerate(self.ordinates):
+            chunk = ordinate[position:position + frames]
+            np.multiply(chunk, self.scale, out=outdata[:len(chunk), channel])
+            outdata[len(chunk):, channel] = 0
+        self.position = position + frames
+        if self.position >= self.frames:
+            raise sd.CallbackStop
+
+
+def peak_value(ordinate):
+    """Returns the maximum absolute value of the ordinate. Computed chunk by
+    chunk to avoid a temporary array of the size of the ordinate.
+    """
+    peak = 0
+    for index in range(0, len(ordinate), generators.CHUNK_SIZE):
+        chunk = ordinate[index:index + generators.CHUNK_SIZE]
+        peak = max(peak, np.max(np.abs(chunk)))
+    return peak
@@ -1,23 +1,34 @@
-import scipy.io.wavfile
 from united import Unit
 
 from mca import exceptions
-from mca.framework import Block, parameters, validator
+from mca.framework import DynamicBlock, batch, parameters, validator, wav
 
 
-class AudioSaver(Block):
-    """Saves the input signal as a .wav sound file."""
+class AudioSaver(DynamicBlock):
+    """Saves the input signals as the channels of a .wav sound file. The file
+    is written chunk by chunk in the chosen sample format.
+    """
     name = "Audio Saver"
-    description = "Saves the input signal as a .wav sound file."
+    description = ("Saves the input signals as the channels of a .wav sound "
+                   "file. Integer formats expect values between -1 and 1.")
     tags = ("Saving", "Audio")
-    references = {"scipy.io.wavfile.write":
-        "https://docs.scipy.org/doc/scipy/reference/generated/scipy.io.wavfile.write.html"}
 
     def setup_parameters(self):
         self.parameters["sampling_freq"] = parameters.IntParameter(
             name="Sampling frequency", min_=1, max_=None, unit="Hz",
             default=44100
         )
+        self.parameters["sample_format"] = parameters.ChoiceParameter(
+            name="Sample format",
+            choices=(("int16", "16 bit integer"), ("int24", "24 bit integer"),
+                     ("float32", "32 bit float")),
+            default="float32"
+        )
+        self.parameters["dither"] = parameters.BoolParameter(
+            name="Dither", default=False,
+            description="Add triangular dither before rounding to an "
+                        "integer format"
+        )
         self.parameters["file_name"] = parameters.PathParameter(
             name="Filename", file_formats=[".wav"]
         )
@@ -25,29 +36,49 @@ class AudioSaver(Block):
             name="Save as .wav", function=self.save_as_wav)
 
     def setup_io(self):
+        self.dynamic_input = (1, None)
         self.new_input()
 
     def process(self):
         pass
 
     def save_as_wav(self):
-        """Saves the input signal as a .wav file."""
+        """Saves the input signals as a .wav file."""
+        self.write_file(self.parameters["file_name"].value)
+
+    def save_batch_result(self, name):
+        """Saves the input signals of a batch item next to the file of the
+        file name parameter. The name of the item is appended to the file
+        name.
+        """
+        self.write_file(batch.result_path(self.parameters["file_name"].value,
+                                          name))
+
+    def write_file(self, filename):
+        """Saves the input signals as the channels of the given file.
+
+        Args:
+            filename (str): Path of the .wav file.
+        """
+        self.pull_inputs()
         # Raise error when the input has no data to save
         if self.all_inputs_empty():
             raise exceptions.DataSavingError("No data to save.")
-        # Read the input data
-        input_signal = self.inputs[0].data
-        # Validate that the input data is of type signal
-        validator.check_type_signal(input_signal)
-        # Validate that the abscissa is in seconds
-        validator.check_same_units([self.inputs[0].metadata.unit_a,
-                                    Unit(["s"])])
+        inputs = [input_ for input_ in self.inputs if input_.data]
+        for input_ in inputs:
+            # Validate that the input data is of type signal
+            validator.check_type_signal(input_.data)
+            # Validate that the abscissa is in seconds
+            validator.check_same_units([input_.metadata.unit_a,
+                                        Unit(["s"])])
         # Read parameters values
         sampling_frequency = self.parameters["sampling_freq"].value
-        filename = self.parameters["file_name"].value
+        sample_format = self.parameters["sample_format"].value
+        dither = self.parameters["dither"].value
         # Verify that the file ends with .wav
         if not filename.endswith(".wav"):
             raise exceptions.DataSavingError("File has to be a .wav.")
-        # Write the file
-        scipy.io.wavfile.write(filename, sampling_frequency,
-                               input_signal.ordinate)
+        # Write the file, one channel per input
+        wav.write_wav(filename, sampling_frequency,
+                      [input_.data.ordinate for input_ in inputs],
+                      sample_format=sample_format, dither=dither)
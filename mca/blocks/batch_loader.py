@@ -0,0 +1,58 @@
+from mca import exceptions
+from mca.framework import Block, batch, io_registry, parameters
+
+
+class BatchLoader(Block):
+    """Loads all signal files matching a pattern one after another. Every
+    file is passed through the connected blocks and blocks saving data save
+    the result of every file with the path of the file relative to the
+    common directory of all files appended to their file name. Files are
+    loaded in background threads while the previous file is processed.
+    """
+    name = "Batch Loader"
+    description = ("Loads all .mcas, .npz, .mat, .hdf5 or .wav files "
+                   "matching a pattern one after another and saves the "
+                   "results of every file.")
+    tags = ("Generating", "Loading")
+
+    def setup_io(self):
+        self.new_output()
+
+    def setup_parameters(self):
+        self.parameters["pattern"] = parameters.StrParameter(
+            name="File pattern", max_length=255, default="",
+            description="Glob pattern of the files, \"**\" matches any "
+                        "subdirectory"
+        )
+        self.parameters["workers"] = parameters.IntParameter(
+            name="Loading threads", min_=1, max_=None, default=4
+        )
+        self.parameters["run_batch"] = parameters.ActionParameter(
+            name="Run batch", function=self.run_batch,
+            display_options=("edit_window", "block_button")
+        )
+
+    def process(self):
+        pass
+
+    def run_batch(self):
+        """Loads all files matching the pattern and saves the results of
+        the connected blocks for each file.
+
+        Raises:
+            :class:`~mca.exceptions.DataLoadingError`: If no file matches the
+                                                        pattern.
+        """
+        file_paths = batch.find_files(self.parameters["pattern"].value)
+        if not file_paths:
+            raise exceptions.DataLoadingError("No files match the pattern.")
+        workers = self.parameters["workers"].value
+        names = dict(zip(file_paths, batch.item_names(file_paths)))
+        for file_path, (signal, metadata) in batch.prefetch(file_paths,
+                                                            workers):
+            self.outputs[0].data = signal
+            self.outputs[0].process_metadata = metadata
+            self.trigger_update()
+            name = names[file_path]
+            for block in io_registry.Registry.get_descendant_blocks(self):
+                block.save_batch_result(name)
@@ -45,8 +45,9 @@ class CrossCorrelation(Block):
             ordinate=ccf,
         )
         # Calculate units for abscissa and ordinate
-        unit_o = self.inputs[0].metadata.unit_o * self.inputs[1].metadata.unit_o
-        unit_a = 1 / self.inputs[0].metadata.unit_a
+        unit_o = data_types.multiply_units(self.inputs[0].metadata.unit_o,
+                                            self.inputs[1].metadata.unit_o)
+        unit_a = data_types.divide_units(1, self.inputs[0].metadata.unit_a)
         # Apply new metadata to the output
         self.outputs[0].process_metadata = data_types.MetaData(
             name=None, unit_a=unit_a,unit_o=unit_o
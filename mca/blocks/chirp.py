@@ -1,7 +1,4 @@
-import numpy as np
-from scipy import signal as sgn
-
-from mca.framework import Block, data_types, parameters, util
+from mca.framework import Block, data_types, generators, parameters, util
 
 
 class Chirp(Block):
@@ -53,16 +50,13 @@ class Chirp(Block):
         increment = self.parameters["abscissa"].parameters["increment"].value
         phase = self.parameters["phase"].value
         sweep_kind = self.parameters["sweep_kind"].value
-        # Create the abscissa vector
-        abscissa = (
-            np.linspace(
-                abscissa_start, abscissa_start + (values - 1) * increment,
-                values
-            )
-        )
-        # Calculate the ordinate
-        chirp = amp * sgn.chirp(t=abscissa, f0=freq1, t1=abscissa[-1], f1=freq2,
-                                phi=phase, method=sweep_kind)
+        # Generate the chirp in chunks, the end frequency is reached at the
+        # last value of the abscissa
+        abscissa_end = abscissa_start + (values - 1) * increment
+        chirp = generators.generate(
+            generators.chirp_kernel(amp, freq1, freq2, abscissa_end, phase,
+                                    sweep_kind),
+            abscissa_start, values, increment)
         # Apply new signal to the output
         self.outputs[0].data = data_types.Signal(
             abscissa_start,
@@ -2,13 +2,15 @@ import copy
 
 import numpy as np
 
-from mca.framework import DynamicBlock, PlotBlock, data_types, parameters, \
-    util, validator
+from mca.framework import DynamicBlock, PlotBlock, data_types, generators, \
+    parameters, util, validator
 
 
-class ComplexPlot(DynamicBlock, PlotBlock):
+class ComplexPlot(PlotBlock, DynamicBlock):
     """Plots absolute and phase or real and imaginary part of the input
-    signal.
+    signal. The decomposition of every input signal is cached while the
+    signal does not change. Long signals are decimated to the width of the
+    axes before drawing.
 
     Attributes:
         first_axis: Reference of the axes for the real part of the input signal.
@@ -24,9 +26,17 @@ class ComplexPlot(DynamicBlock, PlotBlock):
     def __init__(self, **kwargs):
         """Initializes ComplexPlot class."""
         super().__init__(rows=2, cols=1, **kwargs)
-        self.first_axis = self.axes[0]
-        self.second_axis = self.axes[1]
         self.legend = None
+        self._decompositions = {}
+        self._decimation_cache = None
+
+    @property
+    def first_axis(self):
+        return self.axes[0]
+
+    @property
+    def second_axis(self):
+        return self.axes[1]
 
     def setup_parameters(self):
         self.parameters["plot_type"] = parameters.ChoiceParameter(
@@ -77,19 +87,16 @@ class ComplexPlot(DynamicBlock, PlotBlock):
         self.dynamic_input = [1, None]
         self.new_input()
 
-    def process(self):
-        # Clear the axes and the legend
-        self.first_axis.cla()
-        self.second_axis.cla()
-        if self.legend:
-            self.legend.remove()
+    def compute(self):
+        # Release the lines of the previous data
+        self._decimation_cache = None
         # Validate the input data of type signal
         for i in self.inputs:
             validator.check_type_signal(i.data)
         # Read the input data
-        signals = [copy.copy(i.data) for i in self.inputs if i.data]#
+        signals = [i.data for i in self.inputs if i.data]
         # Read the input metadata
-        metadatas = [copy.copy(i.metadata) for i in self.inputs if i.metadata]
+        metadatas = [i.metadata for i in self.inputs if i.metadata]
         # Read the input metadata units
         abscissa_units = [metadata.unit_a for metadata in metadatas]
         ordinate_units = [metadata.unit_o for metadata in metadatas]
@@ -98,6 +105,59 @@ class ComplexPlot(DynamicBlock, PlotBlock):
         validator.check_same_units(ordinate_units)
         # Read the parameters values
         plot_type = self.parameters["plot_type"].value
+        lines = []
+        decompositions = {}
+        for metadata, signal in zip(metadatas, signals):
+            # Reuse the decomposition of unchanged signals
+            key = (id(signal), plot_type)
+            cached = self._decompositions.get(key)
+            if cached is not None and cached[0] is signal:
+                first_ordinate, second_ordinate = cached[1]
+            else:
+                first_ordinate, second_ordinate = decompose(signal.ordinate,
+                                                            plot_type)
+            decompositions[key] = (signal, (first_ordinate, second_ordinate))
+            lines.append((signal.abscissa_start, signal.increment,
+                          first_ordinate, second_ordinate, metadata))
+        self._decompositions = decompositions
+        return plot_type, lines
+
+    def decimated_lines(self):
+        """Returns the abscissas and ordinates of the lines decimated to the
+        width of the axes. The result is cached as long as the plot_data and
+        the width do not change.
+        """
+        plot_type, lines = self.plot_data
+        buckets = max(int(self.first_axis.get_window_extent().width), 1)
+        # The cache is cleared by compute whenever the data changes
+        if self._decimation_cache is not None and \
+                self._decimation_cache[0] == buckets:
+            return self._decimation_cache[1]
+        decimated_lines = []
+        for abscissa_start, increment, first_ordinate, second_ordinate, \
+                metadata in lines:
+            first_indices = util.decimate_min_max(first_ordinate, buckets)
+            second_indices = util.decimate_min_max(second_ordinate, buckets)
+            # Compute the abscissa only for the decimated values
+            decimated_lines.append((
+                abscissa_start + first_indices * increment,
+                first_ordinate[first_indices],
+                abscissa_start + second_indices * increment,
+                second_ordinate[second_indices], metadata))
+        self._decimation_cache = (buckets, decimated_lines)
+        return decimated_lines
+
+    def render(self):
+        # Clear the axes and the legend
+        self.first_axis.cla()
+        self.second_axis.cla()
+        if self.legend:
+            self.legend.remove()
+        if self.plot_data is None:
+            plot_type, lines = None, []
+        else:
+            plot_type = self.plot_data[0]
+            lines = self.decimated_lines()
         # Read plot parameters values
         real_absolute_parameters = self.plot_parameters["real_absolute"].parameters
         imag_phase_parameters = self.plot_parameters["imag_phase"].parameters
@@ -114,26 +174,14 @@ class ComplexPlot(DynamicBlock, PlotBlock):
         marker_color1 = real_absolute_parameters["marker_color"].value
         marker_color2 = imag_phase_parameters["marker_color"].value
 
-        labels_exist = any([metadata.name for metadata in metadatas])
+        labels_exist = any([line[4].name for line in lines])
         # Iterate over every signal and its metadata to plot it
-        for metadata, signal in zip(metadatas, signals):
-            # Create the abscissa vector
-            abscissa = np.linspace(signal.abscissa_start,
-                                   signal.abscissa_start + signal.increment * (
-                                               signal.values - 1),
-                                   signal.values)
-            ordinate = signal.ordinate
+        for first_abscissa, first_ordinate, second_abscissa, second_ordinate, \
+                metadata in lines:
             label = metadata.name
-            # Calculate different ordinates depending on the plot type
-            if plot_type == "real_imag":
-                first_ordinate = ordinate.real
-                second_ordinate = ordinate.imag
-            elif plot_type == "abs_phase":
-                first_ordinate = abs(ordinate)
-                second_ordinate = np.angle(ordinate)
             # Plot and pass plot parameters for the first axis
             if plot_kind1 == "line":
-                self.first_axis.plot(abscissa, first_ordinate, color1,
+                self.first_axis.plot(first_abscissa, first_ordinate, color1,
                                      label=label, marker=marker1,
                                      markerfacecolor=marker_color1,
                                      markeredgecolor=marker_color1)
@@ -142,12 +190,12 @@ class ComplexPlot(DynamicBlock, PlotBlock):
                     markerfmt1 = None
                 else:
                     markerfmt1 = marker_color1 + marker1
-                self.first_axis.stem(abscissa, first_ordinate, color1,
+                self.first_axis.stem(first_abscissa, first_ordinate, color1,
                                      label=label, use_line_collection=True,
                                      basefmt=" ", markerfmt=markerfmt1)
             # Plot and pass plot parameters for the second axis
             if plot_kind2 == "line":
-                self.second_axis.plot(abscissa, second_ordinate, color2,
+                self.second_axis.plot(second_abscissa, second_ordinate, color2,
                                       label=label, marker=marker2,
                                       markerfacecolor=marker_color2,
                                       markeredgecolor=marker_color2)
@@ -156,7 +204,7 @@ class ComplexPlot(DynamicBlock, PlotBlock):
                     markerfmt2 = None
                 else:
                     markerfmt2 = marker_color2 + marker2
-                self.second_axis.stem(abscissa, second_ordinate, color2,
+                self.second_axis.stem(second_abscissa, second_ordinate, color2,
                                       label=label, use_line_collection=True,
                                       basefmt=" ", markerfmt=markerfmt2,
                                       )
@@ -166,8 +214,8 @@ class ComplexPlot(DynamicBlock, PlotBlock):
         else:
             self.legend = None
         # Set the x and y labels depending on the metadata of the inputs
-        if signals:
-            metadata = metadatas[0]
+        if lines:
+            metadata = lines[0][4]
             self.set_xlabel(axis=self.first_axis, quantity=metadata.quantity_a,
                             unit=metadata.unit_a, symbol=metadata.symbol_a)
             self.set_ylabel(axis=self.first_axis, quantity=metadata.quantity_o,
@@ -190,3 +238,27 @@ class ComplexPlot(DynamicBlock, PlotBlock):
         self.second_axis.grid(True)
         # Draw the plot
         self.fig.canvas.draw()
+
+
+def decompose(ordinate, plot_type):
+    """Decomposes a complex ordinate into its real and imaginary part or its
+    absolute value and phase. The real and imaginary part are views of the
+    ordinate. The absolute value and the phase are computed together chunk
+    by chunk so every chunk is only read once from memory.
+
+    Args:
+        ordinate: Ordinate to decompose.
+        plot_type (str): "real_imag" or "abs_phase".
+    Returns:
+        tuple: The two real valued ordinates.
+    """
+    if plot_type == "real_imag":
+        return ordinate.real, ordinate.imag
+    absolute = np.empty(ordinate.shape)
+    phase = np.empty(ordinate.shape)
+    for index in range(0, len(ordinate), generators.CHUNK_SIZE):
+        chunk = slice(index, index + generators.CHUNK_SIZE)
+        values = ordinate[chunk]
+        np.abs(values, out=absolute[chunk])
+        np.arctan2(values.imag, values.real, out=phase[chunk])
+    return absolute, phase
@@ -81,8 +81,9 @@ class CrossPowerSpectrum(Block):
             ordinate=power_density,
         )
         # Calculate units for abscissa and ordinate
-        unit_o = self.inputs[0].metadata.unit_o * self.inputs[1].metadata.unit_o
-        unit_a = 1 / self.inputs[0].metadata.unit_a
+        unit_o = data_types.multiply_units(self.inputs[0].metadata.unit_o,
+                                            self.inputs[1].metadata.unit_o)
+        unit_a = data_types.divide_units(1, self.inputs[0].metadata.unit_a)
         # Divide ordinate unit by abscissa in case of density scaling
         if scaling == "density":
             unit_o = Unit(numerators=[unit_o.repr], denominators=[unit_a.repr],
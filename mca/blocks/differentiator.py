@@ -34,7 +34,8 @@ class Differentiator(Block):
         )
         # Calculate units for abscissa and ordinate
         unit_a = self.inputs[0].metadata.unit_a
-        unit_o = self.inputs[0].metadata.unit_o / self.inputs[0].metadata.unit_a
+        unit_o = data_types.divide_units(self.inputs[0].metadata.unit_o,
+                                          self.inputs[0].metadata.unit_a)
         # Apply metadata from the input to the output
         self.outputs[0].process_metadata = data_types.MetaData(
             name=None, unit_a=unit_a, unit_o=unit_o
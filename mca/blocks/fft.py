@@ -58,7 +58,7 @@ class FFT(Block):
         )
         # Calculate units for abscissa and ordinate
         unit_o = self.inputs[0].metadata.unit_o
-        unit_a = 1 / self.inputs[0].metadata.unit_a
+        unit_a = data_types.divide_units(1, self.inputs[0].metadata.unit_a)
         # Apply new metadata to the output
         self.outputs[0].process_metadata = data_types.MetaData(
             name=None, unit_a=unit_a, unit_o=unit_o
@@ -67,15 +67,9 @@ class FFTPlot(PlotBlock):
         self.plot_parameters["marker_color"] = util.get_plt_color_parameter(
             name="Marker color")
 
-    def process(self):
-        # Clear the axes and the legend
-        self.axes.cla()
-        if self.legend:
-            self.legend.remove()
-            self.legend = None
+    def compute(self):
         if self.all_inputs_empty():
-            self.fig.canvas.draw()
-            return
+            return None
         # Validate the input data of type signal
         validator.check_type_signal(self.inputs[0].data)
         # Read the input data
@@ -84,13 +78,6 @@ class FFTPlot(PlotBlock):
         plot_mode = self.parameters["plot_mode"].value
         shift = self.parameters["shift"].value
         normalize = self.parameters["normalize"].value
-        # Read plot parameters values
-        plot_kind = self.plot_parameters["plot_kind"].value
-        abscissa_scaling = self.plot_parameters["abscissa_scaling"].value
-        ordinate_scaling = self.plot_parameters["ordinate_scaling"].value
-        marker = self.plot_parameters["marker"].value
-        color = self.plot_parameters["color"].value
-        marker_color = self.plot_parameters["marker_color"].value
 
         values = input_signal.values
         # Calculate the frequency increment
@@ -127,8 +114,34 @@ class FFTPlot(PlotBlock):
             ordinate = abs(ordinate)
         elif plot_mode == "phase":
             ordinate = np.angle(ordinate)
+        # Get the metadata of the FFT
+        unit_o = self.inputs[0].metadata.unit_o
+        metadata = data_types.MetaData(
+            self.inputs[0].metadata.name,
+            unit_a=data_types.divide_units(1, self.inputs[0].metadata.unit_a),
+            unit_o=unit_o,
+        )
+        return abscissa, ordinate, metadata
 
-        label = self.inputs[0].metadata.name
+    def render(self):
+        # Clear the axes and the legend
+        self.axes.cla()
+        if self.legend:
+            self.legend.remove()
+            self.legend = None
+        if self.plot_data is None:
+            self.fig.canvas.draw()
+            return
+        abscissa, ordinate, metadata = self.plot_data
+        # Read plot parameters values
+        plot_kind = self.plot_parameters["plot_kind"].value
+        abscissa_scaling = self.plot_parameters["abscissa_scaling"].value
+        ordinate_scaling = self.plot_parameters["ordinate_scaling"].value
+        marker = self.plot_parameters["marker"].value
+        color = self.plot_parameters["color"].value
+        marker_color = self.plot_parameters["marker_color"].value
+
+        label = metadata.name
         # Plot and pass plot parameters
         if plot_kind == "line":
             self.axes.plot(abscissa, ordinate, color, label=label, marker=marker,
@@ -141,12 +154,6 @@ class FFTPlot(PlotBlock):
         if label:
             self.legend = self.fig.legend()
         # Set the x and y labels depending on the metadata of the input
-        unit_o = self.inputs[0].metadata.unit_o
-        metadata = data_types.MetaData(
-            self.inputs[0].metadata.name,
-            unit_a=1 / self.inputs[0].metadata.unit_a,
-            unit_o=unit_o,
-        )
         self.set_xlabel(axis=self.axes, quantity=metadata.quantity_a,
                         unit=metadata.unit_a, symbol=metadata.symbol_a)
         self.set_ylabel(axis=self.axes, quantity=metadata.quantity_o,
@@ -1,7 +1,4 @@
-import numpy as np
-from scipy.signal import gausspulse
-
-from mca.framework import Block, data_types, parameters, util
+from mca.framework import Block, data_types, generators, parameters, util
 
 
 class GaussPulse(Block):
@@ -47,21 +44,11 @@ class GaussPulse(Block):
         abscissa_start = self.parameters["abscissa"].parameters["start"].value
         values = self.parameters["abscissa"].parameters["values"].value
         increment = self.parameters["abscissa"].parameters["increment"].value
-        # Calculate the abscissa
-        abscissa = (
-            np.linspace(
-                abscissa_start, abscissa_start + (values - 1) * increment,
-                values
-            )
-        )
-        # Calculate the ordinates
-        real, imag, envelope = gausspulse(
-            abscissa, fc=center_freq, bw=frac_bw,
-            bwr=ref_level, retquad=True, retenv=True)
-        # Amplify the ordinates
-        real *= amp
-        imag *= amp
-        envelope *= amp
+        # Generate the amplified ordinates in chunks
+        real, imag, envelope = generators.generate(
+            generators.gauss_pulse_kernel(amp, center_freq, frac_bw,
+                                          ref_level),
+            abscissa_start, values, increment, outputs=3)
         # Apply the signals to the outputs
         self.outputs[0].data = data_types.Signal(
             abscissa_start=abscissa_start,
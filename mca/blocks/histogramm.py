@@ -6,14 +6,17 @@ from mca.language import _
 
 class Histogramm(PlotBlock):
     """Plots absolute and relative (density) frequency of occurrences of
-    values in a histogramm.
+    values in a histogramm. The frequencies are also applied to the output
+    as a signal whose abscissa contains the centers of the bins.
     """
     name = "Histogramm"
     description = ("Plots absolute and relative density frequency of "
                    "occurrences of values in a histogramm.")
     tags = ("Plotting",)
-    references = {"matplotlib.axes.Axes.hist":
-        "https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.hist.html"}
+    references = {"numpy.histogram":
+        "https://numpy.org/doc/stable/reference/generated/numpy.histogram.html",
+                  "matplotlib.axes.Axes.stairs":
+        "https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.stairs.html"}
 
     def __init__(self, **kwargs):
         """Initializes Histogramm class."""
@@ -40,17 +43,32 @@ class Histogramm(PlotBlock):
 
     def setup_io(self):
         self.new_input()
+        self.new_output()
 
     def process(self):
-        # Clear the axes and the legend
-        self.axes.cla()
-        if self.legend:
-            self.legend.remove()
-            self.legend = None
-        # Draw empty plot if the input has no data
-        if self.all_inputs_empty():
-            self.fig.canvas.draw()
+        super().process()
+        if self.plot_data is None:
+            self.outputs[0].data = None
             return
+        counts, edges, y_label, metadata = self.plot_data
+        # Apply the frequencies at the centers of the bins to the output
+        increment = edges[1] - edges[0]
+        self.outputs[0].data = data_types.Signal(
+            abscissa_start=edges[0] + increment / 2,
+            values=len(counts),
+            increment=increment,
+            ordinate=counts)
+        if self.parameters["plot_type"].value == "density":
+            unit_o = data_types.divide_units(1, metadata.unit_o)
+        else:
+            unit_o = ""
+        self.outputs[0].process_metadata = data_types.MetaData(
+            name=metadata.name, unit_a=metadata.unit_o, unit_o=unit_o,
+            quantity_a=metadata.quantity_o, symbol_a=metadata.symbol_o)
+
+    def compute(self):
+        if self.all_inputs_empty():
+            return None
         # Read the input data
         signal = self.inputs[0].data
         # Read the input metadata
@@ -60,31 +78,44 @@ class Histogramm(PlotBlock):
         # Read the parameters values
         plot_type = self.parameters["plot_type"].value
         bins = self.parameters["bins"].value
-        # Read plot parameters values
-        align = self.plot_parameters["align"].value
-        color = self.plot_parameters["color"].value
         # Adapt y label depending on the plot type
         if plot_type == "absolute":
-            density = False
             y_label = "Absolute frequency of occurrence"
         elif plot_type == "relative":
-            density = False
             y_label = "Relative frequency of occurrence"
         else:
-            density = True
-            y_label = "Relative density frequency of occurrence" + f" in {1 / metadata.unit_o}"
-        # Get the label for the legend
-        label = self.inputs[0].metadata.name
-        # Plot and pass plot parameters
+            y_label = "Relative density frequency of occurrence" + f" in {data_types.divide_units(1, metadata.unit_o)}"
+        # Count the occurrences in equally sized bins
+        counts, edges = np.histogram(signal.ordinate, bins=bins)
+        # Scale the counts instead of weighting every value
+        counts = counts.astype(float)
         if plot_type == "relative":
-            self.axes.hist(signal.ordinate,
-                           weights=np.ones(signal.ordinate.shape) / len(
-                               signal.ordinate),
-                           bins=bins,
-                           label=label, color=color, align=align)
-        else:
-            self.axes.hist(signal.ordinate, bins=bins, density=density,
-                           label=label, color=color, align=align)
+            counts /= len(signal.ordinate)
+        elif plot_type == "density":
+            counts /= len(signal.ordinate) * (edges[1] - edges[0])
+        return counts, edges, y_label, metadata
+
+    def render(self):
+        # Clear the axes and the legend
+        self.axes.cla()
+        if self.legend:
+            self.legend.remove()
+            self.legend = None
+        # Draw empty plot if the input has no data
+        if self.plot_data is None:
+            self.fig.canvas.draw()
+            return
+        counts, edges, y_label, metadata = self.plot_data
+        # Read plot parameters values
+        align = self.plot_parameters["align"].value
+        color = self.plot_parameters["color"].value
+        # Get the label for the legend
+        label = metadata.name
+        # Shift the bins like matplotlib's hist aligns its bars
+        shift = {"left": -0.5, "mid": 0, "right": 0.5}[align]
+        edges = edges + shift * (edges[1] - edges[0])
+        # Draw all bins with a single artist
+        self.axes.stairs(counts, edges, fill=True, label=label, color=color)
         # Add the legend
         if label:
             self.legend = self.fig.legend()
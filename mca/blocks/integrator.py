@@ -49,7 +49,8 @@ class Integrator(Block):
         )
         # Calculate units for abscissa and ordinate
         unit_a = self.inputs[0].metadata.unit_a
-        unit_o = self.inputs[0].metadata.unit_o * self.inputs[0].metadata.unit_a
+        unit_o = data_types.multiply_units(self.inputs[0].metadata.unit_o,
+                                            self.inputs[0].metadata.unit_a)
         # Apply new metadata to the output
         self.outputs[0].process_metadata = data_types.MetaData(
             name=None, unit_a=unit_a, unit_o=unit_o
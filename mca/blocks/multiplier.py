@@ -1,5 +1,3 @@
-import copy
-
 import numpy as np
 
 from mca.framework import DynamicBlock, data_types, util
@@ -26,26 +24,16 @@ class Multiplier(DynamicBlock):
     @util.validate_intervals
     def process(self):
         # Read the input data
-        signals = [copy.copy(i.data) for i in self.inputs if i.data]
+        signals = [i.data for i in self.inputs if i.data]
         # Read the input metadata
-        metadatas = [copy.copy(i.metadata) for i in self.inputs if i.metadata]
-        # Fill the signals with zeros so their lengths match
-        matched_signals = util.fill_zeros(signals)
-        # Initialize the ordinate and the units
-        ordinate = np.ones(matched_signals[0].values)
+        metadatas = [i.metadata for i in self.inputs if i.metadata]
+        # Multiply the signals, missing values are treated as zeros
+        self.outputs[0].data = util.combine_signals(signals, np.multiply)
+        # Calculate the ordinate unit
         unit_a = metadatas[0].unit_a
         unit_o = 1
-        # Calculate the ordinate and the ordinate unit
-        for sgn, metadata in zip(matched_signals, metadatas):
-            ordinate *= sgn.ordinate
-            unit_o *= metadata.unit_o
-        # Apply new signal to the output
-        self.outputs[0].data = data_types.Signal(
-            abscissa_start=matched_signals[0].abscissa_start,
-            values=matched_signals[0].values,
-            increment=matched_signals[0].increment,
-            ordinate=ordinate,
-        )
+        for metadata in metadatas:
+            unit_o = data_types.multiply_units(unit_o, metadata.unit_o)
         # Apply new metadata to the output
         self.outputs[0].process_metadata = data_types.MetaData(
             name=None, unit_a=unit_a, unit_o=unit_o
@@ -55,12 +55,7 @@ class Plot(PlotBlock, DynamicBlock):
         self.dynamic_input = [1, None]
         self.new_input()
 
-    def process(self):
-        # Clear the axes and the legend
-        self.axes.cla()
-        if self.legend:
-            self.legend.remove()
-            self.legend = None
+    def compute(self):
         # Validate the input data of type signal
         for i in self.inputs:
             validator.check_type_signal(i.data)
@@ -74,21 +69,34 @@ class Plot(PlotBlock, DynamicBlock):
         # Validate the abscissa and ordinate units
         validator.check_same_units(abscissa_units)
         validator.check_same_units(ordinate_units)
+        lines = []
+        for signal, metadata in zip(signals, metadatas):
+            # Create the abscissa vector
+            abscissa = np.linspace(signal.abscissa_start,
+                                   signal.abscissa_start + signal.increment * (
+                                               signal.values - 1),
+                                   signal.values)
+            lines.append((abscissa, signal.ordinate, signal.increment,
+                          metadata))
+        return lines
+
+    def render(self):
+        # Clear the axes and the legend
+        self.axes.cla()
+        if self.legend:
+            self.legend.remove()
+            self.legend = None
+        lines = self.plot_data or []
         # Read plot parameters values
         plot_kind = self.plot_parameters["plot_kind"].value
         abscissa_scaling = self.plot_parameters["abscissa_scaling"].value
         ordinate_scaling = self.plot_parameters["ordinate_scaling"].value
         marker = self.plot_parameters["marker"].value
 
-        labels_exist = any([metadata.name for metadata in metadatas])
+        labels_exist = any([line[3].name for line in lines])
         # Iterate over every signal and its metadata to plot it
-        for (index, signal), metadata in zip(enumerate(signals), metadatas):
-            # Create the abscissa vector
-            abscissa = np.linspace(signal.abscissa_start,
-                                   signal.abscissa_start + signal.increment * (
-                                               signal.values - 1),
-                                   signal.values)
-            ordinate = signal.ordinate
+        for index, (abscissa, ordinate, increment, metadata) in enumerate(
+                lines):
             label = metadata.name
             # Plot and pass plot parameters
             if plot_kind == "line":
@@ -102,13 +110,13 @@ class Plot(PlotBlock, DynamicBlock):
             elif plot_kind == "bar":
                 self.axes.bar(abscissa, ordinate, label=label,
                               color=f"C{index}",
-                              align="edge", width=signal.increment)
+                              align="edge", width=increment)
         # If any of the metadata of the inputs is named then create a legend
         if labels_exist:
             self.legend = self.fig.legend()
         # Set the x and y labels depending on the metadata of the inputs
-        if signals:
-            metadata = metadatas[0]
+        if lines:
+            metadata = lines[0][3]
             self.set_xlabel(axis=self.axes, quantity=metadata.quantity_a,
                             unit=metadata.unit_a, symbol=metadata.symbol_a)
             self.set_ylabel(axis=self.axes, quantity=metadata.quantity_o,
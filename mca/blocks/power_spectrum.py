@@ -82,8 +82,8 @@ class PowerSpectrum(Block):
             ordinate=power_density,
         )
         # Calculate units for abscissa and ordinate
-        unit_a = 1 / self.inputs[0].metadata.unit_a
-        unit_o = self.inputs[0].metadata.unit_o ** 2
+        unit_a = data_types.divide_units(1, self.inputs[0].metadata.unit_a)
+        unit_o = data_types.power_unit(self.inputs[0].metadata.unit_o, 2)
         # Divide ordinate unit by abscissa in case of density scaling
         if scaling == "density":
             unit_o = Unit(numerators=[unit_o.repr], denominators=[unit_a.repr],
@@ -1,18 +1,22 @@
 import numpy as np
 
-from mca.framework import Block, data_types, parameters, util
+from mca import exceptions
+from mca.framework import Block, data_types, generators, parameters, util
 
 
 class Quantization(Block):
     """Quantizes the input signal by a given amount of bits. Returns optionally
-    the raw bit values.
+    the raw bit values, which can be stored in the smallest unsigned integer
+    type able to hold them.
     """
     name = "Quantization"
     description = ("Quantizes the input signal by a given amount of bits. "
                    "Returns optionally the raw bit values.")
     tags = ("Processing",)
     references = {"numpy.rint":
-        "https://numpy.org/doc/stable/reference/generated/numpy.rint.html"}
+        "https://numpy.org/doc/stable/reference/generated/numpy.rint.html",
+                  "numpy.clip":
+        "https://numpy.org/doc/stable/reference/generated/numpy.clip.html"}
 
     def setup_io(self):
         self.new_output()
@@ -20,7 +24,7 @@ class Quantization(Block):
 
     def setup_parameters(self):
         self.parameters["bits"] = parameters.IntParameter(
-            name="Bits", min_=1, default=10
+            name="Bits", min_=1, max_=64, default=10
         )
         self.parameters["max_value"] = parameters.FloatParameter(
             name="Max value", min_=0, default=1
@@ -31,6 +35,13 @@ class Quantization(Block):
         self.parameters["raw"] = parameters.BoolParameter(
             name="Raw bits", default=False
         )
+        self.parameters["raw_dtype"] = parameters.ChoiceParameter(
+            name="Raw data type",
+            choices=(("float", "Float"),
+                     ("uint", "Smallest unsigned integer")),
+            default="float",
+            description="Data type of the raw bit values"
+        )
 
     @util.abort_all_inputs_empty
     @util.validate_type_signal
@@ -42,25 +53,48 @@ class Quantization(Block):
         max_value = self.parameters["max_value"].value
         signed = self.parameters["signed"].value
         raw = self.parameters["raw"].value
-        # Calculate the ordinate
-        if not signed:
-            ordinate = input_signal.ordinate * (2 ** bits) / max_value
+        raw_dtype = self.parameters["raw_dtype"].value
+        if raw and raw_dtype == "uint" and bits > 63:
+            raise exceptions.ParameterValueError(
+                "Raw bits can only be stored as unsigned integers for up to "
+                "63 bits.")
+        max_code = 2 ** bits - 1
+        if raw and raw_dtype == "uint":
+            dtype = np.min_scalar_type(max_code)
         else:
-            ordinate = (input_signal.ordinate + max_value) * (2 ** bits - 1) / (
-                        2 * max_value)
-        ordinate = np.rint(ordinate)
-        # Apply clipping
-        pos_clipping_mask = ordinate > 2 ** bits - 1
-        neg_clipping_mask = ordinate < 0
-        ordinate = ~(
-                    pos_clipping_mask | neg_clipping_mask) * ordinate + pos_clipping_mask * (
-                               2 ** bits - 1)
-        # Convert int values back to actual values
-        if not raw:
-            ordinate = ordinate * (1 + signed) * max_value / (2 ** bits)
-        # Subtract offset
-        if signed and not raw:
-            ordinate = ordinate - max_value
+            dtype = np.float64
+        ordinate = np.empty(input_signal.ordinate.shape, dtype=dtype)
+        # Integer ordinates need a buffer for the calculations
+        if dtype != np.float64:
+            buffer = np.empty(min(generators.CHUNK_SIZE, len(ordinate)))
+        # Calculate the ordinate chunk by chunk in place
+        for index in range(0, len(ordinate), generators.CHUNK_SIZE):
+            values = input_signal.ordinate[index:index + generators.CHUNK_SIZE]
+            if dtype != np.float64:
+                chunk = buffer[:len(values)]
+            else:
+                chunk = ordinate[index:index + generators.CHUNK_SIZE]
+            # Keep the operation order of the formulas so that rounding
+            # ties are resolved the same way
+            if not signed:
+                np.multiply(values, float(2 ** bits), out=chunk)
+                np.divide(chunk, max_value, out=chunk)
+            else:
+                np.add(values, max_value, out=chunk)
+                np.multiply(chunk, float(max_code), out=chunk)
+                np.divide(chunk, 2 * max_value, out=chunk)
+            np.rint(chunk, out=chunk)
+            # Apply clipping
+            np.clip(chunk, 0, float(max_code), out=chunk)
+            # Convert int values back to actual values
+            if not raw:
+                np.multiply(chunk, (1 + signed) * max_value, out=chunk)
+                np.divide(chunk, float(2 ** bits), out=chunk)
+                # Subtract offset
+                if signed:
+                    np.subtract(chunk, max_value, out=chunk)
+            if dtype != np.float64:
+                ordinate[index:index + len(values)] = chunk
         # Apply new signal to the output
         self.outputs[0].data = data_types.Signal(
             abscissa_start=input_signal.abscissa_start,
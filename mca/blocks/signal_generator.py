@@ -1,7 +1,6 @@
 import numpy as np
-from scipy import signal as sgn
 
-from mca.framework import Block, data_types, parameters, util
+from mca.framework import Block, data_types, generators, parameters, util
 
 
 class SignalGenerator(Block):
@@ -42,43 +41,18 @@ class SignalGenerator(Block):
         increment = self.parameters["abscissa"].parameters["increment"].value
         shift = self.parameters["shift"].value
         signal_type = self.parameters["signal_type"].value
-        # Calculate the abscissa
-        abscissa = (
-            np.linspace(
-                abscissa_start, abscissa_start + (values - 1) * increment,
-                values
-            )
-        )
-        # Apply different signal types to calculate the ordinate
+        # Only the values within the width of the signal have to be
+        # generated, all other values are zero
         ordinate = np.zeros(values)
-        mask = np.logical_and((-width / 2) + shift <= abscissa,
-                              abscissa < width / 2 + shift)
+        start, stop = generators.index_range(
+            abscissa_start, values, increment, -width / 2 + shift,
+            width / 2 + shift)
         if signal_type == "rect":
-            ordinate[mask] = height
-        elif signal_type == "tri":
-            rect1 = sgn.windows.triang(int(width/increment))
-            if mask[-1]:
-                ordinate[mask] = rect1[:np.sum(mask)]
-            elif mask[0]:
-                ordinate[mask] = rect1[np.sum(mask):]
-            elif np.sum(mask) == 0:
-                pass
-            else:
-                ordinate[mask] = rect1
-            """
-            mask1 = np.logical_and((-width/2)+shift < abscissa, abscissa <= shift)
-            mask2 = np.logical_and(shift <= abscissa, abscissa < shift+(width/2))
-            
-            values_per_side = int((width/2)/increment)
-            excess_values1 = values_per_side - np.sum(mask1)
-            excess_values2 = values_per_side - np.sum(mask2)
-            print(excess_values1/values_per_side*height)
-            ordinate[mask1] = np.linspace(excess_values1/values_per_side*height,
-                                          height, np.sum(mask1))
-            ordinate[mask2] = np.linspace(height,
-                                          excess_values2/values_per_side*height,
-                                          np.sum(mask2))
-            """""
+            ordinate[start:stop] = height
+        elif signal_type == "tri" and start < stop:
+            ordinate[start:stop] = generators.generate(
+                generators.pulse_triangle_kernel(height, width, shift),
+                abscissa_start + start * increment, stop - start, increment)
         # Apply new signal to the output
         self.outputs[0].data = data_types.Signal(
             abscissa_start=abscissa_start,
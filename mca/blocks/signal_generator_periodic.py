@@ -1,7 +1,4 @@
-import numpy as np
-from scipy import signal as sgn
-
-from mca.framework import Block, data_types, parameters, util
+from mca.framework import Block, data_types, generators, parameters, util
 
 
 class SignalGeneratorPeriodic(Block):
@@ -42,20 +39,15 @@ class SignalGeneratorPeriodic(Block):
         increment = self.parameters["abscissa"].parameters["increment"].value
         phase = self.parameters["phase"].value
         signal_type = self.parameters["signal_type"].value
-        # Calculate the abscissa
-        abscissa = (
-            np.linspace(
-                abscissa_start, abscissa_start + (values - 1) * increment,
-                values
-            )
-        )
-        # Apply different signal types to calculate the ordinate
+        # Generate the ordinate of the chosen signal type in chunks
         if signal_type == "sin":
-            ordinate = amp * np.sin(2 * np.pi * freq * abscissa - phase)
+            kernel = generators.sine_kernel(amp, freq, phase)
         elif signal_type == "rect":
-            ordinate = rect(abscissa, freq, amp, phase)
+            kernel = generators.rect_kernel(amp, freq, phase)
         elif signal_type == "tri":
-            ordinate = triangle(abscissa, freq, amp, phase)
+            kernel = generators.triangle_kernel(amp, freq, phase)
+        ordinate = generators.generate(kernel, abscissa_start, values,
+                                       increment)
         # Apply new signal to the output
         self.outputs[0].data = data_types.Signal(
             abscissa_start,
@@ -64,14 +56,3 @@ class SignalGeneratorPeriodic(Block):
             ordinate,
         )
 
-
-def triangle(abscissa, freq, amp, phase):
-    """Generates a triangular signal."""
-    tri = amp * sgn.sawtooth(
-        2 * np.pi * freq * abscissa - phase + np.pi / 2, 0.5)
-    return tri
-
-
-def rect(abscissa, freq, amp, phase):
-    """Generates a rectangular signal."""
-    return amp * np.sign(np.sin(2 * np.pi * freq * abscissa - phase))
@@ -1,16 +1,22 @@
 import numpy as np
 
-from mca.framework import Block, data_types, parameters, util
+from mca.framework import Block, data_types, generators, parameters, util
+from mca import exceptions
 
 
 class SignalGeneratorStochastic(Block):
-    """Generates a stochastic signal with either normal or equal
-    distribution.
+    """Generates a stochastic signal with a normal, uniform, exponential or
+    Poisson distribution or normally distributed pink or brown noise. The
+    signal is generated from the seed, so processing the block again with the
+    same parameters reproduces the same signal. Every block gets its own
+    random seed on creation, copies of a block included.
     """
     name = "Signal Generator (Stochastic)"
-    description = ("Generates a stochastic signal "
-                   "with either normal or equal distribution.")
+    description = ("Generates a stochastic signal with a normal, uniform, "
+                   "exponential or Poisson distribution or pink or brown "
+                   "noise. The Poisson distribution only uses the mean.")
     tags = ("Generating", "Stochastic")
+    unique_parameters = ("seed",)
 
     def setup_io(self):
         self.new_output(user_metadata_required=True)
@@ -19,7 +25,11 @@ class SignalGeneratorStochastic(Block):
         self.parameters["dist"] = parameters.ChoiceParameter(
                 name="Distribution",
                 choices=(("normal", "Normal distribution"),
-                         ("uniform", "Uniform distribution")),
+                         ("uniform", "Uniform distribution"),
+                         ("exponential", "Exponential distribution"),
+                         ("poisson", "Poisson distribution"),
+                         ("pink", "Pink noise (1/f)"),
+                         ("brown", "Brown noise (1/f²)")),
                 default="normal"
         )
         self.parameters["mean"] = parameters.FloatParameter(
@@ -28,6 +38,11 @@ class SignalGeneratorStochastic(Block):
         self.parameters["std_dev"] = parameters.FloatParameter(
             name="Standard deviation σ", min_=0, default=1
         )
+        self.parameters["seed"] = parameters.IntParameter(
+            name="Seed", min_=0, max_=2 ** 32 - 1,
+            default=int(np.random.SeedSequence().entropy % 2 ** 32),
+            description="Seed of the random number generator"
+        )
         abscissa = util.create_abscissa_parameter_block()
         self.parameters["abscissa"] = abscissa
 
@@ -39,12 +54,40 @@ class SignalGeneratorStochastic(Block):
         values = self.parameters["abscissa"].parameters["values"].value
         increment = self.parameters["abscissa"].parameters["increment"].value
         dist = self.parameters["dist"].value
+        seed = self.parameters["seed"].value
+        # The same seed reproduces the same signal
+        rng = np.random.default_rng(seed)
         # Calculate the ordinate depending on the distribution
-        if dist == "normal":
-            ordinate = mean + std_dev * np.random.randn(values)
-        elif dist == "uniform":
-            ordinate = mean + std_dev * np.sqrt(12) * (
-                        np.random.rand(values) - 0.5)
+        if dist in ("pink", "brown"):
+            ordinate = colored_noise(rng, values, 1 if dist == "pink" else 2)
+            ordinate *= std_dev
+            ordinate += mean
+        elif dist == "poisson":
+            if mean < 0:
+                raise exceptions.ParameterValueError(
+                    "Mean of the Poisson distribution has to be positive.")
+            ordinate = np.empty(values)
+            for index in range(0, values, generators.CHUNK_SIZE):
+                chunk = ordinate[index:index + generators.CHUNK_SIZE]
+                chunk[:] = rng.poisson(mean, len(chunk))
+        else:
+            ordinate = np.empty(values)
+            # Scale each chunk right after generating it while it is cached
+            for index in range(0, values, generators.CHUNK_SIZE):
+                chunk = ordinate[index:index + generators.CHUNK_SIZE]
+                if dist == "normal":
+                    rng.standard_normal(out=chunk)
+                    chunk *= std_dev
+                elif dist == "uniform":
+                    rng.random(out=chunk)
+                    chunk -= 0.5
+                    chunk *= std_dev * np.sqrt(12)
+                elif dist == "exponential":
+                    # Shifted so the mean is zero before adding the mean
+                    rng.standard_exponential(out=chunk)
+                    chunk -= 1
+                    chunk *= std_dev
+                chunk += mean
         # Apply new signal to the output
         self.outputs[0].data = data_types.Signal(
             abscissa_start=abscissa_start,
@@ -52,3 +95,26 @@ class SignalGeneratorStochastic(Block):
             increment=increment,
             ordinate=ordinate,
         )
+
+
+def colored_noise(rng, values, exponent):
+    """Generates normally distributed noise with a power spectral density
+    proportional to 1/f^exponent by shaping white noise in the frequency
+    domain. The noise has a mean of 0 and a standard deviation of 1.
+
+    Args:
+        rng: Random number generator.
+        values (int): Amount of values.
+        exponent (float): Exponent of the power spectral density, e.g. 1 for
+                          pink noise and 2 for brown noise.
+    """
+    spectrum = np.fft.rfft(rng.standard_normal(values))
+    frequencies = np.fft.rfftfreq(values)
+    # Remove the DC component instead of dividing by zero
+    spectrum[0] = 0
+    spectrum[1:] *= frequencies[1:] ** (-exponent / 2)
+    noise = np.fft.irfft(spectrum, n=values)
+    std = np.std(noise)
+    if std:
+        noise /= std
+    return noise
@@ -1,6 +1,4 @@
-import dsch
-
-from mca.framework import Block, data_types, parameters
+from mca.framework import Block, parameters, signal_file
 
 
 class SignalLoader(Block):
@@ -17,7 +15,13 @@ class SignalLoader(Block):
         self.parameters["file_name"] = parameters.PathParameter(
                 name="Arbitrary data path",
                 loading=True,
-                file_formats=[".npz", ".mat", ".hdf5"]
+                file_formats=[signal_file.file_extension, ".npz", ".mat",
+                              ".hdf5"]
+        )
+        self.parameters["memory_map"] = parameters.BoolParameter(
+                name="Memory map", default=False,
+                description="Map uncompressed .mcas files into memory "
+                            "read-only instead of reading them"
         )
         self.parameters["load_file"] = parameters.ActionParameter(
                 name="Load file",
@@ -31,29 +35,19 @@ class SignalLoader(Block):
         """Loads a signal from a file (previously saved by the SignalSaver)."""
         # Read parameters values
         file_name = self.parameters["file_name"].value
-
-        storage = dsch.load(
-            storage_path=file_name,
-            required_schema=data_types.signal_schema
-        )
+        # Read the native format without dsch
+        if file_name.endswith(signal_file.file_extension):
+            signal, metadata = signal_file.load_signal(
+                file_name, memory_map=self.parameters["memory_map"].value)
+            self.outputs[0].data = signal
+            self.outputs[0].process_metadata = metadata
+            self.trigger_update()
+            return
+        signal, metadata = signal_file.load_dsch_signal(file_name)
         # Apply loaded signal to the output
-        self.outputs[0].data = data_types.Signal(
-            abscissa_start=storage.data.signal.abscissa_start.value,
-            values=storage.data.signal.values.value,
-            increment=storage.data.signal.increment.value,
-            ordinate=storage.data.signal.ordinate.value
-        )
-
+        self.outputs[0].data = signal
         # Apply metadata from the loaded signal
-        self.outputs[0].process_metadata = data_types.MetaData(
-                    name=storage.data.metadata.name.value,
-                    unit_a=storage.data.metadata.abscissa_unit.value,
-                    unit_o=storage.data.metadata.ordinate_unit.value,
-                    quantity_a=storage.data.metadata.abscissa_quantity.value,
-                    quantity_o=storage.data.metadata.ordinate_quantity.value,
-                    symbol_a=storage.data.metadata.abscissa_symbol.value,
-                    symbol_o=storage.data.metadata.ordinate_symbol.value,
-        )
+        self.outputs[0].process_metadata = metadata
 
         # Trigger an update manually since this is not executed within process
         self.trigger_update()
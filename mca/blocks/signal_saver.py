@@ -4,13 +4,16 @@ import dsch
 from dsch import schema
 
 from mca import exceptions
-from mca.framework import Block, data_types, parameters
+from mca.framework import Block, batch, data_types, parameters, signal_file
 
 
 class SignalSaver(Block):
-    """Saves the input signal in a .npz, .mat or .hdf5 file."""
+    """Saves the input signal in a .mcas, .npz, .mat or .hdf5 file. The
+    native .mcas format is written fastest and can be memory mapped by the
+    :class:`.SignalLoader`.
+    """
     name = "Signal Saver"
-    description = "Saves the input signal in a .npz, .mat, .hdf5 file."
+    description = "Saves the input signal in a .mcas, .npz, .mat, .hdf5 file."
     tags = ("Saving",)
 
     def setup_io(self):
@@ -18,7 +21,17 @@ class SignalSaver(Block):
 
     def setup_parameters(self):
         self.parameters["file_name"] = parameters.PathParameter(
-            name="Filename", file_formats=(".npz", ".mat", ".hdf5")
+            name="Filename",
+            file_formats=(signal_file.file_extension, ".npz", ".mat", ".hdf5")
+        )
+        self.parameters["single_precision"] = parameters.BoolParameter(
+            name="Single precision", default=False,
+            description="Store the ordinate as float32 or complex64 "
+                        "(only .mcas)"
+        )
+        self.parameters["compress"] = parameters.BoolParameter(
+            name="Compress", default=False,
+            description="Compress the ordinate (only .mcas)"
         )
         self.parameters["save"] = parameters.ActionParameter(
             name="Save", function=self.save_data,
@@ -29,7 +42,24 @@ class SignalSaver(Block):
         pass
 
     def save_data(self):
-        """Saves the input data in .npz, .mat, or .hdf5 file."""
+        """Saves the input data in .mcas, .npz, .mat, or .hdf5 file."""
+        self.save_signal(self.parameters["file_name"].value)
+
+    def save_batch_result(self, name):
+        """Saves the input data of a batch item next to the file of the
+        file name parameter. The name of the item is appended to the file
+        name.
+        """
+        self.save_signal(batch.result_path(self.parameters["file_name"].value,
+                                           name))
+
+    def save_signal(self, filename):
+        """Saves the input data in the given file.
+
+        Args:
+            filename (str): Path of the .mcas, .npz, .mat or .hdf5 file.
+        """
+        self.pull_inputs()
         # Raise error when the input has no data to save
         if self.all_inputs_empty():
             raise exceptions.DataSavingError("No data to save.")
@@ -37,8 +67,13 @@ class SignalSaver(Block):
         signal = self.inputs[0].data
         # Read the input metadata
         metadata = self.inputs[0].metadata
-        # Read parameters values
-        filename = self.parameters["file_name"].value
+        # Write the native format without dsch
+        if filename.endswith(signal_file.file_extension):
+            signal_file.save_signal(
+                filename, signal, metadata,
+                single_precision=self.parameters["single_precision"].value,
+                compress=self.parameters["compress"].value)
+            return
         # Remove file to create a new storage
         if os.path.exists(filename):
             os.remove(filename)
@@ -52,16 +52,9 @@ class STFTPlot(PlotBlock):
             default="viridis"
         )
 
-    def process(self):
-        # Clear the axes and the color bar
-        if self.color_bar:
-            self.color_bar.remove()
-            self.color_bar = None
-        self.axes.cla()
-        # Draw empty plot when input has no data
+    def compute(self):
         if self.all_inputs_empty():
-            self.fig.canvas.draw()
-            return
+            return None
         # Validate the input data of type signal
         validator.check_type_signal(self.inputs[0].data)
         # Read the input data
@@ -71,20 +64,34 @@ class STFTPlot(PlotBlock):
         seg_length = self.parameters["seg_length"].value
         seg_overlap = self.parameters["seg_overlap"].value
         fft_length = self.parameters["fft_length"].value
-        # Read plot parameters values
-        cmap = self.plot_parameters["cmap"].value
         # Calculate the stft of the input signal
         f, t, z = stft(x=input_signal.ordinate, fs=1 / input_signal.increment,
                        window=window, nperseg=seg_length, noverlap=seg_overlap,
                        nfft=fft_length)
-        # Plot the stft
-        im = self.axes.pcolormesh(t, f, abs(z), cmap=cmap)
-        # Add the colorbar
-        self.color_bar = self.fig.colorbar(im, ax=self.axes)
         # Get the new metadata
         metadata = data_types.MetaData(self.inputs[0].metadata.name,
                                        unit_a=self.inputs[0].metadata.unit_a,
-                                       unit_o=1 / self.inputs[0].metadata.unit_a)
+                                       unit_o=data_types.divide_units(
+                                           1, self.inputs[0].metadata.unit_a))
+        return t, f, abs(z), metadata
+
+    def render(self):
+        # Clear the axes and the color bar
+        if self.color_bar:
+            self.color_bar.remove()
+            self.color_bar = None
+        self.axes.cla()
+        # Draw empty plot when input has no data
+        if self.plot_data is None:
+            self.fig.canvas.draw()
+            return
+        t, f, magnitude, metadata = self.plot_data
+        # Read plot parameters values
+        cmap = self.plot_parameters["cmap"].value
+        # Plot the stft
+        im = self.axes.pcolormesh(t, f, magnitude, cmap=cmap)
+        # Add the colorbar
+        self.color_bar = self.fig.colorbar(im, ax=self.axes)
         # Set axis label depending on the metadata
         self.set_xlabel(axis=self.axes, quantity=metadata.quantity_a,
                         unit=metadata.unit_a, symbol=metadata.symbol_a)
@@ -1,9 +1,20 @@
+import matplotlib.colors as crl
+import numpy as np
+
 from mca import exceptions
-from mca.framework import PlotBlock, data_types, parameters, util
+from mca.framework import PlotBlock, data_types, generators, parameters, util
 
 
 class XYPlot(PlotBlock):
-    """Plots the ordinates of the input signals against each other."""
+    """Plots the ordinates of the input signals against each other. Many
+    points can be drawn as a density image which counts the points per pixel
+    of the axes instead of drawing a marker per point.
+
+    Attributes:
+        density_threshold (int): Amount of points from which on the automatic
+                                 mode draws a density image.
+    """
+    density_threshold = 100000
     name = "XY Plot"
     description = ("Plots the ordinates of the input signals against "
                    "each other.")
@@ -12,6 +23,7 @@ class XYPlot(PlotBlock):
     def __init__(self, **kwargs):
         """Initializes XYPlot class."""
         super().__init__(rows=1, cols=1, **kwargs)
+        self._density_cache = None
 
     def setup_io(self):
         self.new_input()
@@ -34,22 +46,25 @@ class XYPlot(PlotBlock):
     def setup_plot_parameters(self):
         self.plot_parameters["color"] = util.get_plt_color_parameter()
         self.plot_parameters["marker"] = util.get_plt_marker_parameter()
-        self.plot_parameters["marker"].default = "."
         self.plot_parameters["marker"].value = "."
+        self.plot_parameters["mode"] = parameters.ChoiceParameter(
+            name="Mode",
+            choices=(("auto", "Automatic"), ("scatter", "Scatter"),
+                     ("density", "Density")),
+            default="auto",
+            description="Draw a marker per point or the density of the "
+                        "points. The automatic mode draws the density for "
+                        f"more than {self.density_threshold} points."
+        )
 
-    def process(self):
-        # Clear the axes
-        self.axes.cla()
-        # Draw empty plot when input has no data
+    def compute(self):
+        # Release the counts of the previous data
+        self._density_cache = None
         if self.any_inputs_empty():
-            self.fig.canvas.draw()
-            return
+            return None
         # Read the parameters values
         y_axis = self.parameters["y_axis"].value
         x_axis = self.parameters["x_axis"].value
-        # Read plot parameters values
-        marker = self.plot_parameters["marker"].value
-        color = self.plot_parameters["color"].value
         # Interchange the x and y mapping for input data
         if y_axis == "first":
             input_signal_o = self.inputs[0].data
@@ -58,9 +73,6 @@ class XYPlot(PlotBlock):
             input_signal_o = self.inputs[1].data
             metadata_o = self.inputs[1].metadata
         ordinate = input_signal_o.ordinate
-        unit_o = metadata_o.unit_o
-        quantity_o = metadata_o.quantity_o
-        symbol_o = metadata_o.symbol_o
         # Interchange the x and y mapping for input data
         if x_axis == "first":
             input_signal_a = self.inputs[0].data
@@ -69,21 +81,108 @@ class XYPlot(PlotBlock):
             input_signal_a = self.inputs[1].data
             metadata_a = self.inputs[1].metadata
         abscissa = input_signal_a.ordinate
-        unit_a = metadata_a.unit_o
-        quantity_a = metadata_a.quantity_o
-        symbol_a = metadata_a.symbol_o
         # Validate the vector lengths
         if len(ordinate) != len(abscissa):
             raise exceptions.IntervalError("Cannot plot ordinates with "
                                            "different lengths.")
+        return abscissa, ordinate, metadata_a, metadata_o
+
+    def render(self):
+        # Clear the axes
+        self.axes.cla()
+        # Draw empty plot when input has no data
+        if self.plot_data is None:
+            self.fig.canvas.draw()
+            return
+        abscissa, ordinate, metadata_a, metadata_o = self.plot_data
+        # Read plot parameters values
+        marker = self.plot_parameters["marker"].value
+        color = self.plot_parameters["color"].value
+        mode = self.plot_parameters["mode"].value
+        if mode == "auto":
+            if len(abscissa) > self.density_threshold:
+                mode = "density"
+            else:
+                mode = "scatter"
         # Plot
-        self.axes.scatter(abscissa, ordinate, color=color, marker=marker)
+        if mode == "scatter":
+            self.axes.scatter(abscissa, ordinate, color=color, marker=marker)
+        else:
+            self.draw_density(abscissa, ordinate, color)
         # Set the axis labels depending on the metadata
-        self.set_xlabel(axis=self.axes, quantity=quantity_a,
-                        unit=unit_a, symbol=symbol_a)
-        self.set_ylabel(axis=self.axes, quantity=quantity_o,
-                        unit=unit_o, symbol=symbol_o)
+        self.set_xlabel(axis=self.axes, quantity=metadata_a.quantity_o,
+                        unit=metadata_a.unit_o, symbol=metadata_a.symbol_o)
+        self.set_ylabel(axis=self.axes, quantity=metadata_o.quantity_o,
+                        unit=metadata_o.unit_o, symbol=metadata_o.symbol_o)
         # Use grid
         self.axes.grid(True)
         # Draw the plot
         self.fig.canvas.draw()
+
+    def draw_density(self, abscissa, ordinate, color):
+        """Draws the amount of points per pixel of the axes as an image. The
+        counts are cached as long as the data and the size of the axes do
+        not change.
+        """
+        extent = self.axes.get_window_extent()
+        bins = (int(np.clip(extent.width, 16, 2048)),
+                int(np.clip(extent.height, 16, 2048)))
+        # The cache is cleared by compute whenever the data changes
+        if self._density_cache is None or self._density_cache[0] != bins:
+            self._density_cache = (bins, density(abscissa, ordinate, bins))
+        counts, limits = self._density_cache[1]
+        # Fade from transparent to the chosen color with logarithmic counts
+        color_map = crl.LinearSegmentedColormap.from_list(
+            "density", [crl.to_rgba(color, 0.2), crl.to_rgba(color, 1)])
+        self.axes.imshow(np.ma.masked_equal(counts.T, 0), origin="lower",
+                         extent=limits, aspect="auto", cmap=color_map,
+                         norm=crl.LogNorm(), interpolation="nearest")
+
+
+def density(abscissa, ordinate, bins):
+    """Counts the points in a grid of equally sized bins. The points are
+    counted chunk by chunk to avoid temporary arrays of the size of the data.
+    Points with a NaN or infinite coordinate are skipped.
+
+    Args:
+        abscissa: Abscissa values of the points.
+        ordinate: Ordinate values of the points.
+        bins (tuple): Amount of bins along the abscissa and the ordinate.
+    Returns:
+        tuple: Counts with the shape of bins and the limits of the grid as
+               (left, right, bottom, top). All counts are zero if there are
+               no finite points.
+    """
+    x_min = y_min = np.inf
+    x_max = y_max = -np.inf
+    for abscissa_chunk, ordinate_chunk in _finite_chunks(abscissa, ordinate):
+        if len(abscissa_chunk):
+            x_min = min(x_min, abscissa_chunk.min())
+            x_max = max(x_max, abscissa_chunk.max())
+            y_min = min(y_min, ordinate_chunk.min())
+            y_max = max(y_max, ordinate_chunk.max())
+    counts = np.zeros(bins)
+    if x_min > x_max:
+        return counts, (-0.5, 0.5, -0.5, 0.5)
+    # Avoid empty ranges like np.histogram does
+    if x_min == x_max:
+        x_min, x_max = x_min - 0.5, x_max + 0.5
+    if y_min == y_max:
+        y_min, y_max = y_min - 0.5, y_max + 0.5
+    limits = ((x_min, x_max), (y_min, y_max))
+    for abscissa_chunk, ordinate_chunk in _finite_chunks(abscissa, ordinate):
+        counts += np.histogram2d(abscissa_chunk, ordinate_chunk, bins=bins,
+                                 range=limits)[0]
+    return counts, (x_min, x_max, y_min, y_max)
+
+
+def _finite_chunks(abscissa, ordinate):
+    """Yields the points with finite coordinates chunk by chunk."""
+    for index in range(0, len(abscissa), generators.CHUNK_SIZE):
+        abscissa_chunk = abscissa[index:index + generators.CHUNK_SIZE]
+        ordinate_chunk = ordinate[index:index + generators.CHUNK_SIZE]
+        finite = np.isfinite(abscissa_chunk) & np.isfinite(ordinate_chunk)
+        if not finite.all():
+            abscissa_chunk = abscissa_chunk[finite]
+            ordinate_chunk = ordinate_chunk[finite]
+        yield abscissa_chunk, ordinate_chunk
@@ -18,7 +18,9 @@ class Config(dict):
                       "recent_files": [],
                       "explorer_pos": "left",
                       "window_size": None,
-                      "first_startup": True}
+                      "first_startup": True,
+                      "autosave_interval": 60,
+                      "pull_mode": False}
 
     def __init__(self):
         """Initializes the Config class."""
@@ -0,0 +1,126 @@
+import collections
+import concurrent.futures
+import glob
+import itertools
+import os
+
+import numpy as np
+import scipy.io.wavfile
+
+from mca import exceptions
+from mca.framework import data_types, signal_file
+
+# File formats which can be loaded by :func:`load_file`
+file_formats = (signal_file.file_extension, ".npz", ".mat", ".hdf5", ".wav")
+
+
+def find_files(pattern):
+    """Returns the sorted paths of all supported files matching a glob
+    pattern. "**" matches any amount of subdirectories.
+
+    Args:
+        pattern (str): Glob pattern, e.g. "measurements/**/*.mcas".
+    """
+    return sorted(path for path in glob.glob(pattern, recursive=True)
+                  if path.endswith(file_formats) and os.path.isfile(path))
+
+
+def load_file(file_path):
+    """Loads a signal and its metadata from a file. Only the first channel
+    of .wav files is loaded.
+
+    Args:
+        file_path (str): Path of the file.
+    Returns:
+        tuple: :class:`.Signal` and :class:`.MetaData`.
+    Raises:
+        :class:`~mca.exceptions.DataLoadingError`: If the file could not be
+                                                    loaded.
+    """
+    if file_path.endswith(signal_file.file_extension):
+        return signal_file.load_signal(file_path)
+    if file_path.endswith(".wav"):
+        try:
+            rate, data = scipy.io.wavfile.read(file_path)
+        except FileNotFoundError:
+            raise exceptions.DataLoadingError("File not found")
+        if data.ndim == 2:
+            data = np.ascontiguousarray(data[:, 0])
+        signal = data_types.Signal(abscissa_start=0, values=len(data),
+                                   increment=1 / rate, ordinate=data)
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        return signal, data_types.MetaData(name=name, unit_a="s", unit_o="")
+    return signal_file.load_dsch_signal(file_path)
+
+
+def prefetch(file_paths, workers=4):
+    """Loads files in background threads and yields them in the given
+    order. At most twice as many files as workers are held in memory ahead
+    of the consumer.
+
+    Args:
+        file_paths (list): Paths of the files to load.
+        workers (int): Amount of threads loading files.
+    Yields:
+        tuple: Path of the file and the result of :func:`load_file`.
+    """
+    paths = iter(file_paths)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = collections.deque(
+            (path, executor.submit(load_file, path))
+            for path in itertools.islice(paths, 2 * workers))
+        while futures:
+            path, future = futures.popleft()
+            next_path = next(paths, None)
+            if next_path is not None:
+                futures.append((next_path,
+                                executor.submit(load_file, next_path)))
+            yield path, future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def item_names(file_paths):
+    """Returns unique names of the batch items loaded from files. A name is
+    the path of the file relative to the common directory of all files
+    without its extension, e.g. "run1_data" for "run1/data.mcas". The
+    extension is kept for files only differing in their extension and an
+    index is appended to names which still collide.
+
+    Args:
+        file_paths (list): Paths of the files.
+    """
+    if not file_paths:
+        return []
+    file_paths = [os.path.abspath(file_path) for file_path in file_paths]
+    root = os.path.commonpath([os.path.dirname(file_path)
+                               for file_path in file_paths])
+    relative_paths = [os.path.relpath(file_path, root)
+                      for file_path in file_paths]
+    stems = [os.path.splitext(path)[0] for path in relative_paths]
+    stem_counts = collections.Counter(stems)
+    names = []
+    for stem, path in zip(stems, relative_paths):
+        if stem_counts[stem] > 1:
+            stem = path.replace(".", "_")
+        name = stem.replace(os.sep, "_")
+        unique_name = name
+        index = 1
+        while unique_name in names:
+            unique_name = f"{name}_{index}"
+            index += 1
+        names.append(unique_name)
+    return names
+
+
+def result_path(file_path, name):
+    """Returns the path at which the result of a batch item is saved. The
+    name of the item is appended to the file name.
+
+    Args:
+        file_path (str): Path of the file a block saves to.
+        name (str): Name of the batch item.
+    """
+    root, extension = os.path.splitext(file_path)
+    return f"{root}_{name}{extension}"
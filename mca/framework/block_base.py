@@ -2,10 +2,10 @@ import logging
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-from matplotlib.backends.qt_compat import QtWidgets, QtGui
+from matplotlib.backends.qt_compat import QtWidgets, QtGui, QtCore
 
 from mca import exceptions
-from mca.framework import block_io, io_registry, parameters
+from mca.framework import block_io, io_registry, parameters, profiler
 from mca.language import _
 
 
@@ -28,11 +28,14 @@ class Block:
     tags = []
     references = {}
     svg = None
+    # Keys of the parameters which are not taken over when the block is
+    # copied, e.g. random seeds
+    unique_parameters = ()
 
     def __init__(self, **kwargs):
         """Initializes the main Block class."""
         super().__init__()
-        logging.info(f"Initializing {self}")
+        logging.info("Initializing %s", self)
         self.inputs = []
         self.outputs = []
         self.parameters = {
@@ -48,16 +51,55 @@ class Block:
         """Triggers an update from the block."""
         io_registry.Registry.invalidate_and_update(self)
 
+    def pull_inputs(self):
+        """Brings the data of the Inputs up-to-date if the registry is in
+        pull mode. Has to be called by actions which read the Input data
+        outside of process.
+        """
+        if io_registry.Registry.pull_mode:
+            io_registry.Registry.pull(self, process_block=False)
+
+    def save_batch_result(self, name):
+        """Called by batch loading blocks after the data of a batch item has
+        been loaded. Blocks saving data save the data of the item. Does
+        nothing by default.
+
+        Args:
+            name (str): Name of the batch item, e.g. the name of the loaded
+                        file.
+        """
+        pass
+
+    @property
+    def observed(self):
+        """True, if the data of the block is currently needed, e.g. because
+        it is displayed. Observed blocks are processed on changes in the
+        pull mode of the registry.
+        """
+        return False
+
     def read_kwargs(self, kwargs):
         """Writes keyword arguments into the parameters."""
-        for key in kwargs:
-            if key not in self.parameters:
-                continue
-            if isinstance(kwargs[key], dict):
-                for sub_key in kwargs[key]:
-                    self.parameters[key].parameters[sub_key].value = kwargs[key][sub_key]
-            else:
-                self.parameters[key].value = kwargs[key]
+        self.set_parameters({key: value for key, value in kwargs.items()
+                             if key in self.parameters}, update=False)
+
+    def set_parameters(self, values, update=True):
+        """Assigns values to several parameters at once. All values are
+        validated before any of them is assigned and the conversions of
+        :class:`.ParameterBlock` objects are executed once. Afterwards the
+        block is updated once.
+
+        Example:
+            >>> block.set_parameters({"amp": 2, "abscissa": {"values": 500}})
+
+        Args:
+            values (dict): Maps the keys of the parameters to values. Values
+                           of a :class:`.ParameterBlock` are given as dict.
+            update (bool): True, if the block should be updated afterwards.
+        """
+        parameters.set_values(self.parameters, values)
+        if update:
+            self.trigger_update()
 
     def process(self):
         """Processes data from Inputs and parameters.
@@ -82,16 +124,22 @@ class Block:
         """
         if (not self.inputs) or all(elem == True
                 for elem in [input_.up_to_date for input_ in self.inputs]):
-            self.process()
+            if profiler.Profiler.enabled:
+                profiler.Profiler.process(self)
+            else:
+                self.process()
             for output in self.outputs:
                 output.up_to_date = True
 
     def disconnect_all(self):
-        """Disconnects all Inputs and Outputs."""
-        for i in self.inputs:
-            i.disconnect()
-        for o in self.outputs:
-            o.disconnect()
+        """Disconnects all Inputs and Outputs. Affected blocks are updated
+        once after all connections have been removed.
+        """
+        with io_registry.Registry.batch():
+            for i in self.inputs:
+                i.disconnect()
+            for o in self.outputs:
+                o.disconnect()
 
     def new_output(self, metadata=None, user_metadata_required=False,
                    name=None):
@@ -132,7 +180,7 @@ class Block:
         for parameter in self.parameters.values():
             if isinstance(parameter, parameters.ActionParameter):
                 parameter.function = None
-        logging.info(f"Deleting {self}")
+        logging.info("Deleting %s", self)
 
     def new_input(self, name=None):
         """Creates and adds an new Input to the block. Used to create new
@@ -221,7 +269,7 @@ class DynamicBlock(Block):
         Raises:
             :class:`.InputOutputError`: If adding the Input was not successful.
         """
-        logging.info(f"Adding input to {self}")
+        logging.info("Adding input to %s", self)
         if input_ in io_registry.Registry._graph.nodes:
             raise exceptions.DynamicIOError("Input already added")
         if not self.dynamic_input:
@@ -242,7 +290,7 @@ class DynamicBlock(Block):
         Raises:
             :class:`.InputOutputError`: If adding the Output was not successful.
         """
-        logging.info(f"Adding output to {self}")
+        logging.info("Adding output to %s", self)
         if output in io_registry.Registry._graph.nodes:
             raise exceptions.DynamicIOError("Output already added")
         if not self.dynamic_output:
@@ -253,7 +301,7 @@ class DynamicBlock(Block):
             self.outputs.append(io_registry.Registry.add_node(output))
         else:
             self.outputs.append(io_registry.Registry.add_node(output))
-        self.process()
+        self.trigger_update()
 
     def delete_input(self, input_index):
         """Removes an Input from the Block.
@@ -264,7 +312,7 @@ class DynamicBlock(Block):
             :class:`.InputOutputError`: If the lower limit of the Inputs is
                 reached or dynamic_input is set to None.
         """
-        logging.info(f"Deleting input from {self}")
+        logging.info("Deleting input from %s", self)
         if not self.dynamic_input:
             raise exceptions.DynamicIOError("No permission to delete Input")
         if self.dynamic_input[0] >= len(self.inputs):
@@ -280,7 +328,7 @@ class DynamicBlock(Block):
             :class:`.InputOutputError`: If the lower limit of the Outputs is
                 reached or dynamic_output is set to None.
         """
-        logging.info(f"Deleting output from {self}")
+        logging.info("Deleting output from %s", self)
         if not self.dynamic_output:
             raise exceptions.DynamicIOError("No permission to delete Output")
         if self.dynamic_output[0] >= len(self.outputs):
@@ -302,12 +350,22 @@ class PlotBlock(Block):
     class. It uses the QT5 backend of matplotlib and the plot figure will be
     embedded in the PySide GUI.
 
+    Processing is split into two stages. :meth:`compute` derives the data to
+    plot from the inputs and parameters and :meth:`render` draws this data
+    using the plot_parameters. The computed data is cached in plot_data so
+    that changes of the plot_parameters only require rendering again.
+
+    The plot window is only created when it is accessed for the first time.
+    As long as the plot window is not visible rendering is deferred until it
+    gets shown.
+
     Attributes:
-        plot_window: Qt widget containing the figure.
-        axes(:py:class:`numpy.ndarray` or :obj:`matplotlib.axis.Axis`):
-            Depending on the number of rows and cols it is either a single
-            axis or an array of axes.
-        fig(:obj:`matplotlib.figure`): Matplotlib figure object.
+        plot_data: Data computed by :meth:`compute`. None if there is nothing
+                   to plot.
+        render_pending (bool): True, if the plot_data has not been rendered
+                               yet.
+        rows (int): Number of rows in the figure.
+        cols (int): Number of cols in the figure.
     """
     def __init__(self, rows, cols, **kwargs):
         """Initialize PlotBlock.
@@ -318,9 +376,41 @@ class PlotBlock(Block):
         """
         super().__init__(**kwargs)
         self.setup_plot_parameters()
-        self.plot_window = PlotWindow(rows, cols)
-        self.axes = self.plot_window.axes
-        self.fig = self.plot_window.canvas.fig
+        self.plot_data = None
+        self.render_pending = True
+        self.rows = rows
+        self.cols = cols
+        self._plot_window = None
+
+    @property
+    def plot_window(self):
+        """Qt widget containing the figure. Gets created on first access."""
+        if self._plot_window is None:
+            self._plot_window = PlotWindow(self.rows, self.cols)
+            self._plot_window.shown.connect(self.render_if_pending)
+        return self._plot_window
+
+    @property
+    def axes(self):
+        """Depending on the number of rows and cols it is either a single
+        :obj:`matplotlib.axis.Axis` or a :py:class:`numpy.ndarray` of axes.
+        """
+        return self.plot_window.axes
+
+    @property
+    def fig(self):
+        """Matplotlib figure object."""
+        return self.plot_window.canvas.fig
+
+    @property
+    def plot_visible(self):
+        """True, if the plot window exists and is visible."""
+        return self._plot_window is not None and \
+            self._plot_window.isVisible()
+
+    @property
+    def observed(self):
+        return self.plot_visible
 
     @property
     def label_color(self):
@@ -380,6 +470,52 @@ class PlotBlock(Block):
         self.plot_window.show()
 
     def process(self):
+        self.plot_data = None
+        self.render_pending = True
+        self.plot_data = self.compute()
+        self.request_render()
+
+    def update_plot(self):
+        """Renders the cached plot_data again without processing the block.
+        Used if only the plot_parameters have changed.
+        """
+        profiler.Profiler.record_cache_hit(self)
+        self.request_render()
+
+    def request_render(self):
+        """Renders the plot_data if the plot is visible. Otherwise
+        rendering is deferred until the plot window gets shown.
+        """
+        if self.plot_visible:
+            self.render_pending = False
+            self.render()
+        else:
+            self.render_pending = True
+
+    def render_if_pending(self):
+        """Renders the plot_data if it has not been rendered yet. In pull
+        mode the outdated data of the block is processed beforehand.
+        """
+        if io_registry.Registry.pull_mode:
+            io_registry.Registry.pull(self)
+        if self.render_pending:
+            self.render_pending = False
+            self.render()
+
+    def compute(self):
+        """Computes the data to plot from the inputs and the parameters.
+        Must not depend on the plot_parameters.
+
+        Returns:
+            Data to plot which is cached in plot_data. None if there is
+            nothing to plot.
+        """
+        raise NotImplementedError
+
+    def render(self):
+        """Draws the plot_data into the figure depending on the
+        plot_parameters.
+        """
         raise NotImplementedError
 
     def setup_io(self):
@@ -416,7 +552,10 @@ class PlotWindow(QtWidgets.QWidget):
     Attributes:
         canvas: Matplotlib canvas containing the figure.
         axes: Axes within the figure.
+        shown: Signal emitted when the widget gets shown.
     """
+    shown = QtCore.Signal()
+
     def __init__(self, rows, cols, **kwargs):
         """Initialize PlotWindow.
 
@@ -439,6 +578,10 @@ class PlotWindow(QtWidgets.QWidget):
         self.layout().addWidget(widget)
         self.axes = self.canvas.fig.subplots(nrows=rows, ncols=cols)
 
+    def showEvent(self, event):
+        self.shown.emit()
+        super().showEvent(event)
+
     def paintEvent(self, event):
         # Get colors depending on the style
         fig_colour = self.palette().color(QtGui.QPalette.Base).name()
@@ -16,6 +16,7 @@ class Input:
         up_to_date (bool): Flag which indicates if the data of the Input is
             valid or needs to be updated.
     """
+    __slots__ = ("name", "up_to_date", "block")
 
     def __init__(self, block=None, name=None):
         """Initializes the Input class.
@@ -34,7 +35,7 @@ class Input:
         Args:
             output (Output): Output to which the Input gets connected.
         """
-        logging.info(f"Connecting {self.block}  to {output.block}")
+        logging.info("Connecting %s to %s", self.block, output.block)
         io_registry.Registry.connect(output, self)
 
     def disconnect(self):
@@ -42,8 +43,8 @@ class Input:
         to any Output. Triggers an update.
         """
         if self.connected_output:
-            logging.info(f"Disconnecting {self.block} from "
-                         f"{self.connected_output.block}")
+            logging.info("Disconnecting %s from %s", self.block,
+                         self.connected_output.block)
         io_registry.Registry.disconnect_input(self)
 
     @property
@@ -73,7 +74,7 @@ class Input:
         """
         self.block = None
         io_registry.Registry.remove_input(self)
-        logging.info(f"Deleting {self}")
+        logging.info("Deleting %s", self)
 
 
 class Output:
@@ -98,8 +99,13 @@ class Output:
                                               metadata should be used.
         initial_metadata: MetaData of the attribute data.
         id: Used to identify the Inputs which were connected to the Output
-            after saving.
+            after saving. Gets generated on first access.
     """
+    __slots__ = ("name", "block", "up_to_date", "data",
+                 "user_metadata_required", "_user_metadata",
+                 "_process_metadata", "_use_process_abscissa_metadata",
+                 "_use_process_ordinate_metadata", "_metadata",
+                 "_metadata_versions", "_metadata_version", "_id")
 
     def __init__(self, block=None, initial_metadata=None, name=None,
                  user_metadata_required=False):
@@ -118,6 +124,10 @@ class Output:
         self.up_to_date = True
         self.data = None
         self.user_metadata_required = user_metadata_required
+        self._metadata = None
+        self._metadata_versions = None
+        self._metadata_version = None
+        self._id = None
 
         if user_metadata_required:
             self.use_process_abscissa_metadata = False
@@ -133,8 +143,6 @@ class Output:
 
         self.process_metadata = None
 
-        self.id = uuid.uuid4()
-
     @property
     def metadata(self):
         """Get the currently used metadata of the Output.
@@ -151,7 +159,24 @@ class Output:
         returned.
 
         The name of the user_metadata is taken by default.
+
+        The resolved metadata is cached until the user_metadata, the
+        process_metadata or one of the flags change. The returned metadata
+        should not be modified.
         """
+        process_version = None
+        if self._process_metadata is not None:
+            process_version = self._process_metadata.version
+        versions = (self._user_metadata.version, process_version)
+        if self._metadata is None or versions != self._metadata_versions \
+                or self._metadata.version != self._metadata_version:
+            self._metadata = self._resolve_metadata()
+            self._metadata_versions = versions
+            self._metadata_version = self._metadata.version
+        return self._metadata
+
+    def _resolve_metadata(self):
+        """Constructs the currently used metadata of the Output."""
         if self.use_process_abscissa_metadata and self.process_metadata is not None:
             unit_a = self.process_metadata.unit_a
             symbol_a = ""
@@ -184,9 +209,56 @@ class Output:
                                    fixed_unit_a=fixed_unit_a,
                                    fixed_unit_o=fixed_unit_o)
 
+    @property
+    def id(self):
+        """Unique id of the Output. Only generated when it is needed."""
+        if self._id is None:
+            self._id = uuid.uuid4()
+        return self._id
+
+    @property
+    def user_metadata(self):
+        """Gets or sets the user_metadata."""
+        return self._user_metadata
+
+    @user_metadata.setter
+    def user_metadata(self, value):
+        self._user_metadata = value
+        self._metadata = None
+
+    @property
+    def process_metadata(self):
+        """Gets or sets the process_metadata."""
+        return self._process_metadata
+
+    @process_metadata.setter
+    def process_metadata(self, value):
+        self._process_metadata = value
+        self._metadata = None
+
+    @property
+    def use_process_abscissa_metadata(self):
+        """Gets or sets the use_process_abscissa_metadata flag."""
+        return self._use_process_abscissa_metadata
+
+    @use_process_abscissa_metadata.setter
+    def use_process_abscissa_metadata(self, value):
+        self._use_process_abscissa_metadata = value
+        self._metadata = None
+
+    @property
+    def use_process_ordinate_metadata(self):
+        """Gets or sets the use_process_ordinate_metadata flag."""
+        return self._use_process_ordinate_metadata
+
+    @use_process_ordinate_metadata.setter
+    def use_process_ordinate_metadata(self, value):
+        self._use_process_ordinate_metadata = value
+        self._metadata = None
+
     def disconnect(self):
         """Disconnects itself from all Inputs."""
-        logging.info(f"Disconnecting {self.block} from all inputs.")
+        logging.info("Disconnecting %s from all inputs.", self.block)
         io_registry.Registry.disconnect_output(self)
 
     def delete(self):
@@ -195,4 +267,4 @@ class Output:
         """
         self.block = None
         io_registry.Registry.remove_output(self)
-        logging.info(f"Deleting {self}")
+        logging.info("Deleting %s", self)
@@ -0,0 +1,241 @@
+"""Catalogue of all available block classes.
+
+Besides the blocks of :mod:`mca.blocks` other packages can provide blocks
+with entry points of the group ``mca.blocks``, e.g. in their setup.py:
+
+.. code-block:: python
+
+    entry_points={"mca.blocks": ["my_block = my_package.blocks:MyBlock"]}
+
+The name, description and tags of plugin blocks are cached in a manifest
+file so that plugin modules are only imported when one of their blocks is
+created or loaded.
+"""
+import importlib
+import importlib.metadata
+import json
+import logging
+import os
+
+import appdirs
+
+from mca import exceptions
+
+entry_point_group = "mca.blocks"
+
+
+class BlockSpec:
+    """Description of a block class which can be displayed without importing
+    the module of the class. Calling the spec creates a block instance.
+
+    Attributes:
+        class_path (str): Module and name of the class separated by a colon,
+                          e.g. "mca.blocks.adder:Adder".
+        name (str): Name of the block.
+        description (str): Description of the block.
+        tags (tuple): Tags of the block.
+        icon_file (str): File name of the icon of the block.
+    """
+    def __init__(self, class_path, name, description="", tags=(),
+                 icon_file=None, block_class=None):
+        """Initializes BlockSpec.
+
+        Args:
+            class_path (str): Module and name of the class separated by a
+                              colon.
+            name (str): Name of the block.
+            description (str): Description of the block.
+            tags (tuple): Tags of the block.
+            icon_file (str): File name of the icon of the block.
+            block_class: Class of the block if it is already imported.
+        """
+        self.class_path = class_path
+        self.name = name
+        self.description = description
+        self.tags = tuple(tags)
+        self.icon_file = icon_file
+        self._block_class = block_class
+
+    @classmethod
+    def from_class(cls, block_class):
+        """Creates the spec of an imported block class."""
+        return cls(f"{block_class.__module__}:{block_class.__qualname__}",
+                   name=block_class.name,
+                   description=getattr(block_class, "description", ""),
+                   tags=block_class.tags,
+                   icon_file=block_class.icon_file,
+                   block_class=block_class)
+
+    @classmethod
+    def from_dict(cls, spec_dict):
+        """Creates a spec from a dict created by :meth:`to_dict`."""
+        return cls(**spec_dict)
+
+    def to_dict(self):
+        """Returns the spec as a dict which can be dumped as json."""
+        return {"class_path": self.class_path,
+                "name": self.name,
+                "description": self.description,
+                "tags": list(self.tags),
+                "icon_file": self.icon_file}
+
+    @property
+    def class_string(self):
+        """String of the class as stored in save files, equal to
+        ``str(block_class)``.
+        """
+        return "<class '{}'>".format(self.class_path.replace(":", "."))
+
+    @property
+    def loaded(self):
+        """True, if the class has been imported."""
+        return self._block_class is not None
+
+    def load(self):
+        """Imports and returns the block class.
+
+        Raises:
+            :class:`~mca.exceptions.DataLoadingError`: If the class could not
+                                                        be imported.
+        """
+        if self._block_class is None:
+            module_name, _, class_name = self.class_path.partition(":")
+            try:
+                block_class = importlib.import_module(module_name)
+                for attribute in class_name.split("."):
+                    block_class = getattr(block_class, attribute)
+            except (ImportError, AttributeError) as error:
+                raise exceptions.DataLoadingError(
+                    f"Could not import block {self.class_path}: {error}")
+            self._block_class = block_class
+        return self._block_class
+
+    def __call__(self, **kwargs):
+        """Imports the block class if needed and creates a block."""
+        return self.load()(**kwargs)
+
+
+class BlockRegistry:
+    """Holds the specs of the built-in blocks and of the plugin blocks. The
+    blocks are discovered on first access.
+
+    Attributes:
+        manifest_path (str): Path of the json file caching the specs of the
+                             plugin blocks.
+    """
+    def __init__(self, manifest_path=None):
+        """Initializes BlockRegistry.
+
+        Args:
+            manifest_path (str): Path of the manifest file. Defaults to the
+                                 user cache directory.
+        """
+        if manifest_path is None:
+            manifest_path = os.path.join(appdirs.user_cache_dir("mca"),
+                                         "block_manifest.json")
+        self.manifest_path = manifest_path
+        self._specs = None
+
+    @property
+    def specs(self):
+        """Dict mapping the class strings of all blocks to their
+        :class:`.BlockSpec` sorted by the block names.
+        """
+        if self._specs is None:
+            self.discover()
+        return self._specs
+
+    def discover(self):
+        """Collects the built-in blocks and the blocks of the entry points.
+        Plugin modules are only imported if their entry point is not in the
+        manifest yet.
+        """
+        from mca import blocks
+        specs = [BlockSpec.from_class(block_class)
+                 for block_class in blocks.block_classes]
+        manifest = self._read_manifest()
+        new_manifest = {}
+        for entry_point in plugin_entry_points():
+            key = manifest_key(entry_point)
+            if key in manifest:
+                spec = BlockSpec.from_dict(manifest[key])
+            else:
+                logging.info("Importing plugin block %s", entry_point.value)
+                try:
+                    spec = BlockSpec.from_class(entry_point.load())
+                except Exception as error:
+                    logging.warning("Could not load plugin block %s: %r",
+                                    entry_point.value, error)
+                    continue
+            new_manifest[key] = spec.to_dict()
+            specs.append(spec)
+        if new_manifest != manifest:
+            self._write_manifest(new_manifest)
+        specs.sort(key=lambda spec: spec.name)
+        self._specs = {spec.class_string: spec for spec in specs}
+
+    def block_specs(self):
+        """Returns the specs of all blocks sorted by their names."""
+        return list(self.specs.values())
+
+    def tag_dict(self):
+        """Returns a dict mapping the sorted tags to the specs of the blocks
+        possessing the tag.
+        """
+        tag_dict = {}
+        for spec in self.specs.values():
+            for tag in spec.tags:
+                tag_dict.setdefault(tag, []).append(spec)
+        return dict(sorted(tag_dict.items()))
+
+    def get_spec(self, class_string):
+        """Returns the spec of a block class.
+
+        Args:
+            class_string (str): String of the class as stored in save files.
+        Raises:
+            :class:`~mca.exceptions.DataLoadingError`: If no block with the
+                                                        class exists.
+        """
+        try:
+            return self.specs[class_string]
+        except KeyError:
+            raise exceptions.DataLoadingError(
+                f"Unknown block {class_string}")
+
+    def _read_manifest(self):
+        """Returns the cached specs of the plugin blocks."""
+        try:
+            with open(self.manifest_path, "r") as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest):
+        """Writes the specs of the plugin blocks to the manifest file.
+        Failing to write the cache is not an error.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            with open(self.manifest_path, "w") as manifest_file:
+                json.dump(manifest, manifest_file)
+        except OSError as error:
+            logging.warning("Could not write block manifest: %s", error)
+
+
+def plugin_entry_points():
+    """Returns the entry points of the group ``mca.blocks``."""
+    return importlib.metadata.entry_points(group=entry_point_group)
+
+
+def manifest_key(entry_point):
+    """Returns the key of an entry point in the manifest. The key contains
+    the version of the distribution so updated plugins are imported again.
+    """
+    dist = getattr(entry_point, "dist", None)
+    version = f"{dist.name}=={dist.version}" if dist else ""
+    return f"{version} {entry_point.value}"
+
+
+# The block registry should be handled as a singleton
+Blocks = BlockRegistry()
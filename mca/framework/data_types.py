@@ -1,3 +1,6 @@
+import functools
+import operator
+
 from dsch import schema
 import numpy as np
 from united import Unit
@@ -20,6 +23,7 @@ class Signal:
         increment (float): Increment between two values.
         ordinate : Ordinate as a :py:class:`numpy.ndarray` .
     """
+    __slots__ = ("abscissa_start", "values", "increment", "ordinate")
 
     def __init__(self, abscissa_start, values, increment, ordinate):
         """Initializes Signal.
@@ -84,8 +88,12 @@ class MetaData:
         quantity_o (str): Quantity of the ordinate.
         symbol_a (str): Symbol of the abscissa.
         symbol_o (str): Symbol of the ordinate.
-
+        version (int): Incremented whenever an attribute of the metadata
+                       gets set.
     """
+    __slots__ = ("version", "name", "_unit_a", "_unit_o", "quantity_a",
+                 "quantity_o", "symbol_a", "symbol_o", "fixed_unit_a",
+                 "fixed_unit_o")
 
     def __init__(self, name, unit_a, unit_o, quantity_a="", quantity_o="",
                  symbol_a="", symbol_o="", fixed_unit_a=False,
@@ -107,6 +115,7 @@ class MetaData:
                                  'united'. Only  works if the passed unit is a
                                  string.
         """
+        self.version = 0
         self.name = name
         if isinstance(unit_a, Unit):
             self._unit_a = unit_a
@@ -158,6 +167,12 @@ class MetaData:
         elif isinstance(value, str):
             self._unit_o = string_to_unit(value, fixed_unit=self.fixed_unit_a)
 
+    def __setattr__(self, name, value):
+        """Sets the attribute and increments the version."""
+        object.__setattr__(self, name, value)
+        if name != "version":
+            object.__setattr__(self, "version", self.version + 1)
+
     def __eq__(self, other):
         """Defines equality of two Metadata objects."""
         if not isinstance(other, self.__class__):
@@ -177,9 +192,11 @@ class MetaData:
         return True
 
 
+@functools.lru_cache(maxsize=256)
 def string_to_unit(string, fixed_unit=False):
     """Converts a string fraction to an Unit object. The string has to be
-    in a certain format.
+    in a certain format. Results are cached and the returned Unit objects
+    must not be modified.
 
     Example:
          >>> string_1 = "(V*s)/(A*C)"
@@ -208,6 +225,53 @@ def string_to_unit(string, fixed_unit=False):
     return Unit(numerator, denominator, fix_repr=fixed_unit)
 
 
+# Results of unit arithmetic which are reused for equal operands
+_unit_operation_results = {}
+
+
+def _unit_key(operand):
+    """Returns a hashable key of a unit operand."""
+    if isinstance(operand, Unit):
+        return (tuple(repr(x) for x in operand.numerators),
+                tuple(repr(x) for x in operand.denominators))
+    return operand
+
+
+def _unit_operation(operator_, *operands):
+    """Applies the operator to the operands and interns the resulting
+    Unit. The returned Unit objects must not be modified.
+
+    Args:
+        operator_: Function of the :mod:`operator` module.
+        operands: Units or numbers to apply the operator to.
+    """
+    key = (operator_,) + tuple(_unit_key(operand) for operand in operands)
+    result = _unit_operation_results.get(key)
+    if result is None:
+        if len(_unit_operation_results) >= 1024:
+            _unit_operation_results.clear()
+        result = operator_(*operands)
+        _unit_operation_results[key] = result
+    return result
+
+
+def multiply_units(unit_1, unit_2):
+    """Returns the interned product of two units."""
+    return _unit_operation(operator.mul, unit_1, unit_2)
+
+
+def divide_units(unit_1, unit_2):
+    """Returns the interned quotient of two units. The dividend can also be
+    1 to get the reciprocal of a unit.
+    """
+    return _unit_operation(operator.truediv, unit_1, unit_2)
+
+
+def power_unit(unit, exponent):
+    """Returns the interned power of a unit."""
+    return _unit_operation(operator.pow, unit, exponent)
+
+
 def default_metadata():
     return MetaData(
         name="",
@@ -0,0 +1,222 @@
+import numpy as np
+from scipy import signal as sgn
+
+# Amount of values evaluated at once. Small enough for the temporary arrays
+# of a chunk to stay in the CPU cache.
+CHUNK_SIZE = 2 ** 16
+
+
+def abscissa_chunks(abscissa_start, values, increment, chunk_size=CHUNK_SIZE):
+    """Yields the abscissa of an equidistant signal in chunks. The abscissa
+    values are computed by index arithmetic as
+    ``abscissa_start + index * increment``. The yielded array is reused for
+    every chunk and must not be kept by the caller.
+
+    Args:
+        abscissa_start (float): First value of the abscissa.
+        values (int): Amount of values of the abscissa.
+        increment (float): Increment between two values.
+        chunk_size (int): Maximum amount of values of a chunk.
+    Yields:
+        tuple: Index of the first value of the chunk and the abscissa chunk.
+    """
+    steps = np.arange(min(chunk_size, values)) * increment
+    abscissa = np.empty_like(steps)
+    for index in range(0, values, chunk_size):
+        length = min(chunk_size, values - index)
+        np.add(steps[:length], abscissa_start + index * increment,
+               out=abscissa[:length])
+        yield index, abscissa[:length]
+
+
+def generate(kernel, abscissa_start, values, increment, outputs=1,
+             dtype=np.float64, chunk_size=CHUNK_SIZE):
+    """Generates ordinates by evaluating a kernel chunk by chunk. The result
+    arrays are allocated once and the kernel writes each chunk directly into
+    them.
+
+    Args:
+        kernel: Function called with an abscissa chunk and one output chunk
+                per generated ordinate. It has to write the ordinate values
+                into the output chunks, e.g. by using the out argument of
+                numpy ufuncs. The abscissa chunk may be overwritten.
+        abscissa_start (float): First value of the abscissa.
+        values (int): Amount of values to generate.
+        increment (float): Increment between two values.
+        outputs (int): Amount of ordinates the kernel generates.
+        dtype: Data type of the ordinates.
+        chunk_size (int): Maximum amount of values evaluated at once.
+    Returns:
+        The generated ordinate or a tuple of ordinates if outputs is larger
+        than 1.
+    """
+    ordinates = tuple(np.empty(values, dtype=dtype) for _ in range(outputs))
+    for index, abscissa in abscissa_chunks(abscissa_start, values, increment,
+                                           chunk_size):
+        kernel(abscissa, *(ordinate[index:index + len(abscissa)]
+                           for ordinate in ordinates))
+    if outputs == 1:
+        return ordinates[0]
+    return ordinates
+
+
+def index_range(abscissa_start, values, increment, lower, upper):
+    """Returns the indices of the first value greater or equal to lower and
+    of the first value greater or equal to upper of an equidistant abscissa.
+    Both indices are limited to the range of the abscissa.
+
+    Args:
+        abscissa_start (float): First value of the abscissa.
+        values (int): Amount of values of the abscissa.
+        increment (float): Increment between two values.
+        lower (float): Lower limit of the range.
+        upper (float): Upper limit of the range, excluded.
+    Returns:
+        tuple: Start and stop index of the range.
+    """
+    def first_index(limit):
+        index = int(np.clip(np.ceil((limit - abscissa_start) / increment),
+                            0, values))
+        # Correct rounding errors of the division
+        while index > 0 and abscissa_start + (index - 1) * increment >= limit:
+            index -= 1
+        while index < values and abscissa_start + index * increment < limit:
+            index += 1
+        return index
+    start = first_index(lower)
+    return start, max(start, first_index(upper))
+
+
+def sine_kernel(amp, freq, phase):
+    """Returns a kernel generating ``amp * sin(2 pi freq t - phase)``.
+
+    Args:
+        amp (float): Amplitude.
+        freq (float): Frequency.
+        phase (float): Phase in radians.
+    """
+    def kernel(abscissa, ordinate):
+        _angle(abscissa, freq, phase, ordinate)
+        np.sin(ordinate, out=ordinate)
+        np.multiply(ordinate, amp, out=ordinate)
+    return kernel
+
+
+def rect_kernel(amp, freq, phase):
+    """Returns a kernel generating the periodic rectangle
+    ``amp * sign(sin(2 pi freq t - phase))``.
+
+    Args:
+        amp (float): Amplitude.
+        freq (float): Frequency.
+        phase (float): Phase in radians.
+    """
+    def kernel(abscissa, ordinate):
+        _angle(abscissa, freq, phase, ordinate)
+        np.sin(ordinate, out=ordinate)
+        np.sign(ordinate, out=ordinate)
+        np.multiply(ordinate, amp, out=ordinate)
+    return kernel
+
+
+def triangle_kernel(amp, freq, phase):
+    """Returns a kernel generating a periodic triangle which is in phase with
+    :func:`sine_kernel`. Equal to
+    ``amp * scipy.signal.sawtooth(2 pi freq t - phase + pi/2, 0.5)``.
+
+    Args:
+        amp (float): Amplitude.
+        freq (float): Frequency.
+        phase (float): Phase in radians.
+    """
+    def kernel(abscissa, ordinate):
+        _angle(abscissa, freq, phase - np.pi / 2, ordinate)
+        # Position within the period scaled to [-1, 1)
+        np.mod(ordinate, 2 * np.pi, out=ordinate)
+        np.multiply(ordinate, 1 / np.pi, out=ordinate)
+        np.subtract(ordinate, 1, out=ordinate)
+        np.abs(ordinate, out=ordinate)
+        np.multiply(ordinate, -2 * amp, out=ordinate)
+        np.add(ordinate, amp, out=ordinate)
+    return kernel
+
+
+def pulse_triangle_kernel(height, width, shift):
+    """Returns a kernel generating a single triangle with the given height
+    whose peak lies at shift. The kernel only has to be evaluated within
+    the width of the triangle.
+
+    Args:
+        height (float): Height of the peak.
+        width (float): Width of the triangle.
+        shift (float): Position of the peak.
+    """
+    def kernel(abscissa, ordinate):
+        np.subtract(abscissa, shift, out=ordinate)
+        np.abs(ordinate, out=ordinate)
+        np.multiply(ordinate, -2 * height / width, out=ordinate)
+        np.add(ordinate, height, out=ordinate)
+    return kernel
+
+
+def chirp_kernel(amp, freq1, freq2, end, phase, method):
+    """Returns a kernel generating an amplified chirp with
+    :func:`scipy.signal.chirp`.
+
+    Args:
+        amp (float): Amplitude.
+        freq1 (float): Frequency at the abscissa value 0.
+        freq2 (float): Frequency at the abscissa value end.
+        end (float): Abscissa value at which freq2 is reached.
+        phase (float): Phase in degrees.
+        method (str): Kind of the frequency sweep.
+    """
+    def kernel(abscissa, ordinate):
+        ordinate[:] = sgn.chirp(t=abscissa, f0=freq1, t1=end, f1=freq2,
+                                phi=phase, method=method)
+        np.multiply(ordinate, amp, out=ordinate)
+    return kernel
+
+
+def gauss_pulse_kernel(amp, center_freq, frac_bw, ref_level):
+    """Returns a kernel generating the in-phase component, the quadrature
+    component and the envelope of an amplified gaussian modulated sinusoid.
+    Equal to :func:`scipy.signal.gausspulse` with retquad and retenv.
+
+    Args:
+        amp (float): Amplitude.
+        center_freq (float): Center frequency.
+        frac_bw (float): Fractional bandwidth.
+        ref_level (float): Reference level of the bandwidth in dB.
+    Raises:
+        ValueError: If the parameters are invalid for a gaussian pulse.
+    """
+    if center_freq < 0:
+        raise ValueError(f"Center frequency (fc={center_freq:.2f}) must be "
+                         f">=0.")
+    if frac_bw <= 0:
+        raise ValueError(f"Fractional bandwidth (bw={frac_bw:.2f}) must be "
+                         f"> 0.")
+    if ref_level >= 0:
+        raise ValueError(f"Reference level for bandwidth "
+                         f"(bwr={ref_level:.2f}) must be < 0 dB")
+    ref = pow(10.0, ref_level / 20.0)
+    a = -(np.pi * center_freq * frac_bw) ** 2 / (4.0 * np.log(ref))
+
+    def kernel(abscissa, real, imag, envelope):
+        np.multiply(abscissa, abscissa, out=envelope)
+        np.multiply(envelope, -a, out=envelope)
+        np.exp(envelope, out=envelope)
+        np.multiply(envelope, amp, out=envelope)
+        np.multiply(abscissa, 2 * np.pi * center_freq, out=abscissa)
+        np.cos(abscissa, out=real)
+        np.multiply(real, envelope, out=real)
+        np.sin(abscissa, out=imag)
+        np.multiply(imag, envelope, out=imag)
+    return kernel
+
+
+def _angle(abscissa, freq, phase, out):
+    """Writes the angle ``2 pi freq t - phase`` to out."""
+    np.multiply(abscissa, 2 * np.pi * freq, out=out)
+    np.subtract(out, phase, out=out)
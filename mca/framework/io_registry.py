@@ -1,7 +1,10 @@
+import contextlib
+import weakref
+
 import networkx as nx
 
 from mca import exceptions
-from mca.framework import block_io
+from mca.framework import block_io, profiler
 
 
 class IORegistry:
@@ -12,11 +15,177 @@ class IORegistry:
     Attributes:
         _graph: `Networkx DiGraph <https://networkx.org/documentation/stable/reference/classes/digraph>`_ which is base of
                 IORegistry.
+        _batch_depth (int): Number of currently entered :meth:`batch`
+                            contexts.
+        _pending_blocks (dict): Blocks whose update has been deferred by
+                                :meth:`batch`. Used as an ordered set.
+        version (int): Counter which is increased every time nodes or edges
+                       are added or removed.
+        pull_mode (bool): True, if blocks are only processed when their data
+                          is needed. In this mode changes only invalidate
+                          the affected blocks and just the blocks which are
+                          :attr:`.Block.observed` or requested with
+                          :meth:`pull` are processed. Use
+                          :meth:`set_pull_mode` to change the mode.
+        _outdated_blocks: Blocks which have been changed in pull mode and
+                          have not been processed yet. Blocks are only
+                          weakly referenced.
     """
 
     def __init__(self):
         """Initializes the IORegistry."""
         self._graph = nx.DiGraph()
+        self._batch_depth = 0
+        self._pending_blocks = {}
+        self.version = 0
+        self.pull_mode = False
+        self._outdated_blocks = weakref.WeakKeyDictionary()
+
+    def set_pull_mode(self, enabled):
+        """Enables or disables the pull mode. When disabling the pull mode
+        all outdated blocks are processed.
+
+        Args:
+            enabled (bool): True, if blocks should only be processed when
+                            their data is needed.
+        """
+        self.pull_mode = enabled
+        if not enabled:
+            self.update_outdated_blocks()
+
+    def is_outdated(self, block):
+        """Returns True, if the block has to be processed to bring its data
+        up-to-date.
+
+        Args:
+            block: Block to check.
+        """
+        return block in self._outdated_blocks or \
+            not all(output.up_to_date for output in block.outputs) or \
+            not all(input_.up_to_date for input_ in block.inputs)
+
+    def pull(self, block, process_block=True):
+        """Brings the data of a block up-to-date. Processes the outdated
+        blocks the block depends on in topological order and the block
+        itself if it is outdated. Used to request data in pull mode, but can
+        be called in any mode.
+
+        Args:
+            block: Block whose data is needed.
+            process_block (bool): False, if only the blocks the inputs of
+                                  the block depend on should be processed.
+        """
+        nodes = set()
+        for input_ in block.inputs:
+            nodes.add(input_)
+            nodes.update(nx.ancestors(self._graph, input_))
+        required_blocks = {}
+        for node in nx.topological_sort(self._graph.subgraph(nodes)):
+            if isinstance(node, block_io.Output) and \
+                    self.is_outdated(node.block):
+                required_blocks[node.block] = None
+        if process_block:
+            required_blocks[block] = None
+        with profiler.Profiler.span("pull"):
+            for required_block in required_blocks:
+                if self.is_outdated(required_block):
+                    self._update_block(required_block)
+
+    def update_outdated_blocks(self):
+        """Processes all outdated blocks in topological order."""
+        # Ordered set of the outdated blocks. A block is moved to the end
+        # whenever one of its nodes occurs so the blocks end up being ordered
+        # by their last node in the topological order
+        outdated_blocks = {}
+        for node in nx.topological_sort(self._graph):
+            if self.is_outdated(node.block):
+                outdated_blocks.pop(node.block, None)
+                outdated_blocks[node.block] = None
+        # Blocks without any inputs and outputs are not part of the graph
+        for block in list(self._outdated_blocks):
+            if not block.inputs and not block.outputs:
+                outdated_blocks[block] = None
+        for block in outdated_blocks:
+            self._update_block(block)
+
+    def _update_block(self, block):
+        """Takes over the flags of the connected Outputs to the Inputs of
+        the block and updates it.
+
+        Args:
+            block: Block to update.
+        """
+        for input_ in block.inputs:
+            output = self.get_output(input_)
+            input_.up_to_date = output is None or output.up_to_date
+        block.update()
+        if all(output.up_to_date for output in block.outputs):
+            self._outdated_blocks.pop(block, None)
+
+    def _pull_observed(self, blocks):
+        """Marks the given blocks as outdated and pulls the data of those
+        which are observed.
+
+        Args:
+            blocks: Blocks affected by a change.
+        """
+        for block in blocks:
+            self._outdated_blocks[block] = None
+        for block in list(blocks):
+            if block.observed:
+                self.pull(block)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Context manager which defers all invalidations and updates until
+        the outermost batch is exited. Afterwards each affected block is
+        updated exactly once in topological order. Batches can be nested.
+
+        Example:
+            >>> with Registry.batch():
+            ...     block_1.inputs[0].connect(block_0.outputs[0])
+            ...     block_2.inputs[0].connect(block_0.outputs[0])
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                with profiler.Profiler.span("batch"):
+                    self._update_pending_blocks()
+
+    def _update_pending_blocks(self):
+        """Invalidates the outputs of all pending blocks and their
+        descendants and updates every affected block once in topological
+        order.
+        """
+        pending_blocks = self._pending_blocks
+        self._pending_blocks = {}
+        invalid_nodes = set()
+        # Ordered set of the affected blocks. A block is moved to the end
+        # whenever one of its nodes occurs so the blocks end up being ordered
+        # by their last node in the topological order
+        affected_blocks = {}
+        for node in nx.topological_sort(self._graph):
+            if (node.block in pending_blocks and
+                    isinstance(node, block_io.Output)) or any(
+                    predecessor in invalid_nodes
+                    for predecessor in self._graph.predecessors(node)):
+                node.up_to_date = False
+                invalid_nodes.add(node)
+            if node.block in pending_blocks or node in invalid_nodes:
+                affected_blocks.pop(node.block, None)
+                affected_blocks[node.block] = None
+        # Blocks without any inputs and outputs are not part of the graph
+        for block in pending_blocks:
+            if block is not None and not block.inputs and not block.outputs:
+                affected_blocks[block] = None
+        if self.pull_mode:
+            self._pull_observed(affected_blocks)
+            return
+        for block in affected_blocks:
+            self._update_block(block)
 
     def _invalidate_descendants(self, output):
         """Sets a flag of the output itself and all descendants to indicate
@@ -53,14 +222,28 @@ class IORegistry:
         inconsistency. This method flags and updates blocks with an algorithm
         that ensures every Block updates itself only once in the process.
         
+        Within a :meth:`batch` the block is only marked to be updated when
+        the batch is exited.
+
         Args:
             block (:class:`.Block`): Block in which the change occurred.
         """
-        for output in block.outputs:
-            self._invalidate_descendants(output)
-        block.update()
-        for output in block.outputs:
-            self._update_descendants(output)
+        if self._batch_depth:
+            self._pending_blocks[block] = None
+            return
+        with profiler.Profiler.span("invalidate_and_update"):
+            for output in block.outputs:
+                self._invalidate_descendants(output)
+            if self.pull_mode:
+                affected_blocks = {block: None}
+                for output in block.outputs:
+                    for descendant in nx.descendants(self._graph, output):
+                        affected_blocks[descendant.block] = None
+                self._pull_observed(affected_blocks)
+                return
+            block.update()
+            for output in block.outputs:
+                self._update_descendants(output)
 
     def add_node(self, node):
         """Adds an Input or Output to the registry.
@@ -72,6 +255,7 @@ class IORegistry:
             The node which has been added to the structure.
         """
         self._graph.add_node(node)
+        self.version += 1
         if isinstance(node, block_io.Output):
             for input_ in node.block.inputs:
                 self._graph.add_edge(input_, node)
@@ -89,6 +273,7 @@ class IORegistry:
         """
         self.disconnect_input(input_)
         self._graph.remove_node(input_)
+        self.version += 1
 
     def remove_output(self, output):
         """Disconnects and removes an Output from the registry.
@@ -98,6 +283,7 @@ class IORegistry:
         """
         self.disconnect_output(output)
         self._graph.remove_node(output)
+        self.version += 1
 
     def connect(self, output, input_):
         """Connects an Output to an Input.
@@ -127,6 +313,7 @@ class IORegistry:
             # Remove the edge
             self._graph.remove_edge(output, input_)
             raise exceptions.BlockCircleError(input_.block)
+        self.version += 1
         # Update the blocks
         self.invalidate_and_update(input_.block)
 
@@ -139,6 +326,7 @@ class IORegistry:
         output = list(self._graph.predecessors(input_))
         if output:
             self._graph.remove_edge(output[0], input_)
+            self.version += 1
             self.invalidate_and_update(input_.block)
 
     def disconnect_output(self, output):
@@ -150,6 +338,12 @@ class IORegistry:
         inputs = [x for x in self._graph.neighbors(output)]
         for input_ in inputs:
             self._graph.remove_edge(output, input_)
+        if inputs:
+            self.version += 1
+        if self._batch_depth or self.pull_mode:
+            for input_ in inputs:
+                self.invalidate_and_update(input_.block)
+            return
         for input_ in inputs:
             for output in input_.block.outputs:
                 self._invalidate_descendants(output)
@@ -159,6 +353,22 @@ class IORegistry:
             for output in input_.block.outputs:
                 self._update_descendants(output)
 
+    def get_descendant_blocks(self, block):
+        """Returns the blocks which depend on the data of the given block in
+        topological order.
+
+        Args:
+            block: Block whose descendants should be returned.
+        """
+        descendants = set()
+        for output in block.outputs:
+            descendants.update(nx.descendants(self._graph, output))
+        blocks = {}
+        for node in nx.topological_sort(self._graph.subgraph(descendants)):
+            blocks[node.block] = None
+        blocks.pop(block, None)
+        return list(blocks)
+
     def get_output(self, input_):
         """Returns the connected Output from an Input.
         
@@ -173,6 +383,9 @@ class IORegistry:
         from the IORegistry.
         """
         self._graph.clear()
+        self._pending_blocks = {}
+        self._outdated_blocks = weakref.WeakKeyDictionary()
+        self.version += 1
 
     def get_all_blocks(self):
         """Returns all blocks currently in the IORegistry."""
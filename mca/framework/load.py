@@ -1,8 +1,9 @@
 import json
 import logging
 
-from mca import exceptions, blocks
-from mca.framework import io_registry, block_io, data_types
+from mca import exceptions
+from mca.framework import io_registry, block_io, block_registry, \
+    data_types, parameters
 
 
 def load_block_structure(file_path):
@@ -14,7 +15,7 @@ def load_block_structure(file_path):
     Returns:
         list: List of blocks created by the save file.
     """
-    logging.info(f"Loading block structure from {file_path}")
+    logging.info("Loading block structure from %s", file_path)
     if io_registry.Registry.get_all_blocks():
         raise exceptions.DataLoadingError("Cannot load block structure"
                                           "into an existing structure.")
@@ -24,75 +25,79 @@ def load_block_structure(file_path):
     return block_structure
 
 
-def json_to_blocks(json_string):
+def json_to_blocks(json_string, copy=False):
+    """Creates the blocks described by a json string generated by
+    :func:`.blocks_to_json`.
+
+    All updates are deferred with :meth:`.IORegistry.batch`. Once the whole
+    structure is wired every created block is evaluated exactly once in
+    topological order.
+
+    Args:
+        json_string (str): json-formatted string of the block structure.
+        copy (bool): True, if the blocks are copies of existing blocks.
+                     The :attr:`~.Block.unique_parameters` of copies keep
+                     the values of the newly created blocks.
+
+    Returns:
+        list: List of blocks created by the json string.
+    """
     # Load the json
     load_data = json.loads(json_string)
-    # Create dict which maps strings to block classes
-    str_to_block_types = {str(block_class): block_class
-                          for block_class in blocks.block_classes}
     block_structure = []
-    # Create all blocks in the save file
-    for block_save in load_data["blocks"]:
-        # Create a block instance
-        block_instance = str_to_block_types[block_save["class"]]()
-        block_structure.append(block_instance)
-        # Pass the saved gui data
-        block_instance.gui_data["save_data"] = block_save["gui_data"]
-        # Set the values for the parameters and the plot_parameters
-        for parameter_name, parameter in block_save["parameters"].items():
-            if isinstance(parameter, dict):
-                for sub_parameter_name, sub_parameter in parameter.items():
-                    block_instance.parameters[parameter_name].parameters[
-                        sub_parameter_name].value = sub_parameter
-            else:
-                block_instance.parameters[parameter_name].value = parameter
-        for parameter_name, parameter in block_save["plot_parameters"].items():
-            if isinstance(parameter, dict):
-                for sub_parameter_name, sub_parameter in parameter.items():
-                    block_instance.plot_parameters[parameter_name].parameters[
-                        sub_parameter_name].value = sub_parameter
-            else:
-                block_instance.plot_parameters[parameter_name].value = parameter
-        # Add additional outputs in case of a DynamicBlock
-        for index, input_save in enumerate(block_save["inputs"]):
-            if index + 1 > len(block_instance.inputs):
-                block_instance.add_input(block_io.Input(block_instance))
-        # Set the user metadata for the outputs
-        for index, output_save in enumerate(block_save["outputs"]):
-            metadata = data_types.MetaData(
-                output_save["metadata"]["signal_name"],
-                output_save["metadata"]["unit_a"],
-                output_save["metadata"]["unit_o"],
-                output_save["metadata"]["quantity_a"],
-                output_save["metadata"]["quantity_o"],
-                output_save["metadata"]["symbol_a"],
-                output_save["metadata"]["symbol_o"],
-            )
-            if index + 1 > len(block_instance.outputs):
-                block_instance.add_output(block_io.Output(block_instance))
-            block_instance.outputs[index].user_metadata = metadata
-            block_instance.outputs[index].use_process_abscissa_metadata = output_save[
-                "use_process_abscissa_metadata"]
-            block_instance.outputs[index].use_process_ordinate_metadata = output_save[
-                "use_process_ordinate_metadata"]
+    # Map the saved output ids to the created outputs
+    outputs_by_id = {}
+    # Defer all updates until the structure is completely wired
+    with io_registry.Registry.batch():
+        # Create all blocks in the save file
+        for block_save in load_data["blocks"]:
+            # Create a block instance, plugin blocks are imported if needed
+            block_instance = block_registry.Blocks.get_spec(
+                block_save["class"])()
+            block_structure.append(block_instance)
+            # Pass the saved gui data
+            block_instance.gui_data["save_data"] = block_save["gui_data"]
+            # Set the values for the parameters and the plot_parameters
+            parameter_values = block_save["parameters"]
+            if copy:
+                parameter_values = {
+                    key: value for key, value in parameter_values.items()
+                    if key not in block_instance.unique_parameters}
+            block_instance.set_parameters(parameter_values, update=False)
+            parameters.set_values(block_instance.plot_parameters,
+                                  block_save["plot_parameters"])
+            # Add additional outputs in case of a DynamicBlock
+            for index, input_save in enumerate(block_save["inputs"]):
+                if index + 1 > len(block_instance.inputs):
+                    block_instance.add_input(block_io.Input(block_instance))
+            # Set the user metadata for the outputs
+            for index, output_save in enumerate(block_save["outputs"]):
+                metadata = data_types.MetaData(
+                    output_save["metadata"]["signal_name"],
+                    output_save["metadata"]["unit_a"],
+                    output_save["metadata"]["unit_o"],
+                    output_save["metadata"]["quantity_a"],
+                    output_save["metadata"]["quantity_o"],
+                    output_save["metadata"]["symbol_a"],
+                    output_save["metadata"]["symbol_o"],
+                )
+                if index + 1 > len(block_instance.outputs):
+                    block_instance.add_output(block_io.Output(block_instance))
+                output = block_instance.outputs[index]
+                output.user_metadata = metadata
+                output.use_process_abscissa_metadata = output_save[
+                    "use_process_abscissa_metadata"]
+                output.use_process_ordinate_metadata = output_save[
+                    "use_process_ordinate_metadata"]
+                outputs_by_id[output_save["id"]] = output
             block_instance.trigger_update()
-    # Connect inputs and outputs of the blocks
-    for block_index_outer, block_save_outer in enumerate(
-            load_data["blocks"]):
-        for input_index, input_save in enumerate(
-                block_save_outer["inputs"]):
-            if input_save.get("connected_output"):
-                found = False
-                for block_index_inner, block_save_inner in enumerate(
-                        load_data["blocks"]):
-                    if found:
-                        break
-                    for output_index, output_save in enumerate(
-                            block_save_inner["outputs"]):
-                        if input_save["connected_output"] == output_save["id"]:
-                            block_structure[block_index_outer].inputs[
-                                input_index].connect(
-                                block_structure[block_index_inner].outputs[
-                                    output_index])
-                            found = True
+        # Connect inputs and outputs of the blocks
+        for block_instance, block_save in zip(block_structure,
+                                              load_data["blocks"]):
+            for input_, input_save in zip(block_instance.inputs,
+                                          block_save["inputs"]):
+                output = outputs_by_id.get(
+                    input_save.get("connected_output"))
+                if output is not None:
+                    input_.connect(output)
     return block_structure
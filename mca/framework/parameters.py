@@ -12,7 +12,11 @@ class BaseParameter:
         description (str): Description of the parameter.
         parameter_block : Reference of the parameter block the parameter
                           belongs to.
+        version (int): Counter which is increased every time a value is
+                       assigned to the parameter.
     """
+    __slots__ = ("name", "unit", "_value", "description", "parameter_block",
+                 "version")
 
     def __init__(self, name, unit=None, default=None, description=None):
         """Initialize BaseParameter class.
@@ -28,6 +32,7 @@ class BaseParameter:
         self._value = default
         self.description = description
         self.parameter_block = None
+        self.version = 0
 
     def validate(self, value):
         raise NotImplementedError
@@ -44,13 +49,27 @@ class BaseParameter:
 
     @value.setter
     def value(self, val):
-        logging.info(f"Changing value of {self.name} from {self._value} "
-                     f"to {val}")
+        val = self._coerce(val)
+        logging.info("Changing value of %s from %s to %s", self.name,
+                     self._value, val)
         self.validate(val)
-        self._value = val
+        self._assign(val)
         if self.parameter_block:
             self.parameter_block.update(source=self)
 
+    def _coerce(self, val):
+        """Normalizes a value before it gets validated. Returns the value
+        unchanged by default.
+        """
+        return val
+
+    def _assign(self, val):
+        """Assigns an already validated value without notifying the
+        parameter block.
+        """
+        self._value = val
+        self.version += 1
+
 
 class FloatParameter(BaseParameter):
     """Parameter for float numbers.
@@ -60,6 +79,7 @@ class FloatParameter(BaseParameter):
         max_ (float): Maximum value of the parameter.
         default (float): Value of the parameter.
         """
+    __slots__ = ("min", "max")
 
     def __init__(self, name, min_=None, max_=None, unit=None, default=None,
                  description=None):
@@ -107,6 +127,7 @@ class IntParameter(BaseParameter):
         max (int): Maximum value of the parameter.
         default (int): Value of the parameter.
     """
+    __slots__ = ("min", "max")
 
     def __init__(self, name, min_=None, max_=None, unit=None, default=None,
                  description=None):
@@ -145,18 +166,11 @@ class IntParameter(BaseParameter):
             if value < self.min:
                 raise exceptions.OutOfBoundError(self.name)
 
-    @property
-    def value(self):
-        return super().value
-
-    @BaseParameter.value.setter
-    def value(self, val):
+    def _coerce(self, val):
+        """Converts floats without a fractional part to int."""
         if isinstance(val, float) and val.is_integer():
-            val = int(val)
-        self.validate(val)
-        self._value = val
-        if self.parameter_block:
-            self.parameter_block.update(source=self)
+            return int(val)
+        return val
 
 
 class StrParameter(BaseParameter):
@@ -166,6 +180,7 @@ class StrParameter(BaseParameter):
         default (str): Value of the parameter.
         max_length (int): Maximum length of the string.
     """
+    __slots__ = ("max_length",)
 
     def __init__(self, name, max_length=20, default=None, description=None):
         """Initialize StrParameter class.
@@ -204,6 +219,7 @@ class ChoiceParameter(BaseParameter):
         choices: List of options for the value.
         default: Value of the parameter.
     """
+    __slots__ = ("choices",)
 
     def __init__(self, name, choices, unit=None, default=None,
                  description=None):
@@ -244,6 +260,7 @@ class BoolParameter(BaseParameter):
         default (bool): Value of the Parameter.
         description (str): Description of the parameter.
     """
+    __slots__ = ()
 
     def __init__(self, name, default=None, description=None):
         """Initialize BoolParameter class.
@@ -276,6 +293,7 @@ class ActionParameter(BaseParameter):
                             the parameter. Options: edit_window, menu_action,
                             block_button.
     """
+    __slots__ = ("function", "display_options")
 
     def __init__(self, name, function, display_options=("edit_window",),
                  description=None):
@@ -303,6 +321,7 @@ class PathParameter(BaseParameter):
     Attributes:
         default: Path of the file.
     """
+    __slots__ = ("file_formats", "loading")
 
     def __init__(self, name, file_formats=None, loading=False, default="",
                  description=None):
@@ -372,6 +391,8 @@ class ParameterBlock:
         param_conversions (list): List of specified ParameterConversions.
         conversion_index (int): Current active conversion of the
                                 param_conversions.
+        version (int): Counter which is increased every time one of the
+                       included parameters changes.
     """
 
     def __init__(self, parameters, param_conversions=None,
@@ -395,6 +416,7 @@ class ParameterBlock:
         else:
             self.param_conversions = []
         self.conversion_index = default_conversion
+        self.version = 0
 
     def update(self, source):
         """Executes the current active parameter conversion.
@@ -402,8 +424,128 @@ class ParameterBlock:
         Args:
             source: Parameter which triggered the update.
         """
+        self.version += 1
+        self._convert([source])
+
+    def validate_values(self, values):
+        """Validates values for several parameters of the block.
+
+        Args:
+            values (dict): Maps the keys of the parameters to values.
+        Raises:
+            KeyError: If a parameter does not exist.
+        """
+        for key, value in values.items():
+            self.parameters[key].validate(value)
+
+    def _coerce(self, values):
+        """Returns the values normalized by their parameters."""
+        return {key: self.parameters[key]._coerce(value)
+                for key, value in values.items()}
+
+    def set_values(self, values):
+        """Assigns values to several parameters of the block at once. All
+        values are validated before any of them is assigned. The active
+        conversion is executed once after the main parameters have been
+        assigned instead of once per parameter. Values of the other
+        parameters are assigned afterwards, so given values are kept.
+
+        Example:
+            >>> abscissa.set_values({"values": 500, "increment": 0.1})
+
+        Args:
+            values (dict): Maps the keys of the parameters to values.
+        Raises:
+            KeyError: If a parameter does not exist.
+        """
+        values = self._coerce(values)
+        self.validate_values(values)
+        self._assign_values(values)
+
+    def _assign_values(self, values):
+        """Assigns already validated values and executes the active
+        conversion once.
+        """
+        logging.info("Changing values of %s to %s", self.name, values)
+        main_parameters = []
+        if self.param_conversions:
+            main_parameters = self.param_conversions[
+                self.conversion_index].main_parameters
+        sources = []
+        for key, value in values.items():
+            parameter = self.parameters[key]
+            if parameter in main_parameters:
+                parameter._assign(value)
+                sources.append(parameter)
+        self._convert(sources)
+        for key, value in values.items():
+            parameter = self.parameters[key]
+            if parameter not in main_parameters:
+                parameter._assign(value)
+        self.version += 1
+
+    def _convert(self, sources):
+        """Executes the active conversion if one of the sources is one of
+        its main parameters.
+
+        Args:
+            sources (list): Parameters which have been changed.
+        """
         if self.param_conversions:
             conversion = self.param_conversions[self.conversion_index]
-            if source in conversion.main_parameters:
-                if conversion.conversion_func:
-                    conversion.conversion_func()
+            if conversion.conversion_func and any(
+                    source in conversion.main_parameters
+                    for source in sources):
+                conversion.conversion_func()
+
+
+def set_values(parameters_, values):
+    """Assigns values to several parameters at once. All values are
+    validated before any of them is assigned, so either all or none of the
+    values are assigned. Values for a :class:`.ParameterBlock` are given as
+    dict and its conversion is executed once.
+
+    Example:
+        >>> set_values(block.parameters,
+        ...            {"amp": 2, "abscissa": {"values": 500}})
+
+    Args:
+        parameters_ (dict): Parameters to assign the values to.
+        values (dict): Maps the keys of the parameters to values.
+    Raises:
+        KeyError: If a parameter does not exist.
+    """
+    values = {key: parameters_[key]._coerce(value)
+              for key, value in values.items()}
+    for key, value in values.items():
+        parameter = parameters_[key]
+        if isinstance(parameter, ParameterBlock):
+            parameter.validate_values(value)
+        else:
+            parameter.validate(value)
+    for key, value in values.items():
+        parameter = parameters_[key]
+        if isinstance(parameter, ParameterBlock):
+            parameter._assign_values(value)
+        else:
+            logging.info("Changing value of %s from %s to %s",
+                         parameter.name, parameter.value, value)
+            parameter._assign(value)
+            if parameter.parameter_block:
+                parameter.parameter_block.update(source=parameter)
+
+
+def parameters_version(parameters_):
+    """Returns the summed up versions of the given parameters including
+    the parameters of :class:`.ParameterBlock` objects. The sum changes
+    whenever any of the parameters has been changed.
+
+    Args:
+        parameters_ (dict): Parameters to sum up the versions of.
+    """
+    version = 0
+    for parameter in parameters_.values():
+        version += parameter.version
+        if isinstance(parameter, ParameterBlock):
+            version += parameters_version(parameter.parameters)
+    return version
@@ -0,0 +1,252 @@
+import collections
+import contextlib
+import json
+import logging
+import threading
+import time
+import weakref
+
+from mca.framework import data_types
+
+# Context manager returned by BlockProfiler.span while profiling is disabled
+_null_span = contextlib.nullcontext()
+
+
+class BlockStatistics:
+    """Accumulated profiling statistics of a single :class:`.Block`.
+
+    Attributes:
+        calls (int): Number of times the block has been processed.
+        wall_time (float): Total wall time spent in process in seconds.
+        cpu_time (float): Total CPU time spent in process in seconds.
+        output_bytes (int): Total bytes of the data written to the Outputs.
+        input_bytes (int): Total bytes of the data read from the Inputs.
+        cache_hits (int): Number of times data of the block has been reused
+                          instead of processing it again.
+    """
+
+    def __init__(self):
+        """Initializes BlockStatistics."""
+        self.calls = 0
+        self.wall_time = 0.
+        self.cpu_time = 0.
+        self.output_bytes = 0
+        self.input_bytes = 0
+        self.cache_hits = 0
+
+    def to_dict(self):
+        """Returns the statistics as a dict."""
+        return {"calls": self.calls,
+                "wall_time": self.wall_time,
+                "cpu_time": self.cpu_time,
+                "output_bytes": self.output_bytes,
+                "input_bytes": self.input_bytes,
+                "cache_hits": self.cache_hits}
+
+
+class BlockProfiler:
+    """Collects execution times and data sizes of blocks and the spans of
+    the :class:`.IORegistry` scheduler. Profiling is disabled by default
+    and only costs a single attribute lookup per update when disabled.
+
+    Attributes:
+        enabled (bool): True, if blocks are being profiled.
+        statistics: Maps blocks to their :class:`.BlockStatistics`. Blocks
+                    are only weakly referenced.
+        trace_events (collections.deque): Events in the `Chrome trace event
+            format <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_.
+            Only the latest max_events events are kept, older events are
+            dropped.
+        max_events (int): Maximum number of kept trace events.
+        max_wall_time (float): Highest total wall time of all profiled
+                               blocks.
+        version (int): Incremented whenever the collected data changes.
+    """
+
+    def __init__(self, max_events=100000):
+        """Initializes BlockProfiler.
+
+        Args:
+            max_events (int): Maximum number of kept trace events. The
+                              statistics of the blocks are not limited.
+        """
+        self.enabled = False
+        self.statistics = weakref.WeakKeyDictionary()
+        self.max_events = max_events
+        self.trace_events = collections.deque(maxlen=max_events)
+        self.max_wall_time = 0.
+        self.version = 0
+        self._start = time.perf_counter()
+
+    def enable(self):
+        """Enables profiling."""
+        logging.info("Enabling block profiling")
+        self.enabled = True
+
+    def disable(self):
+        """Disables profiling. Already collected data is kept."""
+        logging.info("Disabling block profiling")
+        self.enabled = False
+
+    def reset(self):
+        """Removes all collected data."""
+        self.statistics = weakref.WeakKeyDictionary()
+        self.trace_events = collections.deque(maxlen=self.max_events)
+        self.max_wall_time = 0.
+        self.version += 1
+        self._start = time.perf_counter()
+
+    def process(self, block):
+        """Processes the block and records its statistics.
+
+        Args:
+            block: Block to process.
+        """
+        input_bytes = sum(data_size(input_.data) for input_ in block.inputs)
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            block.process()
+        finally:
+            cpu_time = time.thread_time() - start_cpu
+            end_wall = time.perf_counter()
+            wall_time = end_wall - start_wall
+            output_bytes = sum(data_size(output.data)
+                               for output in block.outputs)
+            statistics = self.block_statistics(block)
+            statistics.calls += 1
+            statistics.wall_time += wall_time
+            statistics.cpu_time += cpu_time
+            statistics.input_bytes += input_bytes
+            statistics.output_bytes += output_bytes
+            self.max_wall_time = max(self.max_wall_time,
+                                     statistics.wall_time)
+            self.version += 1
+            self._add_event(block_label(block), "process", start_wall,
+                            end_wall, {"cpu_time": cpu_time,
+                                       "input_bytes": input_bytes,
+                                       "output_bytes": output_bytes})
+
+    def record_cache_hit(self, block):
+        """Records that the data of a block has been reused.
+
+        Args:
+            block: Block whose data has been reused.
+        """
+        if self.enabled:
+            self.block_statistics(block).cache_hits += 1
+            self.version += 1
+
+    def span(self, name):
+        """Returns a context manager which records the enclosed code as a
+        scheduler event of the trace. A shared no-op context manager is
+        returned while profiling is disabled.
+
+        Args:
+            name (str): Name of the event.
+        """
+        if not self.enabled:
+            return _null_span
+        return self._span(name)
+
+    @contextlib.contextmanager
+    def _span(self, name):
+        """Context manager recording a scheduler event."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_event(name, "scheduler", start, time.perf_counter())
+
+    def block_statistics(self, block):
+        """Returns the :class:`.BlockStatistics` of a block. Creates them if
+        they do not exist yet.
+
+        Args:
+            block: Block to get the statistics of.
+        """
+        if block not in self.statistics:
+            self.statistics[block] = BlockStatistics()
+        return self.statistics[block]
+
+    def relative_cost(self, block):
+        """Returns the total wall time of the block relative to the most
+        expensive block as a value between 0 and 1. Returns None if the block
+        has not been profiled yet.
+
+        Args:
+            block: Block to get the relative cost of.
+        """
+        statistics = self.statistics.get(block)
+        if statistics is None or not self.max_wall_time:
+            return None
+        return statistics.wall_time / self.max_wall_time
+
+    def summary(self):
+        """Returns the statistics of all profiled blocks sorted by their
+        wall time, most expensive first.
+
+        Returns:
+            list: List of dicts with the block label and its statistics.
+        """
+        summary = [dict(block=block_label(block), **statistics.to_dict())
+                   for block, statistics in self.statistics.items()]
+        summary.sort(key=lambda x: x["wall_time"], reverse=True)
+        return summary
+
+    def export_trace(self, file_path):
+        """Writes the collected events and statistics as a json file which
+        can be opened with Chrome's about:tracing or Perfetto.
+
+        Args:
+            file_path (str): Path of the .json file.
+        """
+        logging.info("Exporting block profile to %s", file_path)
+        with open(file_path, "w") as trace_file:
+            json.dump({"traceEvents": list(self.trace_events),
+                       "displayTimeUnit": "ms",
+                       "otherData": {"blocks": self.summary()}},
+                      trace_file)
+
+    def _add_event(self, name, category, start, end, args=None):
+        """Adds a complete event to the trace.
+
+        Args:
+            name (str): Name of the event.
+            category (str): Category of the event.
+            start (float): Start time from :func:`time.perf_counter`.
+            end (float): End time from :func:`time.perf_counter`.
+            args (dict): Additional data of the event.
+        """
+        self.trace_events.append({"name": name,
+                                  "cat": category,
+                                  "ph": "X",
+                                  "ts": (start - self._start) * 1e6,
+                                  "dur": (end - start) * 1e6,
+                                  "pid": 0,
+                                  "tid": threading.get_ident(),
+                                  "args": args or {}})
+
+
+def data_size(data):
+    """Returns the size of the data in bytes. Only the ordinate of
+    :class:`.Signal` objects is taken into account.
+
+    Args:
+        data: Data of an Input or Output.
+    """
+    if isinstance(data, data_types.Signal):
+        return getattr(data.ordinate, "nbytes", 0)
+    return 0
+
+
+def block_label(block):
+    """Returns a label to identify a block in profiles."""
+    custom_name = block.parameters["name"].value
+    if custom_name != block.name:
+        return f"{custom_name} ({block.name})"
+    return block.name
+
+
+# The profiler should be handled as a singleton
+Profiler = BlockProfiler()
@@ -1,8 +1,13 @@
 import json
 import logging
+import os
+import weakref
 
 from mca.framework import parameters, io_registry, PlotBlock
 
+# Maps blocks to their last fingerprint and their json representation
+_block_json_cache = weakref.WeakKeyDictionary()
+
 
 def save_block_structure(file_path):
     """Saves the current block structure to the given file_path as
@@ -11,75 +16,145 @@ def save_block_structure(file_path):
     Args:
         file_path (str): Path of the .json file.
     """
-    logging.info(f"Saving block structure to {file_path}")
+    logging.info("Saving block structure to %s", file_path)
     block_structure = blocks_to_json(io_registry.Registry.get_all_blocks())
-    with open(file_path, "w") as save_file:
+    write_block_structure(file_path, block_structure)
+
+
+def write_block_structure(file_path, block_structure):
+    """Writes an already serialized block structure to the given file_path.
+    Does not access any blocks and can therefore be run in a background
+    thread. The structure is written to a temporary file first which then
+    replaces the file, so the file is never left partially written.
+
+    Args:
+        file_path (str): Path of the .json file.
+        block_structure (str): json-formatted string of the block structure.
+    """
+    temp_path = file_path + ".tmp"
+    with open(temp_path, "w") as save_file:
         save_file.write(block_structure)
+    os.replace(temp_path, file_path)
+
+
+def block_fingerprint(block):
+    """Returns a fingerprint of everything which is saved of a block
+    (parameter values, output metadata, connections, gui_data). The
+    fingerprint changes whenever the saved state of the block changes and is
+    much cheaper to compute than the json representation.
+
+    Args:
+        block: Block to compute the fingerprint of.
+    """
+    parameter_version = parameters.parameters_version(block.parameters)
+    plot_parameter_version = parameters.parameters_version(block.plot_parameters)
+    outputs = tuple(
+        (output.user_metadata.name,
+         output.user_metadata.quantity_a, output.user_metadata.symbol_a,
+         output.user_metadata.unit_a, output.user_metadata.quantity_o,
+         output.user_metadata.symbol_o, output.user_metadata.unit_o,
+         output.use_process_abscissa_metadata,
+         output.use_process_ordinate_metadata) for output in block.outputs)
+    inputs = tuple(id(input_.connected_output) for input_ in block.inputs)
+    return (parameter_version, plot_parameter_version, outputs, inputs,
+            repr(block.gui_data["save_data"]))
+
+
+def structure_fingerprint(blocks=None):
+    """Returns a fingerprint of the saved state of a block structure. Two
+    equal fingerprints mean that nothing has changed in between.
+
+    Args:
+        blocks (list): Blocks of the structure. By default all blocks of the
+                       registry.
+    """
+    if blocks is None:
+        blocks = io_registry.Registry.get_all_blocks()
+    return (io_registry.Registry.version,
+            tuple(block_fingerprint(block) for block in blocks))
 
 
 def blocks_to_json(blocks):
     """Extracts status data of the given blocks (parameter values, connections,
      gui_data) and dumps them into a json format.
 
+    The json representation of every block is cached and only recomputed
+    if the :func:`block_fingerprint` of the block has changed.
+
     Args:
         blocks(list): List of blocks to extract data from.
     Returns:
         json (str): json-formatted string of the extracted data.
      """
-
-    data = {"blocks": []}
-    # Iterate over the blocks to fill their dicts
+    block_strings = []
     for block in blocks:
-        parameter_dict = {}
-        plot_parameter_dict = {}
-        # Read the block parameters
-        for parameter_name, parameter in block.parameters.items():
+        fingerprint = block_fingerprint(block)
+        cached = _block_json_cache.get(block)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, json.dumps(block_to_dict(block)))
+            _block_json_cache[block] = cached
+        block_strings.append(cached[1])
+    return '{"blocks": [' + ", ".join(block_strings) + ']}'
+
+
+def block_to_dict(block):
+    """Extracts status data of a block (parameter values, connections,
+    gui_data) into a json serializable dict.
+
+    Args:
+        block: Block to extract data from.
+    Returns:
+        dict: Extracted data of the block.
+    """
+    parameter_dict = {}
+    plot_parameter_dict = {}
+    # Read the block parameters
+    for parameter_name, parameter in block.parameters.items():
+        if isinstance(parameter, parameters.ParameterBlock):
+            sub_parameter_dict = {}
+            for sub_parameter_name, sub_parameter in parameter.parameters.items():
+                sub_parameter_dict[
+                    sub_parameter_name] = sub_parameter.value
+            parameter_dict[parameter_name] = sub_parameter_dict
+        else:
+            parameter_dict[parameter_name] = parameter.value
+    # Read the block plot parameters
+    if isinstance(block, PlotBlock):
+        for parameter_name, parameter in block.plot_parameters.items():
             if isinstance(parameter, parameters.ParameterBlock):
                 sub_parameter_dict = {}
                 for sub_parameter_name, sub_parameter in parameter.parameters.items():
                     sub_parameter_dict[
                         sub_parameter_name] = sub_parameter.value
-                parameter_dict[parameter_name] = sub_parameter_dict
+                plot_parameter_dict[parameter_name] = sub_parameter_dict
             else:
-                parameter_dict[parameter_name] = parameter.value
-        # Read the block plot parameters
-        if isinstance(block, PlotBlock):
-            for parameter_name, parameter in block.plot_parameters.items():
-                if isinstance(parameter, parameters.ParameterBlock):
-                    sub_parameter_dict = {}
-                    for sub_parameter_name, sub_parameter in parameter.parameters.items():
-                        sub_parameter_dict[
-                            sub_parameter_name] = sub_parameter.value
-                    plot_parameter_dict[parameter_name] = sub_parameter_dict
-                else:
-                    plot_parameter_dict[parameter_name] = parameter.value
-        # Save block signature
-        save_block = {"class": str(type(block)),
-                      "parameters": parameter_dict,
-                      "plot_parameters": plot_parameter_dict,
-                      "inputs": [],
-                      "outputs": [{
-                          "id": output.id.int,
-                          "metadata": {"signal_name": output.user_metadata.name,
-                                       "quantity_a": output.user_metadata.quantity_a,
-                                       "symbol_a": output.user_metadata.symbol_a,
-                                       "unit_a": repr(
-                                           output.user_metadata.unit_a),
-                                       "quantity_o": output.user_metadata.quantity_o,
-                                       "symbol_o": output.user_metadata.symbol_o,
-                                       "unit_o": repr(
-                                           output.user_metadata.unit_o)},
-                          "use_process_abscissa_metadata": output.use_process_abscissa_metadata,
-                          "use_process_ordinate_metadata": output.use_process_ordinate_metadata
-                      }
-                          for output in block.outputs],
-                      "gui_data": block.gui_data["save_data"]}
-        # Save for each input to which output it was connected
-        for input_ in block.inputs:
-            input_save = {}
-            if input_.connected_output:
-                input_save[
-                    "connected_output"] = input_.connected_output.id.int
-            save_block["inputs"].append(input_save)
-        data["blocks"].append(save_block)
-    return json.dumps(data)
+                plot_parameter_dict[parameter_name] = parameter.value
+    # Save block signature
+    save_block = {"class": str(type(block)),
+                  "parameters": parameter_dict,
+                  "plot_parameters": plot_parameter_dict,
+                  "inputs": [],
+                  "outputs": [{
+                      "id": output.id.int,
+                      "metadata": {"signal_name": output.user_metadata.name,
+                                   "quantity_a": output.user_metadata.quantity_a,
+                                   "symbol_a": output.user_metadata.symbol_a,
+                                   "unit_a": repr(
+                                       output.user_metadata.unit_a),
+                                   "quantity_o": output.user_metadata.quantity_o,
+                                   "symbol_o": output.user_metadata.symbol_o,
+                                   "unit_o": repr(
+                                       output.user_metadata.unit_o)},
+                      "use_process_abscissa_metadata": output.use_process_abscissa_metadata,
+                      "use_process_ordinate_metadata": output.use_process_ordinate_metadata
+                  }
+                      for output in block.outputs],
+                  "gui_data": block.gui_data["save_data"]}
+    # Save for each input to which output it was connected
+    for input_ in block.inputs:
+        input_save = {}
+        if input_.connected_output:
+            input_save[
+                "connected_output"] = input_.connected_output.id.int
+        save_block["inputs"].append(input_save)
+    return save_block
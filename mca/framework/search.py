@@ -0,0 +1,111 @@
+"""Full-text search over a small catalogue, e.g. the block classes listed in
+the block explorer.
+
+Every lowercase substring with up to three characters is indexed. Queries
+with up to three characters are answered by a single lookup, longer queries
+by intersecting the entries of their trigrams. The candidates are then
+checked and ranked by where the query was found.
+"""
+import collections
+
+# Length of the longest indexed substrings
+_gram_length = 3
+
+
+def grams(text):
+    """Returns all substrings of the text with one to three characters.
+
+    Args:
+        text (str): Text to split.
+    """
+    return {text[start:start + length]
+            for length in range(1, _gram_length + 1)
+            for start in range(len(text) - length + 1)}
+
+
+class SearchIndex:
+    """Index to search keys by their texts. The texts of a key are grouped
+    into fields of decreasing importance, e.g. names, tags and descriptions.
+    Consecutive searches which extend the previous query only check the
+    previous results.
+
+    Example:
+        >>> index = SearchIndex({"fft": [["FFT"], ["Transform"]],
+        ...                      "adder": [["Adder"], ["Math"]]})
+        >>> index.search("trans")
+        ['fft']
+
+    Attributes:
+        keys (list): Indexed keys in the order they were given.
+    """
+    def __init__(self, entries):
+        """Initializes SearchIndex and builds the index.
+
+        Args:
+            entries (dict): Maps the keys to a list of fields. A field is a
+                            list of texts. Matches in earlier fields rank
+                            higher.
+        """
+        self.keys = list(entries)
+        self._fields = {key: [[text.lower() for text in field]
+                              for field in fields]
+                        for key, fields in entries.items()}
+        self._grams = collections.defaultdict(set)
+        for key, fields in self._fields.items():
+            for field in fields:
+                for text in field:
+                    for gram in grams(text):
+                        self._grams[gram].add(key)
+        self._last_query = None
+        self._last_matches = None
+
+    def search(self, query):
+        """Returns the keys matching the query ranked by relevance. Keys
+        whose texts contain the query in an earlier field rank higher. Within
+        a field matches at the start of the text rank higher than matches at
+        the start of a word, which rank higher than other matches. Equally
+        ranked keys keep their order.
+
+        Args:
+            query (str): Case-insensitive query. An empty query matches all
+                         keys.
+        """
+        query = query.strip().lower()
+        if not query:
+            return list(self.keys)
+        if self._last_query and query.startswith(self._last_query):
+            # Refine the previous results
+            candidates = self._last_matches
+        elif len(query) <= _gram_length:
+            candidates = self._grams.get(query, set())
+        else:
+            candidates = set.intersection(*(
+                self._grams.get(query[start:start + _gram_length], set())
+                for start in range(len(query) - _gram_length + 1)))
+        ranks = {}
+        for key in candidates:
+            rank = self._rank(key, query)
+            if rank is not None:
+                ranks[key] = rank
+        self._last_query = query
+        self._last_matches = set(ranks)
+        order = {key: index for index, key in enumerate(self.keys)}
+        return sorted(ranks, key=lambda key: (ranks[key], order[key]))
+
+    def _rank(self, key, query):
+        """Returns the rank of the best match of the query within the texts
+        of the key or None if the key does not match.
+        """
+        for field_index, field in enumerate(self._fields[key]):
+            best = None
+            for text in field:
+                position = text.find(query)
+                if position == 0:
+                    return field_index, 0
+                if position > 0:
+                    word_start = not text[position - 1].isalnum()
+                    rank = 1 if word_start else 2
+                    best = rank if best is None else min(best, rank)
+            if best is not None:
+                return field_index, best
+        return None
@@ -0,0 +1,174 @@
+"""Native binary file format for signals.
+
+A file consists of the magic bytes ``MCASIG01``, the length of the header as
+little endian uint32, the header as json and the ordinate. The ordinate
+starts at a multiple of 64 bytes so uncompressed ordinates can be memory
+mapped. Compressed ordinates are stored with zlib.
+"""
+import json
+import os
+import secrets
+import stat
+import struct
+import zlib
+
+import dsch
+import numpy as np
+
+from mca import exceptions
+from mca.framework import data_types
+
+file_extension = ".mcas"
+_magic = b"MCASIG01"
+_alignment = 64
+# Data types of the ordinate in single precision
+_single_precision = {np.dtype("float64"): np.dtype("float32"),
+                     np.dtype("complex128"): np.dtype("complex64")}
+
+
+def save_signal(file_path, signal, metadata, single_precision=False,
+                compress=False):
+    """Saves a signal and its metadata. The file is written to a temporary
+    file first and then renamed, so an existing file is only replaced by a
+    complete one.
+
+    Args:
+        file_path (str): Path of the file.
+        signal (:class:`.Signal`): Signal to save.
+        metadata (:class:`.MetaData`): Metadata of the signal.
+        single_precision (bool): True, if float64 and complex128 ordinates
+                                 are stored as float32 and complex64.
+        compress (bool): True, if the ordinate is compressed with zlib.
+    Raises:
+        :class:`~mca.exceptions.DataSavingError`: If the file could not be
+                                                   written.
+    """
+    ordinate = np.asarray(signal.ordinate)
+    dtype = ordinate.dtype.newbyteorder("<")
+    if single_precision:
+        dtype = _single_precision.get(ordinate.dtype, dtype)
+    ordinate = np.ascontiguousarray(ordinate, dtype=dtype)
+    data = zlib.compress(ordinate, 1) if compress else ordinate
+    header = json.dumps({
+        # numpy scalars are not json serializable
+        "abscissa_start": float(signal.abscissa_start),
+        "values": int(signal.values),
+        "increment": float(signal.increment),
+        "dtype": dtype.str,
+        "compression": "zlib" if compress else None,
+        "name": metadata.name,
+        "abscissa_unit": repr(metadata.unit_a),
+        "abscissa_symbol": metadata.symbol_a,
+        "abscissa_quantity": metadata.quantity_a,
+        "ordinate_unit": repr(metadata.unit_o),
+        "ordinate_symbol": metadata.symbol_o,
+        "ordinate_quantity": metadata.quantity_o}).encode()
+    prefix = _magic + struct.pack("<I", len(header)) + header
+    padding = bytes(-len(prefix) % _alignment)
+    file_path = os.path.abspath(file_path)
+    # Files created with os.open get the default permissions of the umask
+    # in contrast to mkstemp, which only grants the owner access
+    temp_path = "{}.{}.tmp".format(file_path, secrets.token_hex(8))
+    try:
+        temp_file = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL
+                            | getattr(os, "O_BINARY", 0), 0o666)
+    except OSError as error:
+        raise exceptions.DataSavingError(str(error))
+    try:
+        with os.fdopen(temp_file, "wb") as signal_file:
+            signal_file.write(prefix + padding)
+            signal_file.write(memoryview(data).cast("B"))
+        # Keep the permissions of a replaced file
+        if os.path.exists(file_path):
+            os.chmod(temp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+        os.replace(temp_path, file_path)
+    except OSError as error:
+        os.remove(temp_path)
+        raise exceptions.DataSavingError(str(error))
+
+
+def load_signal(file_path, memory_map=False):
+    """Loads a signal and its metadata.
+
+    Args:
+        file_path (str): Path of the file.
+        memory_map (bool): True, if an uncompressed ordinate should be
+                           memory mapped read-only instead of being read
+                           into memory.
+    Returns:
+        tuple: :class:`.Signal` and :class:`.MetaData`.
+    Raises:
+        :class:`~mca.exceptions.DataLoadingError`: If the file does not exist
+                                                    or has a wrong format.
+    """
+    try:
+        with open(file_path, "rb") as signal_file:
+            if signal_file.read(len(_magic)) != _magic:
+                raise exceptions.DataLoadingError(
+                    "File is not a signal file.")
+            header_size, = struct.unpack("<I", signal_file.read(4))
+            header = json.loads(signal_file.read(header_size))
+            offset = len(_magic) + 4 + header_size
+            offset += -offset % _alignment
+            dtype = np.dtype(header["dtype"])
+            if header["compression"] == "zlib":
+                signal_file.seek(offset)
+                ordinate = np.frombuffer(
+                    zlib.decompress(signal_file.read()), dtype=dtype)
+            elif memory_map:
+                ordinate = np.memmap(signal_file, dtype=dtype, mode="r",
+                                     offset=offset,
+                                     shape=(header["values"],))
+            else:
+                signal_file.seek(offset)
+                ordinate = np.fromfile(signal_file, dtype=dtype,
+                                       count=header["values"])
+    except FileNotFoundError:
+        raise exceptions.DataLoadingError("File not found")
+    except (KeyError, ValueError, struct.error) as error:
+        raise exceptions.DataLoadingError(
+            f"File has a wrong format: {error}")
+    signal = data_types.Signal(abscissa_start=header["abscissa_start"],
+                               values=header["values"],
+                               increment=header["increment"],
+                               ordinate=ordinate)
+    metadata = data_types.MetaData(
+        name=header["name"],
+        unit_a=header["abscissa_unit"],
+        unit_o=header["ordinate_unit"],
+        quantity_a=header["abscissa_quantity"],
+        quantity_o=header["ordinate_quantity"],
+        symbol_a=header["abscissa_symbol"],
+        symbol_o=header["ordinate_symbol"])
+    return signal, metadata
+
+
+def load_dsch_signal(file_path):
+    """Loads a signal and its metadata from a .npz, .mat or .hdf5 file
+    created with :data:`.signal_schema`.
+
+    Args:
+        file_path (str): Path of the file.
+    Returns:
+        tuple: :class:`.Signal` and :class:`.MetaData`.
+    """
+    storage = dsch.load(
+        storage_path=file_path,
+        required_schema=data_types.signal_schema
+    )
+    signal = data_types.Signal(
+        abscissa_start=storage.data.signal.abscissa_start.value,
+        values=storage.data.signal.values.value,
+        increment=storage.data.signal.increment.value,
+        ordinate=storage.data.signal.ordinate.value
+    )
+    metadata = data_types.MetaData(
+        name=storage.data.metadata.name.value,
+        unit_a=storage.data.metadata.abscissa_unit.value,
+        unit_o=storage.data.metadata.ordinate_unit.value,
+        quantity_a=storage.data.metadata.abscissa_quantity.value,
+        quantity_o=storage.data.metadata.ordinate_quantity.value,
+        symbol_a=storage.data.metadata.abscissa_symbol.value,
+        symbol_o=storage.data.metadata.ordinate_symbol.value,
+    )
+    return signal, metadata
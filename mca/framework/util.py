@@ -177,6 +177,85 @@ def fill_zeros(signals):
     return new_signals
 
 
+def combine_signals(signals, ufunc):
+    """Combines the ordinates of the given signals element-wise with a binary
+    numpy ufunc. The signals are matched like in :func:`fill_zeros`, but
+    instead of creating padded copies of every signal, the result is
+    accumulated in place in a single array. Signals with equal abscissas
+    are combined without any slicing.
+
+    Args:
+        signals: Signals to combine. Their increments have to be equal.
+        ufunc: Binary numpy ufunc, e.g. :obj:`numpy.add`.
+    Returns:
+        :class:`.Signal`: Signal containing the combined ordinates.
+    """
+    increment = signals[0].increment
+    dtype = np.result_type(np.float64, *(signal.ordinate
+                                         for signal in signals))
+    first_signal = signals[0]
+    if all(signal.abscissa_start == first_signal.abscissa_start and
+           signal.values == first_signal.values for signal in signals):
+        ordinate = np.array(first_signal.ordinate, dtype=dtype)
+        for signal in signals[1:]:
+            ufunc(ordinate, signal.ordinate, out=ordinate)
+        return data_types.Signal(abscissa_start=first_signal.abscissa_start,
+                                 values=first_signal.values,
+                                 increment=increment, ordinate=ordinate)
+    min_abscissa_start = min(signal.abscissa_start for signal in signals)
+    max_abscissa_end = max(signal.abscissa_start +
+                           signal.values * signal.increment
+                           for signal in signals)
+    max_values = round((max_abscissa_end - min_abscissa_start) / increment)
+    ordinate = np.zeros(max_values, dtype=dtype)
+    # Padding with zeros only leaves the result unchanged for ufuncs like
+    # add, other ufuncs also have to be applied outside of the signal
+    apply_padding = ufunc.identity != 0
+    for index, signal in enumerate(signals):
+        start = round((signal.abscissa_start - min_abscissa_start) /
+                      increment)
+        stop = start + signal.values
+        if index == 0:
+            ordinate[start:stop] = signal.ordinate
+            continue
+        ufunc(ordinate[start:stop], signal.ordinate,
+              out=ordinate[start:stop])
+        if apply_padding:
+            ufunc(ordinate[:start], 0, out=ordinate[:start])
+            ufunc(ordinate[stop:], 0, out=ordinate[stop:])
+    return data_types.Signal(abscissa_start=min_abscissa_start,
+                             values=max_values, increment=increment,
+                             ordinate=ordinate)
+
+
+def decimate_min_max(ordinate, buckets):
+    """Returns the indices of the minimum and maximum of each of the given
+    amount of equally sized buckets of the ordinate in ascending order.
+    Plotting only these values looks like plotting all values if there are
+    not more buckets than pixels. Values which do not fill a whole bucket are
+    kept completely.
+
+    Args:
+        ordinate: Real valued ordinate to decimate.
+        buckets (int): Amount of buckets, e.g. the width of the plot in
+                       pixels.
+    Returns:
+        numpy.ndarray: Indices of the values to keep.
+    """
+    values = len(ordinate)
+    if values <= 2 * buckets:
+        return np.arange(values)
+    size = values // buckets
+    # View of the ordinate with one bucket per row
+    rows = ordinate[:size * buckets].reshape(buckets, size)
+    offsets = np.arange(0, size * buckets, size)
+    indices = np.sort(np.stack((offsets + rows.argmin(axis=1),
+                                offsets + rows.argmax(axis=1)), axis=1),
+                      axis=1)
+    return np.concatenate((indices.ravel(),
+                           np.arange(size * buckets, values)))
+
+
 def abort_all_inputs_empty(process):
     """Abort the process function when the data of all Inputs is None.
 
@@ -0,0 +1,162 @@
+import struct
+
+import numpy as np
+
+from mca.framework import generators
+
+# Format tag, bits per sample and numpy type of the supported sample formats
+sample_formats = {"int16": (1, 16, np.dtype("<i2")),
+                  "int24": (1, 24, np.dtype("<i4")),
+                  "float32": (3, 32, np.dtype("<f4"))}
+
+# Size of the ds64 chunk reserved by a JUNK chunk for files exceeding 4 GB
+_ds64_size = 28
+_max_size = 0xFFFFFFFF
+
+
+class WavWriter:
+    """Writes interleaved frames to a .wav file incrementally. The sizes in
+    the header are written when the file is closed. Files larger than 4 GB
+    are written in the RF64 format.
+
+    Integer formats expect values in the range of -1 to 1. Values outside of
+    this range are clipped.
+
+    Example:
+        >>> with WavWriter("capture.wav", 44100, 2, "int16") as writer:
+        ...     writer.write(frames)
+
+    Attributes:
+        file_path (str): Path of the .wav file.
+        sampling_frequency (int): Sampling frequency in Hz.
+        channels (int): Amount of channels.
+        sample_format (str): "int16", "int24" or "float32".
+        dither (bool): True, if triangular dither is added before rounding
+                       to an integer format.
+        frames_written (int): Amount of frames written so far.
+    """
+    def __init__(self, file_path, sampling_frequency, channels,
+                 sample_format="float32", dither=False, seed=None):
+        """Initializes WavWriter and writes the header.
+
+        Args:
+            file_path (str): Path of the .wav file.
+            sampling_frequency (int): Sampling frequency in Hz.
+            channels (int): Amount of channels.
+            sample_format (str): "int16", "int24" or "float32".
+            dither (bool): True, if triangular dither is added before
+                           rounding to an integer format.
+            seed (int): Seed of the random numbers of the dither.
+        """
+        self.file_path = file_path
+        self.sampling_frequency = sampling_frequency
+        self.channels = channels
+        self.sample_format = sample_format
+        self.dither = dither
+        self.frames_written = 0
+        self._format_tag, self._bits, self._dtype = \
+            sample_formats[sample_format]
+        self._block_align = channels * self._bits // 8
+        self._rng = np.random.default_rng(seed)
+        self._file = open(file_path, "wb")
+        self._write_header()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_header(self):
+        """Writes the header with placeholders for the sizes."""
+        write = self._file.write
+        write(b"RIFF" + struct.pack("<I", 0) + b"WAVE")
+        # Reserve space to replace it by a ds64 chunk for RF64 files
+        write(b"JUNK" + struct.pack("<I", _ds64_size) + bytes(_ds64_size))
+        write(b"fmt " + struct.pack(
+            "<IHHIIHH", 16, self._format_tag, self.channels,
+            self.sampling_frequency,
+            self.sampling_frequency * self._block_align, self._block_align,
+            self._bits))
+        write(b"data" + struct.pack("<I", 0))
+        self._data_start = self._file.tell()
+
+    def write(self, frames):
+        """Converts the frames to the sample format and appends them to
+        the file.
+
+        Args:
+            frames: Array with the shape (frames, channels).
+        """
+        frames = np.asarray(frames, dtype=float)
+        if self._format_tag == 1:
+            scale = 2 ** (self._bits - 1) - 1
+            samples = frames * scale
+            if self.dither:
+                # Triangular dither with an amplitude of one LSB
+                samples += self._rng.random(samples.shape)
+                samples -= self._rng.random(samples.shape)
+            np.rint(samples, out=samples)
+            np.clip(samples, -scale - 1, scale, out=samples)
+            samples = samples.astype(self._dtype)
+            if self._bits == 24:
+                # Keep the lower three bytes of the little endian integers
+                samples = samples.view(np.uint8).reshape(-1, 4)[:, :3]
+        else:
+            samples = frames.astype(self._dtype)
+        self._file.write(np.ascontiguousarray(samples).tobytes())
+        self.frames_written += len(frames)
+
+    def close(self):
+        """Writes the sizes into the header and closes the file."""
+        if self._file.closed:
+            return
+        data_size = self.frames_written * self._block_align
+        # Chunks have to have an even size
+        if data_size % 2:
+            self._file.write(b"\x00")
+        riff_size = self._file.tell() - 8
+        if riff_size > _max_size:
+            self._file.seek(0)
+            self._file.write(b"RF64" + struct.pack("<I", _max_size))
+            self._file.seek(12)
+            self._file.write(b"ds64" + struct.pack(
+                "<IQQQI", _ds64_size, riff_size, data_size,
+                self.frames_written, 0))
+            self._file.seek(self._data_start - 4)
+            self._file.write(struct.pack("<I", _max_size))
+        else:
+            self._file.seek(4)
+            self._file.write(struct.pack("<I", riff_size))
+            self._file.seek(self._data_start - 4)
+            self._file.write(struct.pack("<I", data_size))
+        self._file.close()
+
+
+def write_wav(file_path, sampling_frequency, ordinates,
+              sample_format="float32", dither=False,
+              chunk_size=generators.CHUNK_SIZE):
+    """Writes ordinates as the channels of a .wav file chunk by chunk.
+    Shorter ordinates are continued with silence.
+
+    Args:
+        file_path (str): Path of the .wav file.
+        sampling_frequency (int): Sampling frequency in Hz.
+        ordinates (list): One ordinate per channel.
+        sample_format (str): "int16", "int24" or "float32".
+        dither (bool): True, if triangular dither is added before rounding
+                       to an integer format.
+        chunk_size (int): Amount of frames converted at once.
+    """
+    frames = max(len(ordinate) for ordinate in ordinates)
+    buffer = np.zeros((min(chunk_size, frames), len(ordinates)))
+    with WavWriter(file_path, sampling_frequency, len(ordinates),
+                   sample_format, dither) as writer:
+        for index in range(0, frames, chunk_size):
+            chunk = buffer[:min(chunk_size, frames - index)]
+            # Interleave the channels
+            for channel, ordinate in enumerate(ordinates):
+                values = ordinate[index:index + len(chunk)]
+                chunk[:len(values), channel] = values
+                chunk[len(values):, channel] = 0
+            writer.write(chunk)
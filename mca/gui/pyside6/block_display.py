@@ -4,7 +4,7 @@ import pathlib
 
 from PySide6 import QtWidgets, QtCore, QtGui
 
-from mca.framework import load, save
+from mca.framework import load, save, io_registry
 from mca.gui.pyside6 import block_item
 from mca.language import _
 
@@ -86,6 +86,9 @@ class BlockView(QtWidgets.QGraphicsView):
         self.clear_action.triggered.connect(self.scene().clear)
 
         self.setBackgroundBrush(draw_pattern(40, QtGui.Qt.gray))
+        # Make room for the cached pixmaps of large block structures (in kB)
+        QtGui.QPixmapCache.setCacheLimit(
+            max(QtGui.QPixmapCache.cacheLimit(), 102400))
         self.setDragMode(QtWidgets.QGraphicsView.RubberBandDrag)
 
         self.default_context_menu = QtWidgets.QMenu(self)
@@ -192,11 +195,21 @@ class BlockScene(QtWidgets.QGraphicsScene):
         block_class = event.source().selectedItems()[0].data(3)
         self.create_block_item(block_class(), pos=pos, open_edit_window=False)
 
-    def clear(self):
-        """Removes all items from the BlockScene."""
+    def repaint_blocks(self):
+        """Repaints all block items, e.g. after their colouring changed.
+        Unlike :meth:`update` this also renews the cached pixmaps of the
+        block items.
+        """
         for item in self.items():
             if isinstance(item, block_item.BlockItem):
-                item.delete()
+                item.update()
+
+    def clear(self):
+        """Removes all items from the BlockScene."""
+        with io_registry.Registry.batch():
+            for item in self.items():
+                if isinstance(item, block_item.BlockItem):
+                    item.delete()
 
     def create_block_item(self, block, pos=None, width=100, height=100,
                           open_edit_window=False):
@@ -206,8 +219,8 @@ class BlockScene(QtWidgets.QGraphicsScene):
 
             block: :class:`.Block` instance the block item represents.
             pos (tuple): (x,y) - Position of the block. If set to None a
-                         pseudo random position will be calculated based on
-                         the position of current blocks in the scene.
+                         pseudo random position around the center of the
+                         visible area of the view will be used.
             width (int): Width of the BlockItem.
             height (int): Width of the BlockItem.
             open_edit_window (bool): True, if the edit window
@@ -216,17 +229,12 @@ class BlockScene(QtWidgets.QGraphicsScene):
 
         """
         if pos is None:
-            # Compute the average position of the blocks
-            avg_x, avg_y = 0, 0
-            for item in self.items():
-                avg_x += item.scenePos().x()
-                avg_y += item.scenePos().y()
-            if len(self.items()) > 0:
-                avg_x = avg_x / len(self.items())
-                avg_y = avg_y / len(self.items())
+            # Place the block around the center of the visible area
+            view = self.views()[0]
+            center = view.mapToScene(view.viewport().rect().center())
             # Add some noise to the coordinates
-            x = avg_x + random.randint(-100, 100)
-            y = avg_y + random.randint(-100, 100)
+            x = center.x() - width // 2 + random.randint(-100, 100)
+            y = center.y() - height // 2 + random.randint(-100, 100)
         else:
             x = pos[0]
             y = pos[1]
@@ -246,6 +254,16 @@ class BlockScene(QtWidgets.QGraphicsScene):
         """Create the graphical :class:`.BlockItem` structure of an existing
         :class:`.Block` structure.
 
+        Args:
+            blocks (list): Existing block structure to represent.
+        """
+        with io_registry.Registry.batch():
+            self._create_blocks(blocks)
+
+    def _create_blocks(self, blocks):
+        """Creates the block items of :meth:`create_blocks` while the
+        updates are deferred.
+
         Args:
             blocks (list): Existing block structure to represent.
         """
@@ -312,9 +330,19 @@ class BlockScene(QtWidgets.QGraphicsScene):
         clipboard = app.clipboard()
         if not clipboard.mimeData().text():
             return
+        with io_registry.Registry.batch():
+            self._paste_blocks(clipboard.mimeData().text())
+
+    def _paste_blocks(self, json_string):
+        """Creates the blocks of the json string and adds them to the scene
+        centered around the mouse position.
+
+        Args:
+            json_string (str): json-formatted string of the copied blocks.
+        """
         # Check if clipboard has json string
         try:
-            pasted_blocks = load.json_to_blocks(clipboard.mimeData().text())
+            pasted_blocks = load.json_to_blocks(json_string, copy=True)
         except json.decoder.JSONDecodeError:
             return
         # Map global mouse pos to view pos
@@ -361,9 +389,10 @@ class BlockScene(QtWidgets.QGraphicsScene):
 
     def delete_selected(self):
         """Deletes the selected block from the scene."""
-        for item in self.selectedItems():
-            if isinstance(item, block_item.BlockItem):
-                item.delete()
+        with io_registry.Registry.batch():
+            for item in self.selectedItems():
+                if isinstance(item, block_item.BlockItem):
+                    item.delete()
 
 
 def draw_pattern(step, color):
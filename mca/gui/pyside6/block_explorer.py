@@ -3,7 +3,7 @@ import os
 from PySide6 import QtWidgets, QtCore, QtGui
 
 import mca
-from mca import blocks
+from mca.framework import block_registry, search
 from mca.language import _
 
 
@@ -17,6 +17,8 @@ class BlockExplorer(QtWidgets.QWidget):
          tag_check_box: Sets whether blocks should be grouped by tags or
                         just be listed.
          block_list: Contains blocks and tags al items.
+         search_timer: Delays filtering the block list until the user
+                       stopped typing.
      """
 
     def __init__(self, scene):
@@ -43,7 +45,12 @@ class BlockExplorer(QtWidgets.QWidget):
         self.tag_check_box.stateChanged.connect(self.block_list.show_blocks)
 
         self.block_list.search_bar = self.search_bar
-        self.search_bar.textChanged.connect(self.block_list.show_items)
+        # Filter the list once the user paused typing
+        self.search_timer = QtCore.QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.block_list.show_items)
+        self.search_bar.textChanged.connect(self.search_timer.start)
 
         self.layout().addWidget(self.search_bar)
         self.layout().addWidget(self.tag_check_box)
@@ -56,6 +63,16 @@ class BlockList(QtWidgets.QListWidget):
     """BlockList widget holding tags and drag-able blocks. Allows creating
     block items in the :class:`.BlockScene` with the drag-able block list
     items.
+
+    Attributes:
+        block_items (dict): Maps the block specs to their list items which
+                            are not related to a tag.
+        tag_items (dict): Maps the tags to their :class:`.TagListItem`.
+        block_index: :class:`.SearchIndex` over the names, tags and
+                     descriptions of the blocks.
+        tag_index: :class:`.SearchIndex` over the tags.
+        tag_dict (dict): Maps the tags to the :class:`.BlockSpec` of the
+                         blocks possessing the tag.
     """
 
     def __init__(self, scene):
@@ -78,12 +95,27 @@ class BlockList(QtWidgets.QListWidget):
             lambda: self.scene.create_block_item(self.currentItem().data(3)())
         )
         self.menu.addAction(self.new_block_action)
+        # Blocks are listed by their specs so plugin blocks are imported
+        # when they are created
+        block_specs = block_registry.Blocks.block_specs()
+        self.tag_dict = block_registry.Blocks.tag_dict()
         # Add all blocks to the block list
-        for block_class in blocks.block_classes:
-            self.add_block(block_class)
+        self.block_items = {}
+        for block_spec in block_specs:
+            self.block_items[block_spec] = self.add_block(block_spec)
         # Add the tags to the lists
-        for tag in blocks.tag_dict.keys():
-            self.add_tag(tag)
+        self.tag_items = {}
+        for tag in self.tag_dict.keys():
+            self.tag_items[tag] = self.add_tag(tag)
+        # Index the original and the translated texts
+        self.block_index = search.SearchIndex({
+            block_spec: [
+                [block_spec.name, _(block_spec.name)],
+                [text for tag in block_spec.tags for text in (tag, _(tag))],
+                [block_spec.description, _(block_spec.description)]]
+            for block_spec in block_specs})
+        self.tag_index = search.SearchIndex(
+            {tag: [[tag, _(tag)]] for tag in self.tag_dict})
 
     def mouseMoveEvent(self, event):
         """Method invoked when the mouse grabs an item from the list. Allows
@@ -104,8 +136,8 @@ class BlockList(QtWidgets.QListWidget):
         if item is None:
             return
         if item.data(4) == "block":
-            selected_block_class = item.data(3)
-            self.scene.create_block_item(selected_block_class(),
+            selected_block_spec = item.data(3)
+            self.scene.create_block_item(selected_block_spec(),
                                          open_edit_window=False)
         elif item.data(4) == "tag":
             self.search_bar.setText(_(item.data(5)))
@@ -124,54 +156,47 @@ class BlockList(QtWidgets.QListWidget):
         """
         self.show_blocks(self.tag_check_box.checkState())
 
-    def hide_all_items(self):
-        """Hide all items in the BlockList."""
-        all_items = self.findItems("", QtCore.Qt.MatchStartsWith)
-        for item in all_items:
-            item.setHidden(True)
-
     def show_blocks(self, tags=True):
         """Show all block items matching the search string in the search bar.
+        Blocks which are not grouped by a tag are sorted by relevance.
 
         Args:
             tags: If True, all blocks are grouped according to their tags. If a
                   block has multiple tags it is listed under all its tags.
         """
-        # By default hide all items
-        self.hide_all_items()
-        # Get the matching items from the search_bar  string
         search_string = self.search_bar.text()
-        matching_items = self.findItems(search_string, QtCore.Qt.MatchContains)
-        if not tags:
-            # Show the blocks without tags
-            for item in matching_items:
-                if item.data(4) == "block" and item.data(5) is False:
-                    item.setHidden(False)
+        if tags and not search_string:
+            # Show all tags with their blocks
+            shown_tags = set(self.tag_items)
+            shown_blocks = []
+        elif tags:
+            # Show the matching tags with all their blocks and the other
+            # matching blocks without tags
+            shown_tags = set(self.tag_index.search(search_string))
+            tagged_blocks = {block_spec for tag in shown_tags
+                             for block_spec in self.tag_dict[tag]}
+            shown_blocks = [block_spec for block_spec
+                            in self.block_index.search(search_string)
+                            if block_spec not in tagged_blocks]
         else:
-            # Get the matching tags
-            matching_tags = filter(lambda x: x.data(4) == "tag", matching_items)
-            related_blocks = []
-            # Get the blocks which are related to the tags
-            for tag in matching_tags:
-                related_blocks += tag.related_blocks
-            # Block classes which match due their tags matching with the search
-            # string
-            matching_blocks = list(map(lambda x: x.data(3), related_blocks))
-            for item in matching_items:
-                # Show blocks not associated with tags if they match with the
-                # search string and are not associated with a matching tag
-                # already
-                if search_string and item.data(5) is False and matching_blocks.count(item.data(3)) == 0:
-                    item.setHidden(False)
-                # Show the tag and all its associated blocks
-                elif item.data(4) == "tag":
-                    item.setHidden(False)
+            shown_tags = set()
+            shown_blocks = self.block_index.search(search_string)
+        # Move the shown blocks without tags to the top in ranked order
+        for row, block_spec in enumerate(shown_blocks):
+            item = self.block_items[block_spec]
+            if self.row(item) != row:
+                self.insertItem(row, self.takeItem(self.row(item)))
+        shown_blocks = set(shown_blocks)
+        for block_spec, item in self.block_items.items():
+            item.setHidden(block_spec not in shown_blocks)
+        for tag, item in self.tag_items.items():
+            item.setHidden(tag not in shown_tags)
 
     def add_block(self, block, related_block=False):
         """Adds a block to the list.
 
         Args:
-            block: Class of the block to add.
+            block: :class:`.BlockSpec` of the block to add.
             related_block: Flag whether the block is related to a tag.
         """
         item = QtWidgets.QListWidgetItem()
@@ -199,8 +224,8 @@ class BlockList(QtWidgets.QListWidget):
         """
         tag_item = TagListItem(tag_name=tag_name)
         self.addItem(tag_item)
-        for block_class in blocks.tag_dict[tag_name]:
-            block_item = self.add_block(block_class, related_block=True)
+        for block_spec in self.tag_dict[tag_name]:
+            block_item = self.add_block(block_spec, related_block=True)
             tag_item.related_blocks.append(block_item)
         return tag_item
 
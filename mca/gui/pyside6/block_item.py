@@ -1,9 +1,22 @@
 from PySide6 import QtWidgets, QtCore, QtGui
 
-from mca.framework import data_types, DynamicBlock, block_io, parameters, PlotBlock
+from mca.framework import data_types, DynamicBlock, block_io, parameters, \
+    PlotBlock, io_registry, profiler
 from mca.gui.pyside6 import edit_window, io_items
 from mca.language import _
 
+# Colors, pens and brushes shared by all block items
+default_brush = QtGui.QBrush(QtGui.QColor("#608a5c"))
+hover_brush = QtGui.QBrush(QtGui.QColor("#82bd7d"))
+selection_pen = QtGui.QPen(QtGui.QColor("#259AE9"))
+selection_brush = QtGui.QBrush(QtGui.QColor("#259AE9"))
+outline_pen = QtGui.QPen(QtGui.Qt.black)
+button_brush = QtGui.QBrush(QtGui.QColor("#076959"))
+button_press_brush = QtGui.QBrush(QtGui.QColor("#288575"))
+# Level of detail (scale of the view) below which texts and selection
+# points are not drawn
+min_text_detail = 0.5
+
 
 class BlockItem(QtWidgets.QGraphicsItem):
     """Class to display any kind of :class:`.Block` and support all its
@@ -25,12 +38,14 @@ class BlockItem(QtWidgets.QGraphicsItem):
         inputs (list): List of all its inputs.
         outputs (list): List of all its outputs.
         block: Instance of :class:`.Block' this block item is holding.
-        default_color: Default color of the block.
-        hover_color: Hover color of the block.
-        selection_color: Color for the selection rectangle.
-        name_color: Color of the name fonts.
+        default_color: Default brush of the block.
+        hover_color: Hover brush of the block.
+        selection_color: Pen for the selection rectangle.
+        name_color: Pen of the name fonts.
         default_font: Default font of the block.
         custom_name_font: Font for the custom username.
+        _custom_name_width (tuple): Custom name and its width in the custom
+                                    name font.
         _resize_all (bool): Flag to indicate whether user is resizing or
                            moving the block.
         _start_pos (tuple): Starting position of a resize event.
@@ -59,16 +74,18 @@ class BlockItem(QtWidgets.QGraphicsItem):
         self.block.gui_data["run_time_data"]["pyside6"] = {"block_item": self}
 
         # Color settings
-        self.default_color = None
-        self.hover_color = None
-        self.selection_color = None
-        self.name_color = None
+        self.default_color = default_brush
+        self.hover_color = hover_brush
+        self.selection_color = selection_pen
+        self.name_color = QtGui.QPen(
+            self.view.palette().color(QtGui.QPalette.Text))
 
         # Set fonts
         app = QtWidgets.QApplication.instance()
         self.default_font = QtGui.QFont(app.font())
         self.custom_name_font = QtGui.QFont(app.font())
         self.custom_name_font.setPointSize(13)
+        self._custom_name_width = (None, 0)
 
         self.setToolTip(f"<html><head/><body><p>{self.block.description}</p></body></html>")
         self.setAcceptHoverEvents(True)
@@ -101,6 +118,9 @@ class BlockItem(QtWidgets.QGraphicsItem):
         self.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
+        # Repaint the block only when it changes instead of on every update
+        # of the view
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
 
         # Create visual inputs and outputs for the existing ones
         for i in self.block.inputs:
@@ -114,18 +134,10 @@ class BlockItem(QtWidgets.QGraphicsItem):
         num_buttons = 0
         # Add button if the block is a PlotBlock
         if isinstance(self.block, PlotBlock):
-            main_window = self.view.parent().parent().parent()
-            dock_widget = QtWidgets.QDockWidget(self.block.name,
-                                                main_window)
-            dock_widget.setWidget(self.block.plot_window)
-            main_window.addDockWidget(QtCore.Qt.RightDockWidgetArea,
-                                      dock_widget)
-            block.gui_data["run_time_data"]["pyside6"]["dock_widget"] = dock_widget
-            show_function = show_function_generator(self.block)
             self.action_buttons.append(
                 BlockButton(
                     name=_("Show plot"),
-                    function=show_function,
+                    function=self.show_plot,
                     parent=self,
                     x=self.input_offset + self.select_point_diameter // 2 + 5,
                     y=50 + num_buttons * (
@@ -201,7 +213,7 @@ class BlockItem(QtWidgets.QGraphicsItem):
         self.menu.addAction(self.delete_action)
         self.add_block_actions_to_menu()
 
-        self.block.update()
+        self.block.trigger_update()
 
         self.save_gui_data()
 
@@ -267,23 +279,27 @@ class BlockItem(QtWidgets.QGraphicsItem):
 
     def paint(self, painter, option, widget):
         """Method to paint the block. This method gets invoked after
-        initialization and every time the block gets updated.
+        initialization and every time the block gets updated. Texts and
+        selection points are skipped when the view is zoomed out far.
         """
-        self.name_color = self.view.palette().color(QtGui.QPalette.Text)
-        self.default_color = QtGui.QColor("#608a5c")
-        self.hover_color = QtGui.QColor("#82bd7d")
-        self.selection_color = QtGui.QColor("#259AE9")
-
         select_point_radius = self.select_point_diameter // 2
         x_offset_block = select_point_radius + self.input_offset
         y_offset_block = select_point_radius
+        detail = option.levelOfDetailFromTransform(painter.worldTransform())
         # Draw the main block
+        cost = None
+        if profiler.Profiler.enabled:
+            cost = profiler.Profiler.relative_cost(self.block)
         if self._hovering:
             painter.setBrush(self.hover_color)
+        elif cost is not None:
+            # Colour the block from green (cheap) to red (expensive)
+            painter.setBrush(QtGui.QColor.fromHsv(int(120 * (1 - cost)),
+                                                  170, 200))
         else:
             painter.setBrush(self.default_color)
 
-        painter.setPen(QtGui.Qt.black)
+        painter.setPen(outline_pen)
         painter.drawRoundedRect(x_offset_block, select_point_radius,
                                 self.block_width, self.block_height, 5, 5)
 
@@ -293,30 +309,27 @@ class BlockItem(QtWidgets.QGraphicsItem):
         if self.isSelected():
             painter.setPen(self.selection_color)
             painter.setBrush(QtGui.Qt.transparent)
-            path = QtGui.QPainterPath()
-            path.addRect(
-                select_point_radius,
-                select_point_radius,
-                total_width,
-                total_height
-            )
-            painter.drawPath(path)
-            painter.setBrush(self.selection_color)
-            select_point_coordinates = (
-                (0, 0),
-                (total_width // 2, 0),
-                (total_width, 0),
-                (total_width, total_height // 2),
-                (total_width, total_height),
-                (total_width // 2, total_height),
-                (0, total_height),
-                (0, total_height // 2)
-            )
-            for coordinates in select_point_coordinates:
-                painter.drawEllipse(coordinates[0],
-                                    coordinates[1],
-                                    self.select_point_diameter,
-                                    self.select_point_diameter)
+            painter.drawRect(select_point_radius, select_point_radius,
+                             total_width, total_height)
+            if detail >= min_text_detail:
+                painter.setBrush(selection_brush)
+                select_point_coordinates = (
+                    (0, 0),
+                    (total_width // 2, 0),
+                    (total_width, 0),
+                    (total_width, total_height // 2),
+                    (total_width, total_height),
+                    (total_width // 2, total_height),
+                    (0, total_height),
+                    (0, total_height // 2)
+                )
+                for coordinates in select_point_coordinates:
+                    painter.drawEllipse(coordinates[0],
+                                        coordinates[1],
+                                        self.select_point_diameter,
+                                        self.select_point_diameter)
+        if detail < min_text_detail:
+            return
         # Draw block name
         painter.setPen(self.name_color)
         painter.drawText(x_offset_block + 5, y_offset_block + 2,
@@ -326,12 +339,23 @@ class BlockItem(QtWidgets.QGraphicsItem):
         # Draw user block name
         if custom_name != self.block.name:
             painter.setFont(self.custom_name_font)
-            fm = QtGui.QFontMetrics(self.custom_name_font).boundingRect(custom_name)
-            custom_name_width = fm.width()
             painter.drawText(
                 x_offset_block + 5,
-                y_offset_block + 20, custom_name_width, 25, 0,
-                custom_name)
+                y_offset_block + 20, self.custom_name_width(custom_name), 25,
+                0, custom_name)
+
+    def custom_name_width(self, custom_name):
+        """Returns the width of the custom name in the custom name font.
+        The width is only measured again when the name changes.
+
+        Args:
+            custom_name (str): Custom name of the block.
+        """
+        if self._custom_name_width[0] != custom_name:
+            width = QtGui.QFontMetrics(self.custom_name_font).boundingRect(
+                custom_name).width()
+            self._custom_name_width = (custom_name, width)
+        return self._custom_name_width[1]
 
     def contextMenuEvent(self, event):
         """Method that is invoked when the user right-clicks the block.
@@ -444,23 +468,42 @@ class BlockItem(QtWidgets.QGraphicsItem):
         """Disconnects all its inputs and outputs and removes itself
         from the scene.
         """
-        # Disconnect the inputs
-        for i in self.inputs:
-            i.disconnect()
-        # Disconnect the outputs
-        for o in self.outputs:
-            o.disconnect()
+        with io_registry.Registry.batch():
+            # Disconnect the inputs
+            for i in self.inputs:
+                i.disconnect()
+            # Disconnect the outputs
+            for o in self.outputs:
+                o.disconnect()
 
         self.modified()
         # Remove the DockWidget for plot blocks
-        if isinstance(self.block, PlotBlock):
-            self.scene().parent().parent().removeDockWidget(
-                self.block.gui_data["run_time_data"]["pyside6"]["dock_widget"])
+        dock_widget = self.block.gui_data["run_time_data"]["pyside6"].get(
+            "dock_widget")
+        if dock_widget:
+            self.scene().parent().parent().removeDockWidget(dock_widget)
         # Remove itself from the scene and clean up
         self.scene().removeItem(self)
         self.block.delete()
         self.block = None
 
+    def show_plot(self):
+        """Shows the plot of a :class:`.PlotBlock` in a dock widget. The dock
+        widget and the plot window are created when the plot is shown for
+        the first time.
+        """
+        run_time_data = self.block.gui_data["run_time_data"]["pyside6"]
+        if "dock_widget" not in run_time_data:
+            main_window = self.view.parent().parent().parent()
+            dock_widget = QtWidgets.QDockWidget(self.block.name,
+                                                main_window)
+            dock_widget.setWidget(self.block.plot_window)
+            main_window.addDockWidget(QtCore.Qt.RightDockWidgetArea,
+                                      dock_widget)
+            run_time_data["dock_widget"] = dock_widget
+        run_time_data["dock_widget"].setVisible(True)
+        self.block.fig.tight_layout()
+
     def open_edit_window(self):
         """Opens up the parameter window."""
         edit_window.EditWindow(self, self.block).exec_()
@@ -766,11 +809,11 @@ class BlockButton(QtWidgets.QGraphicsItem):
         width (int): Width of the button.
         height (int): Height of the button.
         text_margin (int): Margin of the button text within the button.
-        default_color: Color of the button. Changes according to the style.
-        name_color: Color of the button text. Changes according to the style.
-        press_color: Color of the button when pressed.
-                     Changes according to the style.
+        default_color: Brush of the button.
+        name_color: Pen of the button text. Changes according to the style.
+        press_color: Brush of the button when pressed.
         pressed (bool): Flag whether the button is pressed.
+        name_width (int): Width of the button text.
     """
 
     def __init__(self, name, function, parent, x, y, width, height):
@@ -801,13 +844,15 @@ class BlockButton(QtWidgets.QGraphicsItem):
         self.pressed = False
 
         self.apply_colors()
+        self.name_width = QtGui.QFontMetrics(
+            QtWidgets.QApplication.instance().font()).boundingRect(
+            self.name).width()
 
     def paint(self, painter, option, widget):
         """Method to paint the button. This method gets invoked after
-        initialization and every time the button gets updated.
+        initialization and every time the button gets updated. The text is
+        skipped when the view is zoomed out far.
         """
-        # Apply colors depending on the theme
-        self.apply_colors()
         painter.setPen(QtCore.Qt.NoPen)
         # Set different color when the button is pressed
         if self.pressed:
@@ -816,13 +861,11 @@ class BlockButton(QtWidgets.QGraphicsItem):
             painter.setBrush(self.default_color)
 
         painter.drawRoundedRect(0, 0, self.width, self.height, 5, 5)
-
+        if option.levelOfDetailFromTransform(
+                painter.worldTransform()) < min_text_detail:
+            return
         painter.setPen(self.name_color)
-        font = painter.font()
-        fm = QtGui.QFontMetrics(font)
-        name_width = fm.boundingRect(self.name).width()
-
-        painter.drawText(self.width // 2 - name_width // 2,
+        painter.drawText(self.width // 2 - self.name_width // 2,
                          self.text_margin + self.height // 2,
                          self.name)
 
@@ -849,14 +892,7 @@ class BlockButton(QtWidgets.QGraphicsItem):
 
     def apply_colors(self):
         """Applies the current colors depending on the chosen style."""
-        self.name_color = self.parentItem().view.palette().color(QtGui.QPalette.ButtonText)
-        self.default_color = QtGui.QColor("#076959")
-        self.press_color = QtGui.QColor("#288575")
-
-
-def show_function_generator(block):
-    """Generates functions for reopening plot windows of plot blocks."""
-    def show_function():
-        block.gui_data["run_time_data"]["pyside6"]["dock_widget"].setVisible(True)
-        block.fig.tight_layout()
-    return show_function
+        self.name_color = QtGui.QPen(self.parentItem().view.palette().color(
+            QtGui.QPalette.ButtonText))
+        self.default_color = button_brush
+        self.press_color = button_press_brush
@@ -356,6 +356,12 @@ class EditWindow(QtWidgets.QDialog):
             plot_parameter_changes (bool): True, if changes to the
                                            plot_parameters should be applied.
         """
+        parameter_version = parameters.parameters_version(
+            self.block.parameters)
+        plot_parameter_version = parameters.parameters_version(
+            self.block.plot_parameters)
+        metadata_changed = any(entry.changed for entry in
+                               self.metadata_widgets)
         # Try writing the parameters
         try:
             if parameter_changes:
@@ -367,7 +373,15 @@ class EditWindow(QtWidgets.QDialog):
             if plot_parameter_changes:
                 for plot_parameter in self.plot_parameter_widgets:
                     plot_parameter.write_parameter()
-            self.block.trigger_update()
+            # Only render plots again if solely the plot parameters changed
+            if isinstance(self.block, PlotBlock) and not metadata_changed \
+                    and parameter_version == parameters.parameters_version(
+                        self.block.parameters) \
+                    and plot_parameter_version != parameters.parameters_version(
+                        self.block.plot_parameters):
+                self.block.update_plot()
+            else:
+                self.block.trigger_update()
             self.block_item.update()
         # Catch all exceptions and display them as a message
         except Exception as error:
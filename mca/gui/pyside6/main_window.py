@@ -1,11 +1,12 @@
+import concurrent.futures
 import logging
 import os
 from pathlib import Path
 
-from PySide6 import QtWidgets, QtGui
+from PySide6 import QtWidgets, QtGui, QtCore
 
 from mca import config
-from mca.framework import save, load
+from mca.framework import save, load, io_registry, profiler
 from mca.gui.pyside6 import block_explorer, block_display, about_window, introduction_window
 from mca.language import _
 
@@ -32,6 +33,7 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         QtWidgets.QMainWindow.__init__(self)
         self.conf = config.Config()
+        io_registry.Registry.set_pull_mode(self.conf["pull_mode"])
 
         self.showMaximized()
 
@@ -42,6 +44,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.open_recent_menu = None
         self.save_file_path = None
+        self.saved_fingerprint = save.structure_fingerprint()
+        self.autosaved_fingerprint = self.saved_fingerprint
 
         self.init_menu()
 
@@ -71,6 +75,21 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.main_widget.setSizes([300, 1000])
         self.setCentralWidget(self.main_widget)
+        # Periodically write a backup of the block structure. A single
+        # thread writes the backups one after another
+        self.autosave_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1)
+        self.autosave_timer = QtCore.QTimer(self)
+        self.autosave_timer.timeout.connect(self.autosave)
+        if self.conf["autosave_interval"]:
+            self.autosave_timer.start(self.conf["autosave_interval"] * 1000)
+        # Block items cache their pixmaps, so they have to be repainted when
+        # their profiled costs change
+        self.profile_version = profiler.Profiler.version
+        self.profile_timer = QtCore.QTimer(self)
+        self.profile_timer.timeout.connect(self.repaint_profile)
+        if profiler.Profiler.enabled:
+            self.profile_timer.start(500)
         # Save warning message
         self.save_warning_message = QtWidgets.QMessageBox(
             parent=self,
@@ -103,6 +122,8 @@ class MainWindow(QtWidgets.QMainWindow):
         menu = self.menuBar()
         file_menu = menu.addMenu(_("File"))
         language_menu = menu.addMenu(_("Language"))
+        evaluation_menu = menu.addMenu(_("Evaluation"))
+        profiling_menu = menu.addMenu(_("Profiling"))
 
         open_about_window = QtGui.QAction(_("About"), self)
         open_about_window.triggered.connect(self.about_window.show)
@@ -146,6 +167,28 @@ class MainWindow(QtWidgets.QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+        pull_mode_action = QtGui.QAction(_("Evaluate on demand"), self)
+        pull_mode_action.setStatusTip(
+            _("Only process blocks whose data is displayed or used"))
+        pull_mode_action.setCheckable(True)
+        pull_mode_action.setChecked(io_registry.Registry.pull_mode)
+        pull_mode_action.toggled.connect(self.toggle_pull_mode)
+        evaluation_menu.addAction(pull_mode_action)
+
+        profiling_action = QtGui.QAction(_("Profile blocks"), self)
+        profiling_action.setCheckable(True)
+        profiling_action.setChecked(profiler.Profiler.enabled)
+        profiling_action.toggled.connect(self.toggle_profiling)
+        profiling_menu.addAction(profiling_action)
+
+        reset_profile_action = QtGui.QAction(_("Reset profile"), self)
+        reset_profile_action.triggered.connect(self.reset_profile)
+        profiling_menu.addAction(reset_profile_action)
+
+        export_profile_action = QtGui.QAction(_("Export profile"), self)
+        export_profile_action.triggered.connect(self.export_profile)
+        profiling_menu.addAction(export_profile_action)
+
     def init_view_toolbar(self):
         """Initializes the toolbar for the block view."""
         self.view_tool_bar = QtWidgets.QToolBar()
@@ -172,6 +215,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.save_maybe():
             self.block_scene.clear()
             self.save_file_path = None
+            self.saved_fingerprint = save.structure_fingerprint()
             self.modified = False
 
     def open_file_dialog(self):
@@ -209,14 +253,17 @@ class MainWindow(QtWidgets.QMainWindow):
                                           QtWidgets.QMessageBox.Ok)
             return
         self.block_scene.clear()
-        loaded_blocks = load.load_block_structure(file_path)
+        # Evaluate the loaded structure only once after creating the items
+        with io_registry.Registry.batch():
+            loaded_blocks = load.load_block_structure(file_path)
+            self.block_scene.create_blocks(loaded_blocks)
         self.save_file_path = file_path
         self.conf["load_file_dir"] = file_path
         if file_path in self.conf["recent_files"]:
             self.conf["recent_files"].remove(file_path)
         self.conf["recent_files"] = [file_path] + self.conf["recent_files"][:3]
         self.update_recent_menu()
-        self.block_scene.create_blocks(loaded_blocks)
+        self.saved_fingerprint = save.structure_fingerprint()
         self.modified = False
 
     def update_recent_menu(self):
@@ -267,6 +314,7 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         if self.save_file_path:
             save.save_block_structure(self.save_file_path)
+            self.saved_fingerprint = save.structure_fingerprint()
             self.modified = False
             return True
         else:
@@ -274,14 +322,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def save_maybe(self):
         """Opens up a message dialogue asking if the user wants to save
-        changes if the document has been modified.
+        changes if the document has been modified. No dialogue is shown if
+        the saved state of the blocks has not changed since the last save,
+        e.g. if a block has only been moved and moved back. Reverting a
+        changed parameter value still counts as a modification.
 
         Returns:
             bool: True, if the action was accepted regardless
                   if the file was saved or not. False, if the action was
                   cancelled.
         """
-        if self.modified:
+        if self.modified and \
+                save.structure_fingerprint() != self.saved_fingerprint:
             result = self.save_warning_message.exec_()
         else:
             return True
@@ -308,6 +360,25 @@ class MainWindow(QtWidgets.QMainWindow):
         if result == QtWidgets.QMessageBox.StandardButton.Yes:
             self.block_scene.clear()
 
+    def autosave(self):
+        """Writes the current block structure to the autosave file in the
+        config directory. Nothing is written if the block structure has not
+        changed since the last autosave. The blocks are serialized in the
+        main thread while the file is written in a background thread. Writes
+        are queued, so they never overlap.
+        """
+        fingerprint = save.structure_fingerprint()
+        if fingerprint == self.autosaved_fingerprint:
+            return
+        block_structure = save.blocks_to_json(
+            io_registry.Registry.get_all_blocks())
+        self.autosaved_fingerprint = fingerprint
+        autosave_path = os.path.join(
+            os.path.dirname(config.Config.user_config_path), "autosave.json")
+        logging.info("Autosaving block structure to %s", autosave_path)
+        self.autosave_executor.submit(save.write_block_structure,
+                                      autosave_path, block_structure)
+
     @property
     def modified(self):
         """Gets or sets whether there are any unsaved changes.
@@ -327,6 +398,57 @@ class MainWindow(QtWidgets.QMainWindow):
             show_file = "*" + show_file
         self.setWindowTitle("{} - {}".format(show_file, _("MCA")))
 
+    def toggle_pull_mode(self, enabled):
+        """Enables or disables the pull mode of the registry. In pull mode
+        blocks are only processed when their data is needed.
+
+        Args:
+            enabled (bool): True, if the blocks should be evaluated on demand.
+        """
+        io_registry.Registry.set_pull_mode(enabled)
+        self.conf["pull_mode"] = enabled
+
+    def toggle_profiling(self, enabled):
+        """Enables or disables the block profiling. Profiled blocks are
+        coloured by their cost.
+
+        Args:
+            enabled (bool): True, if the blocks should be profiled.
+        """
+        if enabled:
+            profiler.Profiler.enable()
+            self.profile_timer.start(500)
+        else:
+            profiler.Profiler.disable()
+            self.profile_timer.stop()
+        self.block_scene.repaint_blocks()
+
+    def repaint_profile(self):
+        """Repaints the block items if the profiled costs have changed since
+        the last repaint.
+        """
+        if profiler.Profiler.version != self.profile_version:
+            self.profile_version = profiler.Profiler.version
+            self.block_scene.repaint_blocks()
+
+    def reset_profile(self):
+        """Removes all collected profiling data."""
+        profiler.Profiler.reset()
+        self.block_scene.repaint_blocks()
+
+    def export_profile(self):
+        """Opens file dialog and exports the collected profiling data as a
+        Chrome trace.
+        """
+        file_name = QtWidgets.QFileDialog.getSaveFileName(
+            self, _("Export profile"), self.conf["save_file_dir"],
+            "json (*.json)")[0]
+        if not file_name:
+            return
+        if not file_name.endswith(".json"):
+            file_name += ".json"
+        profiler.Profiler.export_trace(file_name)
+
     def change_language(self, language):
         """Returns a function which changes the language in the config.
 
@@ -336,7 +458,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         def tmp():
             self.conf["language"] = language
-            logging.info(f"Changing language to {language}")
+            logging.info("Changing language to %s", language)
             msg_box = QtWidgets.QMessageBox()
             msg_box.setWindowTitle(_("MCA"))
             msg_box.setText(_("Changes will be applied after restart."))
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pytest
+
+from mca import blocks, exceptions
+from mca.framework import batch, data_types, signal_file
+
+
+@pytest.fixture
+def signal_files(tmp_path):
+    (tmp_path / "sub").mkdir()
+    file_paths = [str(tmp_path / "a.mcas"), str(tmp_path / "sub" / "b.mcas"),
+                  str(tmp_path / "c.mcas")]
+    for index, file_path in enumerate(file_paths):
+        signal = data_types.Signal(0, 10, 0.1, np.full(10, float(index)))
+        metadata = data_types.MetaData(f"Signal {index}", "s", "V")
+        signal_file.save_signal(file_path, signal, metadata)
+    (tmp_path / "notes.txt").write_text("")
+    return file_paths
+
+
+def test_find_files(signal_files, tmp_path):
+    assert batch.find_files(str(tmp_path / "*")) == [signal_files[0],
+                                                     signal_files[2]]
+    assert batch.find_files(str(tmp_path / "**" / "*.mcas")) == \
+        sorted(signal_files)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 8])
+def test_prefetch(signal_files, workers):
+    loaded = list(batch.prefetch(signal_files, workers))
+    assert [file_path for file_path, _ in loaded] == signal_files
+    for index, (_, (signal, metadata)) in enumerate(loaded):
+        assert np.all(signal.ordinate == index)
+        assert metadata.name == f"Signal {index}"
+
+
+def test_prefetch_error(signal_files, tmp_path):
+    file_paths = [signal_files[0], str(tmp_path / "missing.mcas")]
+    loaded = batch.prefetch(file_paths)
+    next(loaded)
+    with pytest.raises(exceptions.DataLoadingError):
+        next(loaded)
+
+
+def test_result_path():
+    assert batch.result_path(os.path.join("out", "result.mcas"), "a") == \
+        os.path.join("out", "result_a.mcas")
+
+
+def test_item_names(tmp_path):
+    file_paths = [str(tmp_path / "run1" / "data.mcas"),
+                  str(tmp_path / "run2" / "data.mcas")]
+    assert batch.item_names(file_paths) == ["run1_data", "run2_data"]
+    file_paths = [str(tmp_path / "a.mcas"), str(tmp_path / "a.npz"),
+                  str(tmp_path / "b.mcas")]
+    assert batch.item_names(file_paths) == ["a_mcas", "a_npz", "b"]
+    file_paths = [str(tmp_path / "a_b.mcas"), str(tmp_path / "a" / "b.mcas")]
+    assert batch.item_names(file_paths) == ["a_b", "a_b_1"]
+    assert batch.item_names([]) == []
+
+
+def test_batch_loader(signal_files, tmp_path):
+    loader = blocks.BatchLoader()
+    amplifier = blocks.Amplifier()
+    amplifier.parameters["multiplier"].parameters["factor"].value = 2
+    saver = blocks.SignalSaver(file_name=str(tmp_path / "out" /
+                                             "result.mcas"))
+    (tmp_path / "out").mkdir()
+    amplifier.inputs[0].connect(loader.outputs[0])
+    saver.inputs[0].connect(amplifier.outputs[0])
+    loader.parameters["pattern"].value = str(tmp_path / "**" / "*.mcas")
+    loader.parameters["workers"].value = 2
+    loader.run_batch()
+    for index, name in enumerate(["a", "sub_b", "c"]):
+        signal, metadata = signal_file.load_signal(
+            str(tmp_path / "out" / f"result_{name}.mcas"))
+        assert np.all(signal.ordinate == 2 * index)
+    loader.parameters["pattern"].value = str(tmp_path / "*.npz")
+    with pytest.raises(exceptions.DataLoadingError):
+        loader.run_batch()
@@ -545,3 +545,37 @@ def test_output_metadata(default_metadata):
     result_metadata = output.metadata
     assert result_metadata == output_metadata
 
+
+
+def test_output_metadata_cache(default_metadata):
+    output = mca.framework.block_io.Output()
+    output.process_metadata = default_metadata
+    result_metadata = output.metadata
+    assert output.metadata is result_metadata
+    output.user_metadata.name = "test"
+    assert output.metadata.name == "test"
+    result_metadata = output.metadata
+    result_metadata.name = "modified"
+    assert output.metadata.name == "test"
+    output.process_metadata = mca.framework.data_types.MetaData(
+        "", "m", "kg")
+    assert output.metadata.unit_o == output.process_metadata.unit_o
+    output.use_process_ordinate_metadata = False
+    assert output.metadata.unit_o == output.user_metadata.unit_o
+
+
+def test_output_id():
+    output = mca.framework.block_io.Output()
+    assert output.id == output.id
+    assert output.id != mca.framework.block_io.Output().id
+
+
+def test_set_parameters(parameter_block):
+    a = parameter_block()
+    a.set_parameters({"test_parameter": 0.5,
+                      "multiplier": {"factor": 100}})
+    assert a.parameters["test_parameter"].value == 0.5
+    assert a.parameters["multiplier"].parameters["decibel"].value == 20
+    with pytest.raises(exceptions.OutOfBoundError):
+        a.set_parameters({"test_parameter": 1., "test_parameter1": 0})
+    assert a.parameters["test_parameter"].value == 0.5
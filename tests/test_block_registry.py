@@ -30,3 +30,87 @@ def test_remove_block(one_input_block, one_input_one_output_block):
     assert b.inputs[0] not in io_registry.Registry._graph.nodes
     assert b.outputs[0] not in io_registry.Registry._graph.nodes
     assert b not in io_registry.Registry.get_all_blocks()
+
+
+def test_batch(one_output_block, one_input_one_output_block,
+               two_input_one_output_block):
+    io_registry.Registry.clear()
+    a = one_output_block()
+    b = one_input_one_output_block()
+    c = one_input_one_output_block()
+    d = two_input_one_output_block()
+    with io_registry.Registry.batch():
+        a.trigger_update()
+        b.inputs[0].connect(a.outputs[0])
+        c.inputs[0].connect(a.outputs[0])
+        d.inputs[0].connect(b.outputs[0])
+        d.inputs[1].connect(c.outputs[0])
+        assert a.process_count == 0
+        assert d.process_count == 0
+    assert a.process_count == 1
+    assert b.process_count == 1
+    assert c.process_count == 1
+    assert d.process_count == 1
+    assert d.outputs[0].data == 4
+    with io_registry.Registry.batch():
+        with io_registry.Registry.batch():
+            a.outputs[0].disconnect()
+        assert d.process_count == 1
+    assert b.process_count == 2
+    assert c.process_count == 2
+    assert d.process_count == 2
+    assert d.outputs[0].data is None
+    io_registry.Registry.clear()
+
+
+def test_pull_mode(one_output_block, one_input_one_output_block):
+    io_registry.Registry.clear()
+    io_registry.Registry.set_pull_mode(True)
+    a = one_output_block()
+    b = one_input_one_output_block()
+    c = one_input_one_output_block()
+    b.inputs[0].connect(a.outputs[0])
+    c.inputs[0].connect(b.outputs[0])
+    a.trigger_update()
+    assert a.process_count == 0
+    assert c.process_count == 0
+    assert io_registry.Registry.is_outdated(c)
+    io_registry.Registry.pull(b)
+    assert a.process_count == 1
+    assert b.process_count == 1
+    assert c.process_count == 0
+    assert b.outputs[0].data == 2
+    io_registry.Registry.pull(c)
+    io_registry.Registry.pull(c)
+    assert b.process_count == 1
+    assert c.process_count == 1
+    assert c.outputs[0].data == 3
+    a.trigger_update()
+    assert c.process_count == 1
+    io_registry.Registry.set_pull_mode(False)
+    assert a.process_count == 2
+    assert b.process_count == 2
+    assert c.process_count == 2
+    assert not io_registry.Registry.is_outdated(c)
+    io_registry.Registry.clear()
+
+
+def test_pull_mode_paths_of_different_lengths(
+        one_output_block, one_input_one_output_block,
+        two_input_one_output_block):
+    io_registry.Registry.clear()
+    io_registry.Registry.set_pull_mode(True)
+    b = two_input_one_output_block()
+    c = one_output_block()
+    s = one_output_block()
+    a = one_input_one_output_block()
+    b.inputs[0].connect(c.outputs[0])
+    a.inputs[0].connect(s.outputs[0])
+    b.inputs[1].connect(a.outputs[0])
+    c.trigger_update()
+    s.trigger_update()
+    io_registry.Registry.set_pull_mode(False)
+    assert a.outputs[0].data == 2
+    assert b.outputs[0].data == 3
+    assert not io_registry.Registry.is_outdated(b)
+    io_registry.Registry.clear()
@@ -7,8 +7,8 @@ import numpy as np
 @pytest.mark.parametrize("test_input", [-5, 1, np.arange(-1, 10)])
 def test_absolute(test_input, test_output_block, default_metadata):
     a = absolute.Absolute()
-    a.outputs[0].abscissa_metadata = True
-    a.outputs[0].ordinate_metadata = True
+    a.outputs[0].use_process_abscissa_metadata = True
+    a.outputs[0].use_process_ordinate_metadata = True
     b = test_output_block(data_types.Signal(None, None, None, test_input))
     a.inputs[0].connect(b.outputs[0])
     assert a.outputs[0].metadata == default_metadata
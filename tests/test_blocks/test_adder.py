@@ -14,8 +14,11 @@ expected_signal0 = data_types.Signal(-2, 25, 0.1, expected_ordinate0)
 expected_ordinate1 = np.full((15,), 1)
 expected_ordinate1[10:15] = np.full((5,), 2)
 expected_signal1 = data_types.Signal(-1, 15, 0.1, expected_ordinate1)
+
+expected_signal2 = data_types.Signal(0, 5, 0.1, np.full((5,), 2))
 test_cases = [((test_signal0, test_signal1), expected_signal0),
-              ((test_signal0, test_signal2), expected_signal1)]
+              ((test_signal0, test_signal2), expected_signal1),
+              ((test_signal0, test_signal0), expected_signal2)]
 
 
 @pytest.mark.parametrize("test_input, expected_signal", test_cases)
@@ -25,7 +28,4 @@ def test_adder(test_input, expected_signal, test_output_block):
     a.inputs[0].connect(b.outputs[0])
     c = test_output_block(test_input[1])
     a.inputs[1].connect(c.outputs[0])
-    if test_input[1] == test_signal1:
-        assert a.outputs[0].data == expected_signal
-    if test_input[1] == test_signal2:
-        assert a.outputs[0].data == expected_signal
+    assert a.outputs[0].data == expected_signal
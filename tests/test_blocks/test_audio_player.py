@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+import sounddevice as sd
+
+from mca.blocks import audio_player
+
+
+class DummyStream:
+    """Output stream which records the played frames."""
+    def __init__(self, samplerate, channels, dtype, blocksize, callback):
+        self.channels = channels
+        self.callback = callback
+        self.played = []
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+    def play(self, frames):
+        outdata = np.full((frames, self.channels), np.nan, dtype=np.float32)
+        try:
+            self.callback(outdata, frames, None, None)
+        except sd.CallbackStop:
+            return False
+        finally:
+            self.played.append(outdata)
+        return True
+
+
+def test_playback():
+    left = np.arange(10.)
+    right = -np.arange(7.)
+    playback = audio_player.SignalPlayback([left, right], 10, scale=0.5,
+                                           stream_class=DummyStream)
+    playback.start()
+    stream = playback.stream
+    assert stream.play(4)
+    assert stream.play(4)
+    assert not stream.play(4)
+    played = np.concatenate(stream.played)
+    assert np.array_equal(played[:10, 0], left / 2)
+    assert np.array_equal(played[:7, 1], right / 2)
+    assert not np.any(played[7:, 1])
+    assert not np.any(played[10:, 0])
+    playback.seek(0.5)
+    assert playback.position == 5
+    playback.stop()
+    assert playback.stream is None
+
+
+def test_peak_value():
+    ordinate = np.sin(np.linspace(0, 100, 300000))
+    ordinate[1234] = -3
+    assert audio_player.peak_value(ordinate) == 3
@@ -0,0 +1,19 @@
+import numpy as np
+
+from mca.blocks import complex_plot
+from mca.framework import generators
+
+
+def test_decompose():
+    rng = np.random.default_rng(0)
+    values = 2 * generators.CHUNK_SIZE + 5
+    ordinate = rng.standard_normal(values) + 1j * rng.standard_normal(values)
+    absolute, phase = complex_plot.decompose(ordinate, "abs_phase")
+    assert np.allclose(absolute, np.abs(ordinate))
+    assert np.allclose(phase, np.angle(ordinate))
+    real, imag = complex_plot.decompose(ordinate, "real_imag")
+    assert np.shares_memory(real, ordinate)
+    assert np.array_equal(imag, ordinate.imag)
+    absolute, phase = complex_plot.decompose(np.array([-1., 2.]), "abs_phase")
+    assert np.allclose(absolute, [1, 2])
+    assert np.allclose(phase, [np.pi, 0])
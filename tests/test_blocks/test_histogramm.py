@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from mca.blocks import histogramm
+from mca.framework import data_types
+
+test_signal = data_types.Signal(0, 6, 1, np.array([0, 1, 1, 2, 2, 2]))
+
+
+@pytest.mark.parametrize("plot_type, expected_ordinate", [
+    ("absolute", [1, 2, 3]),
+    ("relative", [1 / 6, 2 / 6, 3 / 6]),
+    ("density", [1 / 6 * 1.5, 2 / 6 * 1.5, 3 / 6 * 1.5])])
+def test_counts_output(plot_type, expected_ordinate, test_output_block):
+    a = histogramm.Histogramm(plot_type=plot_type, bins=3)
+    b = test_output_block(test_signal)
+    a.inputs[0].connect(b.outputs[0])
+    expected_signal = data_types.Signal(1 / 3, 3, 2 / 3,
+                                        np.array(expected_ordinate))
+    assert a.outputs[0].data == expected_signal
+    b.outputs[0].disconnect()
+    assert a.outputs[0].data is None
@@ -0,0 +1,25 @@
+import pytest
+from mca.blocks import multiplier
+from mca.framework import data_types
+import numpy as np
+
+test_signal0 = data_types.Signal(0, 5, 0.1, np.full((5,), 2))
+test_signal1 = data_types.Signal(-1, 15, 0.1, np.full((15,), 3))
+test_signal2 = data_types.Signal(0, 5, 0.1, np.arange(5))
+
+expected_ordinate0 = np.zeros(15)
+expected_ordinate0[10:15] = np.full((5,), 6)
+expected_signal0 = data_types.Signal(-1, 15, 0.1, expected_ordinate0)
+expected_signal1 = data_types.Signal(0, 5, 0.1, 2 * np.arange(5))
+test_cases = [((test_signal0, test_signal1), expected_signal0),
+              ((test_signal0, test_signal2), expected_signal1)]
+
+
+@pytest.mark.parametrize("test_input, expected_signal", test_cases)
+def test_multiplier(test_input, expected_signal, test_output_block):
+    a = multiplier.Multiplier()
+    b = test_output_block(test_input[0])
+    a.inputs[0].connect(b.outputs[0])
+    c = test_output_block(test_input[1])
+    a.inputs[1].connect(c.outputs[0])
+    assert a.outputs[0].data == expected_signal
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from mca import exceptions
+from mca.blocks import quantization
+from mca.framework import data_types
+
+test_signal = data_types.Signal(0, 5, 1, np.array([-2, -1, 0, 0.5, 2]))
+
+
+@pytest.mark.parametrize("signed, raw, expected_ordinate", [
+    (True, True, [0, 0, 2, 2, 3]),
+    (False, True, [0, 0, 0, 2, 3]),
+    (True, False, [-1, -1, 0, 0, 0.5]),
+    (False, False, [0, 0, 0, 0.5, 0.75])])
+def test_quantization(signed, raw, expected_ordinate, test_output_block):
+    a = quantization.Quantization(bits=2, max_value=1, signed=signed,
+                                  raw=raw)
+    b = test_output_block(test_signal)
+    a.inputs[0].connect(b.outputs[0])
+    assert np.allclose(a.outputs[0].data.ordinate, expected_ordinate)
+
+
+@pytest.mark.parametrize("bits, dtype", [(8, np.uint8), (12, np.uint16),
+                                         (20, np.uint32)])
+def test_raw_dtype(bits, dtype, test_output_block):
+    a = quantization.Quantization(bits=bits, raw=True, raw_dtype="uint")
+    b = test_output_block(test_signal)
+    a.inputs[0].connect(b.outputs[0])
+    ordinate = a.outputs[0].data.ordinate
+    assert ordinate.dtype == dtype
+    assert ordinate[0] == 0
+    assert ordinate[-1] == 2 ** bits - 1
+
+
+def test_bits_bounds(test_output_block):
+    with pytest.raises(exceptions.OutOfBoundError):
+        quantization.Quantization(bits=65)
+    a = quantization.Quantization(bits=64, raw=True, raw_dtype="uint")
+    b = test_output_block(test_signal)
+    with pytest.raises(exceptions.ParameterValueError):
+        a.inputs[0].connect(b.outputs[0])
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from mca.blocks import signal_generator_stochastic
+
+
+@pytest.mark.parametrize("dist", ["normal", "uniform", "exponential",
+                                  "pink", "brown"])
+def test_moments(dist):
+    a = signal_generator_stochastic.SignalGeneratorStochastic(
+        dist=dist, mean=2, std_dev=3, abscissa={"values": 100000})
+    a.trigger_update()
+    ordinate = a.outputs[0].data.ordinate
+    assert len(ordinate) == 100000
+    assert np.isclose(np.std(ordinate), 3, rtol=0.05)
+    if dist not in ("pink", "brown"):
+        assert np.isclose(np.mean(ordinate), 2, atol=0.05)
+
+
+def test_poisson():
+    a = signal_generator_stochastic.SignalGeneratorStochastic(
+        dist="poisson", mean=4, abscissa={"values": 100000})
+    a.trigger_update()
+    ordinate = a.outputs[0].data.ordinate
+    assert np.all(ordinate == np.round(ordinate))
+    assert np.isclose(np.mean(ordinate), 4, rtol=0.05)
+    assert np.isclose(np.var(ordinate), 4, rtol=0.05)
+
+
+def test_seed():
+    a = signal_generator_stochastic.SignalGeneratorStochastic(seed=5)
+    b = signal_generator_stochastic.SignalGeneratorStochastic(seed=5)
+    a.trigger_update()
+    b.trigger_update()
+    ordinate = a.outputs[0].data.ordinate.copy()
+    assert np.array_equal(ordinate, b.outputs[0].data.ordinate)
+    a.trigger_update()
+    assert np.array_equal(ordinate, a.outputs[0].data.ordinate)
+    b.parameters["seed"].value = 6
+    b.trigger_update()
+    assert not np.array_equal(ordinate, b.outputs[0].data.ordinate)
@@ -0,0 +1,29 @@
+import numpy as np
+
+from mca.blocks import xy_plot
+
+
+def test_density():
+    abscissa = np.random.default_rng(0).random(200000)
+    ordinate = abscissa ** 2
+    counts, limits = xy_plot.density(abscissa, ordinate, (30, 20))
+    expected = np.histogram2d(abscissa, ordinate, bins=(30, 20))[0]
+    assert counts.shape == (30, 20)
+    assert np.array_equal(counts, expected)
+    assert limits == (abscissa.min(), abscissa.max(), ordinate.min(),
+                      ordinate.max())
+    counts, limits = xy_plot.density(np.ones(5), np.zeros(5), (3, 3))
+    assert counts[1, 1] == 5
+    assert limits == (0.5, 1.5, -0.5, 0.5)
+
+
+def test_density_non_finite():
+    abscissa = np.array([0., 1., np.nan, np.inf, 2.])
+    ordinate = np.array([0., 1., 5., 5., -np.inf])
+    counts, limits = xy_plot.density(abscissa, ordinate, (2, 2))
+    assert counts.sum() == 2
+    assert limits == (0., 1., 0., 1.)
+    for values in (np.array([]), np.full(3, np.nan)):
+        counts, limits = xy_plot.density(values, values, (2, 2))
+        assert not counts.any()
+        assert np.all(np.isfinite(limits))
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from scipy import signal as sgn
+
+from mca.framework import generators
+
+
+@pytest.mark.parametrize("values", [1, 1000, 3 * 17 + 5])
+def test_generate(values):
+    abscissa = -2 + np.arange(values) * 0.01
+    ordinate = generators.generate(generators.sine_kernel(2, 3, 0.5), -2,
+                                   values, 0.01, chunk_size=17)
+    assert np.allclose(ordinate, 2 * np.sin(2 * np.pi * 3 * abscissa - 0.5))
+    ordinate = generators.generate(generators.rect_kernel(2, 3, 0.5), -2,
+                                   values, 0.01, chunk_size=17)
+    assert np.allclose(ordinate,
+                       2 * np.sign(np.sin(2 * np.pi * 3 * abscissa - 0.5)))
+    ordinate = generators.generate(generators.triangle_kernel(2, 3, 0.5), -2,
+                                   values, 0.01, chunk_size=17)
+    assert np.allclose(ordinate, 2 * sgn.sawtooth(
+        2 * np.pi * 3 * abscissa - 0.5 + np.pi / 2, 0.5))
+    real, imag, envelope = generators.generate(
+        generators.gauss_pulse_kernel(2, 1, 0.5, -6), -2, values, 0.01,
+        outputs=3, chunk_size=17)
+    expected = sgn.gausspulse(abscissa, fc=1, bw=0.5, bwr=-6, retquad=True,
+                              retenv=True)
+    assert np.allclose(real, 2 * expected[0])
+    assert np.allclose(imag, 2 * expected[1])
+    assert np.allclose(envelope, 2 * expected[2])
+
+
+@pytest.mark.parametrize("lower, upper, expected", [
+    (-0.5, 0.5, (450, 550)),
+    (-10, 10, (0, 1000)),
+    (20, 30, (1000, 1000)),
+    (0.3, 0.3, (531, 531))])
+def test_index_range(lower, upper, expected):
+    assert generators.index_range(-5, 1000, 0.01, lower, upper) == expected
+    abscissa = -5 + np.arange(1000) * 0.01
+    mask = np.logical_and(lower <= abscissa, abscissa < upper)
+    start, stop = expected
+    assert np.sum(mask) == stop - start
@@ -15,7 +15,7 @@ def adder_signal_generator():
     b = blocks.SignalGeneratorPeriodic(name="test", amp=3,
                                        abscissa={"values": 100, "start": 1})
     b.outputs[0].user_metadata.name = "test1"
-    a.outputs[0].abscissa_metadata = True
+    a.outputs[0].use_process_abscissa_metadata = True
     a.add_input(block_io.Input(a))
     a.inputs[2].connect(b.outputs[0])
     yield
@@ -41,3 +41,27 @@ def test_load_block_structure(adder_signal_generator):
             assert block.outputs[0].metadata.name == "test1"
     with pytest.raises(exceptions.DataLoadingError):
         load.load_block_structure(file_path)
+
+
+def test_load_block_structure_updates(adder_signal_generator):
+    adder_signal_generator
+    save.save_block_structure(file_path)
+    io_registry.Registry.clear()
+    saved_blocks = load.load_block_structure(file_path)
+    for block in saved_blocks:
+        if isinstance(block, blocks.Adder):
+            generator_signal = block.inputs[2].connected_output.data
+            assert generator_signal is not None
+            assert block.outputs[0].data == generator_signal
+
+
+def test_json_to_blocks_copy():
+    io_registry.Registry.clear()
+    block = blocks.SignalGeneratorStochastic(seed=5, mean=2)
+    json_string = save.blocks_to_json([block])
+    loaded_block, = load.json_to_blocks(json_string)
+    assert loaded_block.parameters["seed"].value == 5
+    copied_block, = load.json_to_blocks(json_string, copy=True)
+    assert copied_block.parameters["seed"].value != 5
+    assert copied_block.parameters["mean"].value == 2
+    io_registry.Registry.clear()
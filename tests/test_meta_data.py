@@ -103,3 +103,15 @@ test_cases_metadata_unequal = [
     test_cases_metadata_unequal)
 def test_metadata_unequal(first_meta_object, second_meta_object):
     assert first_meta_object != second_meta_object
+
+
+def test_unit_operations():
+    unit_v = data_types.string_to_unit("V")
+    unit_s = data_types.string_to_unit("s")
+    assert data_types.string_to_unit("V") is unit_v
+    assert data_types.multiply_units(unit_v, unit_s) == unit_v * unit_s
+    assert data_types.multiply_units(unit_v, unit_s) is \
+        data_types.multiply_units(unit_v, unit_s)
+    assert data_types.divide_units(1, unit_s) == 1 / unit_s
+    assert data_types.divide_units(unit_v, unit_s) == unit_v / unit_s
+    assert data_types.power_unit(unit_v, 2) == unit_v ** 2
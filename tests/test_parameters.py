@@ -195,3 +195,68 @@ def test_parameter_block_2():
     e.conversion_index = 3
     with pytest.raises(exceptions.ParameterTypeError):
         a.value = 3
+
+
+def test_version():
+    a = pm.IntParameter("Test", default=2)
+    b = pm.FloatParameter("Test", default=2.)
+    assert a.version == 0
+    assert b.version == 0
+    a.value = 3
+    b.value = 3.
+    assert a.version == 1
+    assert b.version == 1
+
+
+def test_parameters_version():
+    a = pm.IntParameter("Test", default=2)
+    b = pm.FloatParameter("Test", default=2.)
+    block = pm.ParameterBlock(name="Test", parameters={"b": b})
+    version = pm.parameters_version({"a": a, "block": block})
+    b.value = 3.
+    assert pm.parameters_version({"a": a, "block": block}) > version
+
+
+def test_set_values():
+    a = pm.FloatParameter("a", default=1.)
+    b = pm.FloatParameter("b", default=2., max_=10)
+    c = pm.FloatParameter("c", default=3.)
+    conversions = []
+
+    def a_b_to_c():
+        conversions.append(None)
+        c.value = a.value + b.value
+
+    conversion = pm.ParameterConversion([a, b], [c], a_b_to_c)
+    block = pm.ParameterBlock(name="Test", parameters={"a": a, "b": b,
+                                                       "c": c},
+                              param_conversions=[conversion],
+                              default_conversion=0)
+    d = pm.IntParameter("d", default=0)
+    parameters_ = {"block": block, "d": d}
+    # The conversion is executed once
+    pm.set_values(parameters_, {"block": {"a": 4., "b": 5.}, "d": 2})
+    assert len(conversions) == 1
+    assert c.value == 9.
+    assert d.value == 2
+    # Given values of other parameters are kept
+    block.set_values({"a": 1., "c": 0.})
+    assert len(conversions) == 2
+    assert c.value == 0.
+    # Either all or no values are assigned
+    with pytest.raises(exceptions.OutOfBoundError):
+        pm.set_values(parameters_, {"d": 3, "block": {"b": 11.}})
+    assert d.value == 2
+    assert b.value == 5.
+
+
+def test_set_values_int_from_float():
+    d = pm.IntParameter("d", default=0)
+    block = pm.ParameterBlock(name="Test", parameters={"d": d})
+    pm.set_values({"d": d}, {"d": 3.})
+    assert d.value == 3
+    assert isinstance(d.value, int)
+    block.set_values({"d": 4.})
+    assert isinstance(d.value, int)
+    with pytest.raises(exceptions.ParameterTypeError):
+        pm.set_values({"d": d}, {"d": 3.5})
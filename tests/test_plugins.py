@@ -0,0 +1,78 @@
+import importlib.metadata
+import sys
+
+import pytest
+
+from mca import blocks, exceptions
+from mca.framework import block_registry
+
+plugin_source = '''
+from mca.framework import Block
+
+
+class PluginBlock(Block):
+    name = "Plugin Block"
+    description = "Block of a plugin."
+    tags = ("Plugin",)
+
+    def setup_io(self):
+        self.new_output()
+
+    def setup_parameters(self):
+        pass
+
+    def process(self):
+        pass
+'''
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    (tmp_path / "mca_test_plugin.py").write_text(plugin_source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    entry_point = importlib.metadata.EntryPoint(
+        name="plugin_block", value="mca_test_plugin:PluginBlock",
+        group=block_registry.entry_point_group)
+    monkeypatch.setattr(block_registry, "plugin_entry_points",
+                        lambda: [entry_point])
+    yield
+    sys.modules.pop("mca_test_plugin", None)
+
+
+def test_built_in_blocks(tmp_path):
+    registry = block_registry.BlockRegistry(str(tmp_path / "manifest.json"))
+    spec = registry.get_spec(str(blocks.Adder))
+    assert spec.class_path == "mca.blocks.adder:Adder"
+    assert spec.load() is blocks.Adder
+    assert spec in registry.tag_dict()["Processing"]
+    assert len(registry.block_specs()) == len(blocks.block_classes)
+    with pytest.raises(exceptions.DataLoadingError):
+        registry.get_spec("<class 'mca.blocks.missing.Missing'>")
+
+
+def test_plugin_blocks(plugin, tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    # The plugin is imported once to create the manifest
+    registry = block_registry.BlockRegistry(manifest_path)
+    assert "Plugin" in registry.tag_dict()
+    sys.modules.pop("mca_test_plugin")
+    # Afterwards it is only imported when a block is created
+    registry = block_registry.BlockRegistry(manifest_path)
+    spec = registry.get_spec("<class 'mca_test_plugin.PluginBlock'>")
+    assert spec.name == "Plugin Block"
+    assert spec.tags == ("Plugin",)
+    assert "mca_test_plugin" not in sys.modules
+    block = spec()
+    assert "mca_test_plugin" in sys.modules
+    assert str(type(block)) == spec.class_string
+    block.delete()
+
+
+def test_broken_plugin(plugin, tmp_path, monkeypatch):
+    entry_point = importlib.metadata.EntryPoint(
+        name="broken", value="mca_test_plugin:Missing",
+        group=block_registry.entry_point_group)
+    monkeypatch.setattr(block_registry, "plugin_entry_points",
+                        lambda: [entry_point])
+    registry = block_registry.BlockRegistry(str(tmp_path / "manifest.json"))
+    assert len(registry.block_specs()) == len(blocks.block_classes)
@@ -0,0 +1,66 @@
+import json
+import os
+
+import numpy as np
+
+from mca.framework import io_registry, profiler, data_types
+
+
+file_path = os.path.dirname(os.path.realpath(__file__)) + "/trace.json"
+
+
+def test_profiler_disabled(one_output_block):
+    profiler.Profiler.reset()
+    a = one_output_block()
+    a.trigger_update()
+    assert a.process_count == 1
+    assert a not in profiler.Profiler.statistics
+    io_registry.Registry.clear()
+
+
+def test_profiler(one_output_block, one_input_block, test_output_block):
+    profiler.Profiler.reset()
+    profiler.Profiler.enable()
+    version = profiler.Profiler.version
+    try:
+        a = one_output_block()
+        b = one_input_block()
+        b.inputs[0].connect(a.outputs[0])
+        a.trigger_update()
+        c = test_output_block(data_types.Signal(0, 10, 1, np.zeros(10)))
+        c.trigger_update()
+    finally:
+        profiler.Profiler.disable()
+    assert profiler.Profiler.version > version
+    assert profiler.Profiler.block_statistics(a).calls == 1
+    assert profiler.Profiler.block_statistics(b).calls == 2
+    assert profiler.Profiler.block_statistics(c).output_bytes == 80
+    assert 0 <= profiler.Profiler.relative_cost(b) <= 1
+    assert len(profiler.Profiler.summary()) == 3
+    profiler.Profiler.export_trace(file_path)
+    with open(file_path, "r") as trace_file:
+        trace = json.load(trace_file)
+    os.remove(file_path)
+    names = [event["name"] for event in trace["traceEvents"]]
+    assert "OneOutputBlock" in names
+    assert "invalidate_and_update" in names
+    profiler.Profiler.reset()
+    io_registry.Registry.clear()
+
+
+def test_span_disabled():
+    profiler.Profiler.reset()
+    assert profiler.Profiler.span("a") is profiler.Profiler.span("b")
+    with profiler.Profiler.span("a"):
+        pass
+    assert not profiler.Profiler.trace_events
+
+
+def test_max_events():
+    block_profiler = profiler.BlockProfiler(max_events=3)
+    block_profiler.enable()
+    for name in "abcde":
+        with block_profiler.span(name):
+            pass
+    assert [event["name"] for event in block_profiler.trace_events] == \
+        ["c", "d", "e"]
@@ -16,7 +16,7 @@ def adder_signal_generator():
     b = blocks.SignalGeneratorPeriodic(name="test", amp=3,
                                        abscissa={"values": 100, "start": 1})
     b.outputs[0].metadata.name = "test1"
-    a.outputs[0].abscissa_metadata = True
+    a.outputs[0].use_process_abscissa_metadata = True
     a.add_input(block_io.Input(a))
     a.inputs[2].connect(b.outputs[0])
     yield
@@ -41,4 +41,29 @@ def test_save_block_structure(adder_signal_generator):
             assert block_save["class"]["parameters"]["amp"] == 3
             assert block_save["class"]["parameters"]["abscissa"]["start"] == 1
             assert block_save["class"]["parameters"]["abscissa"]["values"] == 100
-            assert block_save["class"]["outputs"][0]["signal_name"] == "test1"
\ No newline at end of file
+            assert block_save["class"]["outputs"][0]["signal_name"] == "test1"
+
+
+def test_structure_fingerprint(adder_signal_generator):
+    adder_signal_generator
+    a, b = io_registry.Registry.get_all_blocks()
+    first_json = save.blocks_to_json([a, b])
+    fingerprint = save.structure_fingerprint()
+    assert save.structure_fingerprint() == fingerprint
+    assert save.blocks_to_json([a, b]) == first_json
+    b.parameters["amp"].value = 2
+    assert save.structure_fingerprint() != fingerprint
+    assert save.blocks_to_json([a, b]) != first_json
+    fingerprint = save.structure_fingerprint()
+    a.inputs[0].connect(b.outputs[0])
+    assert save.structure_fingerprint() != fingerprint
+    save.save_block_structure(file_path)
+
+
+def test_write_block_structure(tmp_path):
+    save_path = str(tmp_path / "structure.json")
+    save.write_block_structure(save_path, "[1]")
+    save.write_block_structure(save_path, "[]")
+    with open(save_path, "r") as save_file:
+        assert save_file.read() == "[]"
+    assert os.listdir(tmp_path) == ["structure.json"]
@@ -0,0 +1,30 @@
+from mca.framework import search
+
+
+def test_grams():
+    assert search.grams("abcd") == {"a", "b", "c", "d", "ab", "bc", "cd",
+                                    "abc", "bcd"}
+
+
+def test_search():
+    index = search.SearchIndex({
+        "fft": [["FFT", "FFT"], ["Transform"], ["Fast Fourier transform"]],
+        "ifft": [["IFFT"], ["Transform"], ["Inverse FFT"]],
+        "adder": [["Adder", "Addierer"], ["Math"], ["Adds the inputs."]],
+        "plot": [["Plot"], ["Plotting"], ["Plots the signal."]],
+    })
+    assert index.search("") == ["fft", "ifft", "adder", "plot"]
+    # Names rank before tags and descriptions, prefixes before infixes
+    assert index.search("ff") == ["fft", "ifft"]
+    assert index.search("FFT") == ["fft", "ifft"]
+    assert index.search("transform") == ["fft", "ifft"]
+    assert index.search("plot") == ["plot"]
+    assert index.search("sig") == ["plot"]
+    assert index.search("the signal") == ["plot"]
+    assert index.search("addier") == ["adder"]
+    assert index.search("xyz") == []
+    # Refining and changing the query
+    assert index.search("t") == ["fft", "ifft", "plot", "adder"]
+    assert index.search("tr") == ["fft", "ifft"]
+    assert index.search("trx") == []
+    assert index.search("ad") == ["adder"]
@@ -0,0 +1,79 @@
+import os
+import stat
+
+import numpy as np
+import pytest
+
+from mca import exceptions
+from mca.framework import data_types, signal_file
+
+
+@pytest.mark.parametrize("ordinate", [np.linspace(-1, 1, 1001),
+                                      np.exp(1j * np.linspace(0, 10, 77)),
+                                      np.arange(5)])
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_save_load(ordinate, compress, memory_map, tmp_path):
+    file_path = str(tmp_path / "test.mcas")
+    signal = data_types.Signal(-1.5, len(ordinate), 0.25, ordinate)
+    metadata = data_types.MetaData("Test", "s", "V", quantity_a="Time",
+                                   symbol_o="U")
+    signal_file.save_signal(file_path, signal, metadata, compress=compress)
+    loaded_signal, loaded_metadata = signal_file.load_signal(
+        file_path, memory_map=memory_map)
+    assert loaded_signal == signal
+    assert loaded_signal.ordinate.dtype == ordinate.dtype
+    assert loaded_metadata.name == "Test"
+    assert loaded_metadata.quantity_a == "Time"
+    assert loaded_metadata.symbol_o == "U"
+    assert loaded_metadata.unit_o == metadata.unit_o
+
+
+def test_single_precision(tmp_path):
+    file_path = str(tmp_path / "test.mcas")
+    ordinate = np.exp(1j * np.linspace(0, 10, 100))
+    signal = data_types.Signal(0, 100, 1, ordinate)
+    metadata = data_types.MetaData("", "s", "V")
+    signal_file.save_signal(file_path, signal, metadata,
+                            single_precision=True)
+    loaded_signal = signal_file.load_signal(file_path, memory_map=True)[0]
+    assert loaded_signal.ordinate.dtype == np.complex64
+    assert np.allclose(loaded_signal.ordinate, ordinate)
+    # Replacing the file keeps no temporary files
+    signal_file.save_signal(file_path, signal, metadata)
+    assert [path.name for path in tmp_path.iterdir()] == ["test.mcas"]
+
+
+def test_numpy_scalars(tmp_path):
+    file_path = str(tmp_path / "test.mcas")
+    signal = data_types.Signal(np.float64(0), np.int64(4), np.float64(0.5),
+                               np.arange(4.))
+    signal_file.save_signal(file_path, signal,
+                            data_types.MetaData("", "s", "V"))
+    assert signal_file.load_signal(file_path)[0] == signal
+
+
+def test_load_errors(tmp_path):
+    with pytest.raises(exceptions.DataLoadingError):
+        signal_file.load_signal(str(tmp_path / "missing.mcas"))
+    file_path = tmp_path / "wrong.mcas"
+    file_path.write_bytes(b"no signal")
+    with pytest.raises(exceptions.DataLoadingError):
+        signal_file.load_signal(str(file_path))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file permissions")
+def test_file_mode(tmp_path):
+    file_path = str(tmp_path / "test.mcas")
+    signal = data_types.Signal(0, 3, 1, np.arange(3.))
+    metadata = data_types.MetaData("test", "s", "V")
+    umask = os.umask(0o022)
+    try:
+        signal_file.save_signal(file_path, signal, metadata)
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o644
+    # The permissions of an existing file are kept
+    os.chmod(file_path, 0o640)
+    signal_file.save_signal(file_path, signal, metadata)
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
@@ -0,0 +1,14 @@
+import numpy as np
+
+from mca.framework import util
+
+
+def test_decimate_min_max():
+    ordinate = np.sin(np.linspace(0, 20, 10007))
+    indices = util.decimate_min_max(ordinate, 100)
+    assert np.all(np.diff(indices) > 0)
+    assert len(indices) == 2 * 100 + 10007 % 100
+    assert ordinate[indices].max() == ordinate.max()
+    assert ordinate[indices].min() == ordinate.min()
+    assert np.array_equal(util.decimate_min_max(ordinate[:150], 100),
+                          np.arange(150))
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+import scipy.io.wavfile
+
+from mca.framework import wav
+
+
+@pytest.mark.parametrize("sample_format, scale, dtype", [
+    ("int16", 2 ** 15 - 1, np.int16),
+    ("int24", 2 ** 23 - 1, np.int32),
+    ("float32", 1, np.float32)])
+def test_write_wav(sample_format, scale, dtype, tmp_path):
+    file_path = str(tmp_path / "test.wav")
+    left = np.sin(np.linspace(0, 100, 1001))
+    right = np.linspace(-1, 1, 500)
+    wav.write_wav(file_path, 8000, [left, right], sample_format,
+                  chunk_size=64)
+    rate, data = scipy.io.wavfile.read(file_path)
+    assert rate == 8000
+    assert data.dtype == dtype
+    assert data.shape == (1001, 2)
+    # scipy returns 24 bit samples in the upper bytes of 32 bit integers
+    if sample_format == "int24":
+        data = data >> 8
+    assert np.allclose(data[:, 0] / scale, left, atol=1 / scale)
+    assert np.allclose(data[:500, 1] / scale, right, atol=1 / scale)
+    assert not np.any(data[500:, 1])
+
+
+def test_dither(tmp_path):
+    file_path = str(tmp_path / "test.wav")
+    ordinate = np.full(10000, 0.25 / (2 ** 15 - 1))
+    wav.write_wav(file_path, 8000, [ordinate], "int16", dither=True)
+    data = scipy.io.wavfile.read(file_path)[1]
+    assert set(np.unique(data)) <= {-1, 0, 1}
+    assert np.isclose(np.mean(data), 0.25, atol=0.05)
+
+
+def test_rf64(tmp_path, monkeypatch):
+    # Pretend that the file exceeds the size limit of RIFF files
+    monkeypatch.setattr(wav, "_max_size", 100)
+    file_path = str(tmp_path / "test.wav")
+    ordinate = np.linspace(-1, 1, 1000)
+    wav.write_wav(file_path, 8000, [ordinate])
+    with open(file_path, "rb") as wav_file:
+        assert wav_file.read(4) == b"RF64"
+    rate, data = scipy.io.wavfile.read(file_path)
+    assert np.allclose(data, ordinate)